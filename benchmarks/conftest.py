@@ -0,0 +1,24 @@
+from benchmarks import corpus
+from findata import utils
+import pytest
+
+try:
+    import pytest_benchmark
+except ImportError:
+    collect_ignore_glob = ["test_*.py"]
+
+
+@pytest.fixture
+def recorded():
+    """
+    Returns a function that calls a loader of benchmarks.corpus against the fixture store and skips the benchmark if the document has not been recorded yet.
+    """
+    def load(loader, *args):
+        try:
+            return loader(*args)
+        except utils.FixtureError:
+            pytest.skip("document has not been recorded, run python -m benchmarks.corpus first")
+
+    utils.enable_fixtures(corpus.FIXTURE_DIRECTORY, mode="replay")
+    yield load
+    utils.disable_fixtures()
@@ -0,0 +1,429 @@
+"""
+Inputs of the parser benchmarks.
+
+Recorded documents are served from the fixture store in tests/fixtures and can be fetched once with
+
+    python -m benchmarks.corpus
+
+Documents for which no stable public example exists (Form 13F, Form 4, N-PORT holdings, XBRL instances) are generated synthetically,
+so that their size can be scaled and the benchmarks do not depend on network access at all.
+"""
+import datetime as dt
+from findata import utils
+from findata.sec import _SECFiling
+from findata.yahoo import YahooReader
+from findata.french import FrenchReader
+from findata.news import EconomistNews
+from pathlib import Path
+import random
+
+FIXTURE_DIRECTORY = Path(__file__).parents[1] / "tests" / "fixtures"
+
+SEC_FILINGS = {
+    "13G": "https://www.sec.gov/Archives/edgar/data/320193/000119312519041014/0001193125-19-041014.txt",
+    "NPORT": "https://www.sec.gov/Archives/edgar/data/930667/000175272422234894/0001752724-22-234894.txt",
+    "NPORT_derivatives": "https://www.sec.gov/Archives/edgar/data/1444822/000175272422264732/0001752724-22-264732.txt"
+}
+YAHOO_TICKER = "AAPL"
+YAHOO_PERIOD = (dt.date(2000, 1, 1), dt.date(2024, 1, 1))
+FRENCH_DATASET = "F-F_Research_Data_5_Factors_2x3_daily"
+ECONOMIST_SECTION = ("Finance & Economics", "2024-01-01")
+
+
+def sec_filing(name: str) -> str:
+    return _SECFiling._from_url(SEC_FILINGS[name])
+
+
+def yahoo_chart():
+    reader = YahooReader(YAHOO_TICKER)
+    return utils.get(
+        url=reader._price_url.format(YAHOO_TICKER),
+        params=reader._historical_data_parameters("1d", *YAHOO_PERIOD),
+        headers=utils.YAHOO_HEADERS
+    )
+
+
+def french_zip() -> bytes:
+    return utils.get(url=FrenchReader._dataset_url.format(FRENCH_DATASET), headers=utils.HEADERS).content
+
+
+def economist_articles() -> list:
+    section, start = ECONOMIST_SECTION
+    return EconomistNews.articles(section, start=start)
+
+
+def record() -> None:
+    """
+    Fetches all recorded documents that are not yet in the fixture store.
+    """
+    utils.enable_fixtures(FIXTURE_DIRECTORY, mode="once")
+    try:
+        for name in SEC_FILINGS:
+            sec_filing(name)
+        yahoo_chart()
+        french_zip()
+        economist_articles()
+    finally:
+        utils.disable_fixtures()
+
+
+_HEADER = """<SEC-DOCUMENT>0000000000-24-{accession:06d}.txt : 20240214
+<SEC-HEADER>0000000000-24-{accession:06d}.hdr.sgml : 20240214
+ACCESSION NUMBER:\t\t0000000000-24-{accession:06d}
+CONFORMED SUBMISSION TYPE:\t{form_type}
+PUBLIC DOCUMENT COUNT:\t\t2
+CONFORMED PERIOD OF REPORT:\t20231231
+FILED AS OF DATE:\t\t20240214
+DATE AS OF CHANGE:\t\t20240214
+{entities}</SEC-HEADER>
+"""
+
+_ENTITY = """
+{role}:
+
+\tCOMPANY DATA:\t
+\t\tCOMPANY CONFORMED NAME:\t\t\t{name}
+\t\tCENTRAL INDEX KEY:\t\t\t{cik:010d}
+\t\tSTANDARD INDUSTRIAL CLASSIFICATION:\tSERVICES-PREPACKAGED SOFTWARE [7372]
+\t\tIRS NUMBER:\t\t\t\t123456789
+\t\tSTATE OF INCORPORATION:\t\t\tDE
+\t\tFISCAL YEAR END:\t\t\t1231
+
+\tFILING VALUES:
+\t\tFORM TYPE:\t\t{form_type}
+\t\tSEC FILE NUMBER:\t028-{cik:05d}
+\t\tFILM NUMBER:\t\t24000000
+
+\tBUSINESS ADDRESS:\t
+\t\tSTREET 1:\t\t1 MAIN STREET
+\t\tCITY:\t\t\tNEW YORK
+\t\tSTATE:\t\t\tNY
+\t\tZIP:\t\t\t10001
+\t\tBUSINESS PHONE:\t\t2125550100
+
+\tMAIL ADDRESS:\t
+\t\tSTREET 1:\t\t1 MAIN STREET
+\t\tCITY:\t\t\tNEW YORK
+\t\tSTATE:\t\t\tNY
+\t\tZIP:\t\t\t10001
+"""
+
+
+def _header(form_type: str, roles: list, seed: int) -> str:
+    entities = "".join(
+        _ENTITY.format(role=role, name=f"ENTITY {index} INC", cik=seed + index, form_type=form_type)
+        for index, role in enumerate(roles)
+    )
+    return _HEADER.format(accession=seed, form_type=form_type, entities=entities)
+
+
+def synthetic_header(filers: int = 20) -> str:
+    """
+    Returns a filing that only consists of a header with the given number of filer sections.
+    """
+    return _header("SC 13G", ["FILER"] * filers + ["SUBJECT COMPANY"], seed=1) + "<DOCUMENT>\n<TYPE>SC 13G\n</DOCUMENT>\n</SEC-DOCUMENT>\n"
+
+
+def synthetic_13f(holdings: int = 5_000, seed: int = 0) -> str:
+    """
+    Returns a Form 13F-HR filing with the given number of information table entries.
+    About every third entry repeats an earlier security for a different manager, as in the filings of large asset managers.
+    """
+    rng = random.Random(seed)
+    securities = [
+        (f"ISSUER {index} CORP", "COM" if index % 5 else "CL A", f"{rng.randrange(10**8):08d}{index % 10}", None if index % 7 else "Put")
+        for index in range(max(1, holdings * 2 // 3))
+    ]
+    entries = []
+    for index in range(holdings):
+        name, title, cusip, option = securities[index] if index < len(securities) else rng.choice(securities)
+        amount = rng.randrange(1, 10**7)
+        entries.append(
+            "<infoTable>"
+            f"<nameOfIssuer>{name}</nameOfIssuer>"
+            f"<titleOfClass>{title}</titleOfClass>"
+            f"<cusip>{cusip}</cusip>"
+            f"<value>{amount * rng.randrange(1, 500)}</value>"
+            f"<shrsOrPrnAmt><sshPrnamt>{amount}</sshPrnamt><sshPrnamtType>SH</sshPrnamtType></shrsOrPrnAmt>"
+            + (f"<putCall>{option}</putCall>" if option is not None else "")
+            + "<investmentDiscretion>DFND</investmentDiscretion>"
+            f"<otherManager>{rng.randrange(1, 4)}</otherManager>"
+            f"<votingAuthority><Sole>{amount}</Sole><Shared>0</Shared><None>0</None></votingAuthority>"
+            "</infoTable>"
+        )
+    primary_document = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<edgarSubmission xmlns="http://www.sec.gov/edgar/thirteenffiler">'
+        "<formData>"
+        "<coverPage><reportCalendarOrQuarter>12-31-2023</reportCalendarOrQuarter><reportType>13F HOLDINGS REPORT</reportType></coverPage>"
+        "<signatureBlock><name>JOHN DOE</name><title>CCO</title><phone>212-555-0100</phone><city>NEW YORK</city>"
+        "<stateOrCountry>NY</stateOrCountry><signatureDate>02-14-2024</signatureDate></signatureBlock>"
+        f"<summaryPage><otherIncludedManagersCount>0</otherIncludedManagersCount><tableEntryTotal>{holdings}</tableEntryTotal>"
+        "<tableValueTotal>1000000</tableValueTotal><isConfidentialOmitted>false</isConfidentialOmitted></summaryPage>"
+        "</formData>"
+        "</edgarSubmission>"
+    )
+    information_table = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<informationTable xmlns="http://www.sec.gov/edgar/document/thirteenf/informationtable">'
+        + "\n".join(entries)
+        + "</informationTable>"
+    )
+    return (
+        _header("13F-HR", ["FILER"], seed=13)
+        + f"<DOCUMENT>\n<TYPE>13F-HR\n<SEQUENCE>1\n<FILENAME>primary_doc.xml\n<TEXT>\n<XML>\n{primary_document}\n</XML>\n</TEXT>\n</DOCUMENT>\n"
+        + f"<DOCUMENT>\n<TYPE>INFORMATION TABLE\n<SEQUENCE>2\n<FILENAME>infotable.xml\n<TEXT>\n<XML>\n{information_table}\n</XML>\n</TEXT>\n</DOCUMENT>\n"
+        + "</SEC-DOCUMENT>\n"
+    )
+
+
+def synthetic_form4(transactions: int = 200, seed: int = 0) -> str:
+    """
+    Returns a Form 4 filing with the given number of non-derivative transactions.
+    """
+    rng = random.Random(seed)
+    entries = []
+    for _ in range(transactions):
+        shares = rng.randrange(1, 10**6)
+        entries.append(
+            "<nonDerivativeTransaction>"
+            "<securityTitle><value>Common Stock</value></securityTitle>"
+            "<transactionDate><value>2024-02-12</value></transactionDate>"
+            f"<transactionCoding><transactionFormType>4</transactionFormType><transactionCode>{rng.choice('PSA')}</transactionCode>"
+            "<equitySwapInvolved>0</equitySwapInvolved><footnoteId id=\"F1\"/></transactionCoding>"
+            f"<transactionAmounts><transactionShares><value>{shares}</value></transactionShares>"
+            f"<transactionPricePerShare><value>{rng.uniform(1, 500):.2f}</value></transactionPricePerShare>"
+            f"<transactionAcquiredDisposedCode><value>{rng.choice('AD')}</value></transactionAcquiredDisposedCode></transactionAmounts>"
+            f"<postTransactionAmounts><sharesOwnedFollowingTransaction><value>{shares * 2}</value></sharesOwnedFollowingTransaction></postTransactionAmounts>"
+            "<ownershipNature><directOrIndirectOwnership><value>D</value></directOrIndirectOwnership></ownershipNature>"
+            "</nonDerivativeTransaction>"
+        )
+    document = (
+        '<?xml version="1.0"?>\n'
+        "<ownershipDocument>"
+        "<schemaVersion>X0508</schemaVersion><documentType>4</documentType><periodOfReport>2024-02-12</periodOfReport>"
+        "<issuer><issuerCik>0000000100</issuerCik><issuerName>ISSUER INC</issuerName><issuerTradingSymbol>ISS</issuerTradingSymbol></issuer>"
+        "<reportingOwner><reportingOwnerId><rptOwnerCik>0000000101</rptOwnerCik><rptOwnerName>DOE JOHN</rptOwnerName></reportingOwnerId>"
+        "<reportingOwnerRelationship><isDirector>1</isDirector><isOfficer>1</isOfficer><officerTitle>CEO</officerTitle></reportingOwnerRelationship></reportingOwner>"
+        f"<nonDerivativeTable>{''.join(entries)}</nonDerivativeTable>"
+        "<footnotes><footnote id=\"F1\">Weighted average price.</footnote></footnotes>"
+        "<ownerSignature><signatureName>John Doe</signatureName><signatureDate>2024-02-14</signatureDate></ownerSignature>"
+        "</ownershipDocument>"
+    )
+    return (
+        _header("4", ["REPORTING-OWNER", "ISSUER"], seed=4)
+        + f"<DOCUMENT>\n<TYPE>4\n<SEQUENCE>1\n<FILENAME>form4.xml\n<TEXT>\n<XML>\n{document}\n</XML>\n</TEXT>\n</DOCUMENT>\n"
+        + "</SEC-DOCUMENT>\n"
+    )
+
+
+def synthetic_nport(holdings: int = 5_000, seed: int = 0) -> str:
+    """
+    Returns the primary document of a Form NPORT-P filing with the given number of holdings.
+    Only the investment section is filled in, alternating between equities, bonds, currency forwards, futures and swaps.
+    Elements are separated by line breaks as in the filings on EDGAR.
+    """
+    rng = random.Random(seed)
+    entries = []
+    for index in range(holdings):
+        kind = index % 5
+        value = rng.uniform(-10**6, 10**7) if kind >= 2 else rng.uniform(1, 10**7)
+        if index % 11 == 0:
+            currency = f'<currencyConditional curCd="EUR" exchangeRt="{rng.uniform(0.8, 1.2):.6f}"/>'
+        else:
+            currency = "<curCd>USD</curCd>"
+        asset_type = '<assetConditional desc="Other asset"/>' if index % 13 == 0 else f"<assetCat>{('EC', 'DBT', 'DFE', 'DIR', 'DIR')[kind]}</assetCat>"
+        if kind == 1:
+            details = (
+                "<debtSec>\n<maturityDt>2030-06-15</maturityDt>\n<couponKind>Fixed</couponKind>\n"
+                f"<annualizedRt>{rng.uniform(0, 8):.4f}</annualizedRt>\n<isDefault>N</isDefault>\n"
+                "<areIntrstPmntsInArrs>N</areIntrstPmntsInArrs>\n<isPaidKind>N</isPaidKind>\n</debtSec>\n"
+            )
+        elif kind == 2:
+            details = (
+                '<derivativeInfo>\n<fwdDeriv derivCat="FWD">\n'
+                "<counterparties>\n<counterpartyName>BANK A</counterpartyName>\n<counterpartyLei>5493000000000000000A</counterpartyLei>\n</counterparties>\n"
+                f"<amtCurSold>{rng.randrange(10**6)}</amtCurSold>\n<curSold>USD</curSold>\n"
+                f"<amtCurPur>{rng.randrange(10**6)}</amtCurPur>\n<curPur>EUR</curPur>\n"
+                f"<settlementDt>2024-06-21</settlementDt>\n<unrealizedAppr>{value:.2f}</unrealizedAppr>\n"
+                "</fwdDeriv>\n</derivativeInfo>\n"
+            )
+        elif kind == 3:
+            details = (
+                '<derivativeInfo>\n<futrDeriv derivCat="FUT">\n'
+                "<counterparties>\n<counterpartyName>EXCHANGE</counterpartyName>\n<counterpartyLei>N/A</counterpartyLei>\n</counterparties>\n"
+                "<descRefInstrmnt>\n<indexBasketInfo>\n<indexName>S&amp;P 500 Index</indexName>\n<indexIdentifier>SPX</indexIdentifier>\n</indexBasketInfo>\n</descRefInstrmnt>\n"
+                "<payOffProf>Long</payOffProf>\n<expDate>2024-06-21</expDate>\n"
+                f"<notionalAmt>{rng.randrange(10**7)}</notionalAmt>\n<curCd>USD</curCd>\n<unrealizedAppr>{value:.2f}</unrealizedAppr>\n"
+                "</futrDeriv>\n</derivativeInfo>\n"
+            )
+        elif kind == 4:
+            details = (
+                '<derivativeInfo>\n<swapDeriv derivCat="SWP">\n'
+                "<counterparties>\n<counterpartyName>BANK B</counterpartyName>\n<counterpartyLei>5493000000000000000B</counterpartyLei>\n</counterparties>\n"
+                "<swapFlag>N</swapFlag>\n"
+                "<descRefInstrmnt>\n<otherRefInst>\n<issuerName>ISSUER CORP</issuerName>\n<issueTitle>COMMON STOCK</issueTitle>\n"
+                '<identifiers>\n<isin value="US0000000000"/>\n<other otherDesc="SEDOL" value="B000000"/>\n</identifiers>\n</otherRefInst>\n</descRefInstrmnt>\n'
+                f'<floatingRecDesc fixedOrFloating="Floating" floatingRtIndex="SOFR" floatingRtSpread="{rng.uniform(0, 2):.4f}" pmntAmt="0" curCd="USD">\n'
+                '<rtResetTenors>\n<rtResetTenor rateTenor="Month" rateTenorUnit="3" resetDt="Month" resetDtUnit="3"/>\n</rtResetTenors>\n</floatingRecDesc>\n'
+                f'<fixedPmtDesc fixedOrFloating="Fixed" fixedRt="{rng.uniform(0, 5):.4f}" amount="0" curCd="USD"/>\n'
+                "<terminationDt>2029-01-15</terminationDt>\n<upfrontPmnt>0</upfrontPmnt>\n<pmntCurCd>USD</pmntCurCd>\n"
+                "<upfrontRcpt>0</upfrontRcpt>\n<rcptCurCd>USD</rcptCurCd>\n"
+                f"<notionalAmt>{rng.randrange(10**7)}</notionalAmt>\n<curCd>USD</curCd>\n<unrealizedAppr>{value:.2f}</unrealizedAppr>\n"
+                "</swapDeriv>\n</derivativeInfo>\n"
+            )
+        else:
+            details = ""
+        if index % 17 == 0:
+            lending = '<securityLending>\n<isCashCollateral>N</isCashCollateral>\n<isNonCashCollateral>N</isNonCashCollateral>\n<loanByFundCondition isLoanByFund="Y" loanVal="12.5"/>\n</securityLending>\n'
+        else:
+            lending = "<securityLending>\n<isCashCollateral>N</isCashCollateral>\n<isNonCashCollateral>N</isNonCashCollateral>\n<isLoanByFund>N</isLoanByFund>\n</securityLending>\n"
+        entries.append(
+            "<invstOrSec>\n"
+            f"<name>ISSUER {index} &amp; CO</name>\n<lei>N/A</lei>\n<title>SECURITY {index}</title>\n"
+            f"<cusip>{rng.randrange(10**9):09d}</cusip>\n"
+            f'<identifiers>\n<isin value="US{rng.randrange(10**10):010d}"/>\n'
+            + (f'<other otherDesc="SEDOL" value="{rng.randrange(10**7):07d}"/>\n' if index % 3 == 0 else "")
+            + "</identifiers>\n"
+            f"<balance>{rng.randrange(-10**5, 10**7) if kind >= 2 else rng.randrange(1, 10**7)}</balance>\n"
+            f"<units>{('NS', 'PA', 'OU', 'NC', 'OU')[kind]}</units>\n"
+            f"{currency}\n<valUSD>{value:.2f}</valUSD>\n<pctVal>{rng.uniform(-1, 2):.6f}</pctVal>\n"
+            f"<payoffProfile>{'Long' if value >= 0 else 'Short'}</payoffProfile>\n"
+            f"{asset_type}\n"
+            + ('<issuerConditional desc="Other issuer"/>\n' if index % 19 == 0 else "<issuerCat>CORP</issuerCat>\n")
+            + "<invCountry>US</invCountry>\n<isRestrictedSec>N</isRestrictedSec>\n<fairValLevel>2</fairValLevel>\n"
+            + details
+            + lending
+            + "</invstOrSec>"
+        )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<edgarSubmission xmlns="http://www.sec.gov/edgar/nport" xmlns:com="http://www.sec.gov/edgar/common">\n'
+        "<formData>\n<invstOrSecs>\n"
+        + "\n".join(entries)
+        + "\n</invstOrSecs>\n</formData>\n</edgarSubmission>"
+    )
+    return f"<DOCUMENT>\n<TYPE>NPORT-P\n<SEQUENCE>1\n<FILENAME>primary_doc.xml\n<TEXT>\n<XML>\n{document}\n</XML>\n</TEXT>\n</DOCUMENT>\n"
+
+
+def synthetic_xbrl_instance(facts: int = 5_000, contexts: int = 200, seed: int = 0) -> str:
+    """
+    Returns an XBRL instance document (the *_htm.xml section of 10-K and 10-Q filings) with the given number of facts.
+    """
+    rng = random.Random(seed)
+    elements = []
+    for index in range(contexts):
+        year = 2015 + index % 9
+        if index % 2:
+            period = f"<period><instant>{year}-12-31</instant></period>"
+        else:
+            period = f"<period><startDate>{year}-01-01</startDate><endDate>{year}-12-31</endDate></period>"
+        segment = ""
+        if index % 4 == 3:
+            segment = f'<segment><xbrldi:explicitMember dimension="us-gaap:StatementBusinessSegmentsAxis">abc:Segment{index}Member</xbrldi:explicitMember></segment>'
+        elements.append(f'<context id="c-{index}"><entity><identifier scheme="http://www.sec.gov/CIK">0000000100</identifier>{segment}</entity>{period}</context>')
+    elements.append('<unit id="usd"><measure>iso4217:USD</measure></unit>')
+    elements.append('<unit id="shares"><measure>xbrli:shares</measure></unit>')
+    elements.append('<unit id="usdPerShare"><divide><unitNumerator><measure>iso4217:USD</measure></unitNumerator><unitDenominator><measure>xbrli:shares</measure></unitDenominator></divide></unit>')
+    for index in range(facts):
+        concept = f"us-gaap:Concept{index % 400}"
+        elements.append(
+            f'<{concept} contextRef="c-{rng.randrange(contexts)}" unitRef="usd" decimals="-6">{rng.randrange(10**10)}</{concept}>'
+        )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<xbrl xmlns="http://www.xbrl.org/2003/instance" xmlns:xbrldi="http://xbrl.org/2006/xbrldi" '
+        'xmlns:us-gaap="http://fasb.org/us-gaap/2023" xmlns:iso4217="http://www.xbrl.org/2003/iso4217">'
+        + "".join(elements)
+        + "</xbrl>"
+    )
+
+
+def synthetic_companyfacts(concepts: int = 500, years: int = 15, seed: int = 0) -> dict:
+    """
+    Returns a companyfacts JSON of the XBRL API (data.sec.gov/api/xbrl/companyfacts) with stock and flow variables.
+    Flow variables are reported as single quarters, as year-to-date values and as fiscal years, and every filing
+    repeats the values of the previous year, like the facts of actual 10-Q and 10-K filings.
+    """
+    rng = random.Random(seed)
+    quarters = [((1, 1), (3, 31)), ((4, 1), (6, 30)), ((7, 1), (9, 30)), ((10, 1), (12, 31))]
+    us_gaap = {}
+    for index in range(concepts):
+        flow = index % 3 != 0
+        per_share = index % 10 == 9
+        entries = []
+        for year in range(2024 - years, 2024):
+            for filed_year in (year, year + 1):
+                for quarter, fp in enumerate(("Q1", "Q2", "Q3", "FY")):
+                    if rng.random() < 0.05:
+                        continue
+                    form = "10-K" if fp == "FY" else "10-Q"
+                    end = dt.date(year, *quarters[quarter][1]).isoformat()
+                    filed = dt.date(filed_year + (fp == "FY"), (quarter * 3 + 2) % 12 + 1, 15).isoformat()
+                    value = round(rng.uniform(0.5, 5), 2) if per_share else rng.randrange(10**6, 10**10)
+                    entry = {"end": end, "val": value, "fy": filed_year, "fp": fp, "form": form, "filed": filed}
+                    if not flow:
+                        entries.append(entry)
+                        continue
+                    entries.append({"start": dt.date(year, *quarters[quarter][0]).isoformat(), **entry, "fp": fp if fp != "FY" else "Q4"})
+                    if fp != "Q1":
+                        # year-to-date value of the quarter
+                        entries.append({"start": f"{year}-01-01", **entry})
+        units = {"USD/shares" if per_share else "USD": entries}
+        if index % 25 == 0:
+            units["shares"] = entries[:len(entries) // 3]
+        us_gaap[f"Concept{index}"] = {"label": f"Concept {index}", "description": f"Description of concept {index}", "units": units}
+    return {"cik": 100, "entityName": "Synthetic Inc.", "facts": {"dei": {}, "us-gaap": us_gaap}}
+
+
+def synthetic_10k(facts: int = 5_000, reports: int = 50, seed: int = 0) -> str:
+    """
+    Returns a Form 10-K filing with the XBRL schema, label, presentation and instance documents.
+    """
+    rng = random.Random(seed)
+    concepts = 400
+    elements, roles, labels, links = [], [], [], []
+    for index in range(concepts):
+        elements.append(f'<xs:element name="Concept{index}" id="us-gaap_Concept{index}" type="xbrli:monetaryItemType" substitutionGroup="xbrli:item" nillable="true" xbrli:balance="credit" xbrli:periodType="duration"/>')
+        labels.append(
+            f'<link:loc xlink:type="locator" xlink:href="https://xbrl.fasb.org/us-gaap/2023/elts/us-gaap-2023.xsd#us-gaap_Concept{index}" xlink:label="us-gaap_Concept{index}"/>'
+            f'<link:label xlink:type="resource" xlink:label="lab_Concept{index}" xlink:role="http://www.xbrl.org/2003/role/label" xml:lang="en-US">Concept {index}</link:label>'
+            f'<link:label xlink:type="resource" xlink:label="lab_Concept{index}" xlink:role="http://www.xbrl.org/2003/role/terseLabel" xml:lang="en-US">Concept {index} (terse)</link:label>'
+        )
+    for index in range(reports):
+        report_type = "Statement" if index < 8 else "Disclosure"
+        roles.append(
+            f'<link:roleType roleURI="http://www.synthetic.com/role/Report{index}" id="Report{index}">'
+            f"<link:definition>{index + 1:07d} - {report_type} - Report {index}</link:definition>"
+            "<link:usedOn>link:presentationLink</link:usedOn></link:roleType>"
+        )
+        arcs = "".join(
+            f'<link:presentationArc xlink:type="arc" xlink:arcrole="http://www.xbrl.org/2003/arcrole/parent-child" xlink:from="loc_us-gaap_Concept{index}_{rng.randrange(16**8):08x}" '
+            f'xlink:to="loc_us-gaap_Concept{rng.randrange(concepts)}_{rng.randrange(16**8):08x}" order="{order + 1}" preferredLabel="http://www.xbrl.org/2003/role/terseLabel"/>'
+            for order in range(20)
+        )
+        links.append(f'<link:presentationLink xlink:type="extended" xlink:role="http://www.synthetic.com/role/Report{index}">{arcs}</link:presentationLink>')
+
+    namespaces = 'xmlns:link="http://www.xbrl.org/2003/linkbase" xmlns:xlink="http://www.w3.org/1999/xlink"'
+    schema = (
+        f'<?xml version="1.0" encoding="utf-8"?>\n<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" xmlns:xbrli="http://www.xbrl.org/2003/instance" {namespaces}>'
+        f'<xs:annotation><xs:appinfo>{"".join(roles)}</xs:appinfo></xs:annotation>{"".join(elements)}</xs:schema>'
+    )
+    label = f'<?xml version="1.0" encoding="utf-8"?>\n<link:linkbase {namespaces}><link:labelLink xlink:type="extended">{"".join(labels)}</link:labelLink></link:linkbase>'
+    presentation = f'<?xml version="1.0" encoding="utf-8"?>\n<link:linkbase {namespaces}>{"".join(links)}</link:linkbase>'
+    documents = [
+        ("10-K", "syn-20231231.htm", "<html><body>Annual report</body></html>"),
+        ("EX-101.SCH", "syn-20231231.xsd", schema),
+        ("EX-101.LAB", "syn-20231231_lab.xml", label),
+        ("EX-101.PRE", "syn-20231231_pre.xml", presentation),
+        ("XML", "syn-20231231_htm.xml", synthetic_xbrl_instance(facts=facts, seed=seed))
+    ]
+    body = "".join(
+        f"<DOCUMENT>\n<TYPE>{document_type}\n<SEQUENCE>{index + 1}\n<FILENAME>{filename}\n<TEXT>\n<XBRL>\n{text}\n</XBRL>\n</TEXT>\n</DOCUMENT>\n"
+        for index, (document_type, filename, text) in enumerate(documents)
+    )
+    return _header("10-K", ["FILER"], seed=seed + 1) + body + "</SEC-DOCUMENT>\n"
+
+
+if __name__ == "__main__":
+    record()
@@ -0,0 +1,9 @@
+from benchmarks import corpus
+from findata import FrenchReader
+
+
+def test_parse_time_series(benchmark, recorded):
+    response = recorded(corpus.french_zip)
+    reader = FrenchReader(corpus.FRENCH_DATASET)
+    data = benchmark(reader._parse_time_series, response)
+    assert len(data) != 0
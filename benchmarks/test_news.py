@@ -0,0 +1,8 @@
+from benchmarks import corpus
+
+
+def test_economist_articles(benchmark, recorded):
+    # pages are served from the fixture store, so only page parsing is measured
+    recorded(corpus.economist_articles)
+    articles = benchmark(corpus.economist_articles)
+    assert len(articles) != 0
@@ -0,0 +1,115 @@
+from benchmarks import corpus
+import pickle
+from findata.sec import _SECFiling, Filing4, Filing10K, Filing13F, FilingNPORT, SECFundamentals
+import pytest
+
+ROUNDS = 5
+
+
+def test_parse_header(benchmark):
+    file = _SECFiling(file=corpus.synthetic_header(filers=20))
+    benchmark(file._parse_header)
+    assert len(file._filer) == 20
+
+
+def test_parse_header_recorded(benchmark, recorded):
+    file = _SECFiling(file=recorded(corpus.sec_filing, "13G"))
+    benchmark(file._parse_header)
+
+
+@pytest.mark.parametrize("holdings", [500, 5_000])
+def test_filing_13f(benchmark, holdings):
+    text = corpus.synthetic_13f(holdings)
+    filing = benchmark.pedantic(Filing13F, kwargs={"file": text}, rounds=ROUNDS)
+    assert len(filing.investments) == holdings
+
+
+def test_parse_holdings_from_xml(benchmark):
+    filing = Filing13F(file=corpus.synthetic_13f(5_000))
+    benchmark.pedantic(filing._parse_holdings_from_xml, rounds=ROUNDS)
+
+
+def test_investments_frame(benchmark):
+    text = corpus.synthetic_13f(5_000)
+    frame = benchmark.pedantic(lambda: Filing13F(file=text).investments_frame(), rounds=ROUNDS)
+    assert frame["market_value"].tolist() == [item["market_value"] for item in Filing13F(file=text).investments]
+
+
+def test_aggregate_portfolio(benchmark):
+    text = corpus.synthetic_13f(5_000)
+    benchmark.pedantic(lambda filing: filing.aggregate_portfolio(), setup=lambda: ((Filing13F(file=text),), {}), rounds=ROUNDS)
+
+
+def test_filing_nport(benchmark, recorded):
+    text = recorded(corpus.sec_filing, "NPORT")
+    benchmark.pedantic(FilingNPORT, kwargs={"file": text}, rounds=ROUNDS)
+
+
+def test_parse_investments(benchmark, recorded):
+    filing = FilingNPORT(file=recorded(corpus.sec_filing, "NPORT_derivatives"))
+    benchmark.pedantic(filing._parse_investments, rounds=ROUNDS)
+
+
+@pytest.mark.parametrize("holdings", [500, 5_000])
+def test_iter_investments(benchmark, holdings):
+    # only the investment section is generated, so the filing is set up without the general fund information
+    filing = FilingNPORT.__new__(FilingNPORT)
+    filing._document = corpus.synthetic_nport(holdings)
+    investments = benchmark.pedantic(lambda: list(filing.iter_investments()), rounds=ROUNDS)
+    assert len(investments) == holdings
+
+
+def test_parse_non_derivative_securities(benchmark):
+    filing = Filing4(file=corpus.synthetic_form4(transactions=200))
+    securities = benchmark(filing._parse_non_derivative_securities)
+    assert len(securities) == 200
+
+
+def test_filing_10k(benchmark):
+    text = corpus.synthetic_10k(facts=5_000)
+    filing = benchmark.pedantic(Filing10K, kwargs={"file": text}, rounds=ROUNDS)
+    assert len(filing.statements) == 8
+
+
+def test_filing_10k_path(benchmark, tmp_path):
+    text = corpus.synthetic_10k(facts=5_000)
+    path = tmp_path / "filing.txt"
+    path.write_text(text, encoding="latin-1")
+    filing = benchmark.pedantic(Filing10K, kwargs={"path": path}, rounds=ROUNDS)
+    assert filing._sections == Filing10K(file=text)._sections
+    assert pickle.loads(pickle.dumps(filing)).statements == filing.statements
+
+
+def test_filing_document(benchmark, tmp_path):
+    path = tmp_path / "filing.txt"
+    path.write_text(corpus.synthetic_10k(facts=5_000), encoding="latin-1")
+    document = benchmark.pedantic(lambda filing: filing.document("EX-101.LAB"), setup=lambda: ((_SECFiling(path=path),), {}), rounds=ROUNDS)
+    assert document.startswith("<XBRL>") and document.endswith("</XBRL>")
+    assert [document["sequence"] for document in _SECFiling(path=path).documents] == [1, 2, 3, 4, 5]
+
+
+def test_filing_10k_data(benchmark):
+    text = corpus.synthetic_10k(facts=5_000)
+    data = benchmark.pedantic(lambda filing: filing.data, setup=lambda: ((Filing10K(file=text),), {}), rounds=ROUNDS)
+    assert sum(len(values) for values in data.values()) == 5_000
+
+
+def test_parse_value_section(benchmark):
+    # Filing10K needs a complete XBRL filing, so only the instance document is set up here
+    filing = Filing10K.__new__(Filing10K)
+    filing._sections = {"value": corpus.synthetic_xbrl_instance(facts=5_000)}
+    benchmark.pedantic(filing._parse_value_section, rounds=ROUNDS)
+    assert len(filing.facts) == 5_000
+
+
+def test_sec_fundamentals(benchmark):
+    facts = corpus.synthetic_companyfacts(concepts=500)["facts"]
+
+    def parse():
+        # SECFundamentals requests the companyfacts itself, so the parsing is set up without the request
+        fundamentals = SECFundamentals.__new__(SECFundamentals)
+        fundamentals._parse_facts(facts)
+        return fundamentals.data
+
+    data = benchmark.pedantic(parse, rounds=ROUNDS)
+    assert len(data) == 500
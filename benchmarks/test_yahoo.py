@@ -0,0 +1,9 @@
+from benchmarks import corpus
+from findata import YahooReader
+
+
+def test_historical_data(benchmark, recorded):
+    response = recorded(corpus.yahoo_chart)
+    reader = YahooReader(corpus.YAHOO_TICKER)
+    data = benchmark(reader._parse_historical_data, response, "1d", True, False)
+    assert len(data["data"]) != 0
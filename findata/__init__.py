@@ -1,46 +1,72 @@
-from .aqr import AQRReader
-from .cme import CMEReader
-from .finviz import FinvizReader
-from .fred import FREDReader
-from .french import FrenchReader
-from .macrotrends import MacrotrendsReader
-from .marketscreener import MarketscreenerReader
-from .msci import MSCIReader
-from .news import (
-    EconomistNews,
-    FTNews,
-    NasdaqNews,
-    SANews,
-    WSJNews
-)
-from .onvista import (
-    OnvistaBondReader,
-    OnvistaFundReader,
-    OnvistaStockReader,
-)
-from .sec import (
-    latest_sec_filings,
-    sec_companies,
-    sec_filings,
-    sec_mutualfunds,
-    Filing3,
-    Filing4,
-    Filing5,
-    Filing10K,
-    Filing10Q,
-    Filing13D,
-    Filing13G,
-    Filing13F,
-    FilingNPORT,
-    SECFundamentals
-)
-from .stratosphere import StratosphereReader
-from .tipranks import TipranksAnalystReader, TipranksStockReader
-from .yahoo import YahooReader
-from .functions import (
-    finra_margin_debt,
-    lei_to_cik,
-    shiller_data,
-    sp_index_data
-)
-from .utils import DatasetError, TickerError
\ No newline at end of file
+import importlib
+
+# Public names and the submodules that define them. Submodules are imported on first
+# attribute access (PEP 562), so that "import findata" does not load selenium, pandas
+# or BeautifulSoup before a reader that needs them is actually used.
+_exports = {
+    "AQRReader": "aqr",
+    "CMEReader": "cme",
+    "FinvizReader": "finviz",
+    "FREDReader": "fred",
+    "FrenchReader": "french",
+    "MacrotrendsReader": "macrotrends",
+    "MarketscreenerReader": "marketscreener",
+    "MSCIReader": "msci",
+    "EconomistNews": "news",
+    "FTNews": "news",
+    "NasdaqNews": "news",
+    "SANews": "news",
+    "WSJNews": "news",
+    "OnvistaBondReader": "onvista",
+    "OnvistaFundReader": "onvista",
+    "OnvistaStockReader": "onvista",
+    "cik_resolver": "sec",
+    "fetch_filings": "sec",
+    "iter_sec_filings": "sec",
+    "latest_sec_filings": "sec",
+    "sec_companies": "sec",
+    "sec_filings": "sec",
+    "sec_filings_async": "sec",
+    "sec_mutualfunds": "sec",
+    "CIKResolver": "sec",
+    "Filing3": "sec",
+    "Filing4": "sec",
+    "Filing5": "sec",
+    "Filing10K": "sec",
+    "Filing10Q": "sec",
+    "Filing13D": "sec",
+    "Filing13G": "sec",
+    "Filing13F": "sec",
+    "FilingNPORT": "sec",
+    "SECFundamentals": "sec",
+    "SECIndex": "sec",
+    "SECSubmissions": "sec",
+    "StratosphereReader": "stratosphere",
+    "TipranksAnalystReader": "tipranks",
+    "TipranksStockReader": "tipranks",
+    "YahooReader": "yahoo",
+    "finra_margin_debt": "functions",
+    "lei_to_cik": "functions",
+    "shiller_data": "functions",
+    "sp_index_data": "functions",
+    "DatasetError": "utils",
+    "TickerError": "utils"
+}
+_submodules = set(_exports.values())
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    if name in _exports:
+        value = getattr(importlib.import_module(f".{_exports[name]}", __name__), name)
+    elif name in _submodules:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,8 +1,14 @@
 from datetime import datetime, timedelta
+from io import BytesIO
 import pandas as pd
+from . import utils
 
 
 class AQRReader:
+    @classmethod
+    def _download(cls, url) -> BytesIO:
+        return BytesIO(utils.get(url=url, headers=utils.HEADERS, ttl=utils.CACHE_TTL["aqr"]).content)
+
     @classmethod
     def _from_excel_ordinal(cls, ordinal, epoch=datetime(1899, 12, 31)):
         if ordinal >= 60:
@@ -13,7 +19,7 @@ class AQRReader:
     def bab_factors(cls, frequency="daily", timestamps=False) -> dict:
         if frequency not in ("daily", "monthly"):
             raise ValueError("frequency must be daily or monthly")
-        file = pd.ExcelFile(f"https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/Betting-Against-Beta-Equity-Factors-{frequency}.xlsx")
+        file = pd.ExcelFile(cls._download(f"https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/Betting-Against-Beta-Equity-Factors-{frequency}.xlsx"))
         dfs = {}
         for name in ("BAB Factors", "MKT", "SMB", "HML FF", "HML Devil", "UMD", "RF"):
             df = file.parse(
@@ -30,7 +36,7 @@ class AQRReader:
     @classmethod
     def commodities_long_run(cls, timestamps=False) -> pd.DataFrame:
         df = pd.read_excel(
-            io="https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/Commodities-for-the-Long-Run-Index-Level-Data-Monthly.xlsx",
+            io=cls._download("https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/Commodities-for-the-Long-Run-Index-Level-Data-Monthly.xlsx"),
             sheet_name="Commodities for the Long Run",
             skiprows=range(10),
             index_col=0
@@ -42,7 +48,7 @@ class AQRReader:
 
     @classmethod
     def esg_efficient_frontier_portfolios(cls, timestamps=False) -> dict:
-        file = pd.ExcelFile("https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/ESG_efficient_frontier_portfolios_vF.xlsx")
+        file = pd.ExcelFile(cls._download("https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/ESG_efficient_frontier_portfolios_vF.xlsx"))
         dfs = {}
         for name, skip_rows in ("Value-weighted excess returns", 12), ("Equal-weighted excess returns", 9):
             df = file.parse(
@@ -66,7 +72,7 @@ class AQRReader:
     @classmethod
     def factor_premia_century(cls, timestamps=False) -> pd.DataFrame:
         df = pd.read_excel(
-            io="https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/Century-of-Factor-Premia-Monthly.xlsx",
+            io=cls._download("https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/Century-of-Factor-Premia-Monthly.xlsx"),
             sheet_name="Century of Factor Premia",
             skiprows=range(18),
             index_col=0
@@ -82,7 +88,7 @@ class AQRReader:
     def hml_devil_factors(cls, frequency="daily", timestamps=False) -> dict:
         if frequency not in ("daily", "monthly"):
             raise ValueError("frequency must be daily or monthly")
-        file = pd.ExcelFile(f"https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/The-Devil-in-HMLs-Details-Factors-{frequency}.xlsx")
+        file = pd.ExcelFile(cls._download(f"https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/The-Devil-in-HMLs-Details-Factors-{frequency}.xlsx"))
         dfs = {}
         for name in ("HML Devil", "MKT", "SMB", "HML FF", "UMD", "RF"):
             df = file.parse(
@@ -100,7 +106,7 @@ class AQRReader:
     def momentum_indices(cls, timestamps=False) -> pd.DataFrame:
         dfs = {}
         df = pd.read_excel(
-            io="https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/AQR-Index-Returns.xls",
+            io=cls._download("https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/AQR-Index-Returns.xls"),
             sheet_name="Returns",
             skiprows=range(1),
             index_col=0
@@ -125,7 +131,7 @@ class AQRReader:
         if frequency not in ("daily", "monthly"):
             raise ValueError("frequency must be daily or monthly")
         dfs = {}
-        file = pd.ExcelFile(f"https://images.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/Quality-Minus-Junk-Factors-{frequency}.xlsx")
+        file = pd.ExcelFile(cls._download(f"https://images.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/Quality-Minus-Junk-Factors-{frequency}.xlsx"))
         for name in ("QMJ Factors", "MKT", "SMB", "HML FF", "HML Devil", "UMD", "RF"):
             df = file.parse(
                 sheet_name=name,
@@ -140,7 +146,7 @@ class AQRReader:
     
     @classmethod
     def quality_sorted_portfolios(cls, timestamps=False) -> dict:
-        file = pd.ExcelFile("https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/Quality-Minus-Junk-10-QualitySorted-Portfolios-Monthly.xlsx")
+        file = pd.ExcelFile(cls._download("https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/Quality-Minus-Junk-10-QualitySorted-Portfolios-Monthly.xlsx"))
         dfs = {}
         for name in ("10 Portfolios Formed on Quality",):
             df = file.parse(
@@ -163,7 +169,7 @@ class AQRReader:
     
     @classmethod
     def quality_size_sorted_portfolios(cls, timestamps=False) -> dict:
-        file = pd.ExcelFile("https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/Quality-Minus-Junk-Six-Portfolios-Formed-on-Size-and-Quality-Monthly.xlsx")
+        file = pd.ExcelFile(cls._download("https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/Quality-Minus-Junk-Six-Portfolios-Formed-on-Size-and-Quality-Monthly.xlsx"))
         dfs = {}
         for name in ("Size x Quality (2 x3)",):
             df = file.parse(
@@ -188,7 +194,7 @@ class AQRReader:
     @classmethod
     def time_series_momentum(cls, timestamps=False) -> pd.DataFrame:
         df = pd.read_excel(
-            io="https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/Time-Series-Momentum-Factors-Monthly.xlsx",
+            io=cls._download("https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/Time-Series-Momentum-Factors-Monthly.xlsx"),
             sheet_name="TSMOM Factors",
             skiprows=range(17),
             index_col=0
@@ -201,7 +207,7 @@ class AQRReader:
     @classmethod
     def value_momentum_everywhere_factors(cls, timestamps=False) -> pd.DataFrame:
         df = pd.read_excel(
-            io="https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/Value-and-Momentum-Everywhere-Factors-Monthly.xlsx",
+            io=cls._download("https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/Value-and-Momentum-Everywhere-Factors-Monthly.xlsx"),
             sheet_name="VME Factors",
             skiprows=range(21),
             index_col=0
@@ -215,7 +221,7 @@ class AQRReader:
     @classmethod
     def value_momentum_everywhere_portfolios(cls, timestamps=False) -> pd.DataFrame:
         df = pd.read_excel(
-            io="https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/Value-and-Momentum-Everywhere-Portfolios-Monthly.xlsx",
+            io=cls._download("https://www.aqr.com/-/media/AQR/Documents/Insights/Data-Sets/Value-and-Momentum-Everywhere-Portfolios-Monthly.xlsx"),
             sheet_name="VME Portfolios",
             skiprows=range(20),
             index_col=0
@@ -1,6 +1,5 @@
 from bs4 import BeautifulSoup
 import pandas as pd
-import requests
 import re
 from . import utils
 
@@ -10,12 +9,13 @@ class FinvizReader:
     
     def __init__(self, ticker):
         self._ticker = ticker.upper()
-        self._html = requests.get(
+        response = utils.get(
             url=self._base_url.format(self._ticker),
             headers=utils.HEADERS
-        ).text
-        if "This IP address has performed an unusual high number of requests and has been temporarily rate limited. If you believe this to be in error, please contact us." in self._html:
+        )
+        if utils.is_rate_limited(response):
             raise PermissionError("Requests have been rate limited")
+        self._html = response.text
         self._soup = BeautifulSoup(self._html, "lxml")
 
     def __repr__(self) -> str:
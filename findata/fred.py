@@ -2,7 +2,6 @@ from bs4 import BeautifulSoup
 from io import StringIO
 import numpy as np
 import pandas as pd
-import requests
 from . import utils
 
 
@@ -17,7 +16,7 @@ class FREDReader:
         return f"FREDReader({self.dataset})"
 
     def _get_description_data(self) -> dict:        
-        html = requests.get(
+        html = utils.get(
             url = self._description_url.format(self.dataset), 
             headers=utils.HEADERS
         ).text
@@ -57,12 +56,29 @@ class FREDReader:
     def historical_data(self) -> pd.DataFrame:
         parameters = {"id": self.dataset}
 
-        response = requests.get(
+        response = utils.get(
             url=self._dataset_url,
             headers=utils.HEADERS,
-            params=parameters
+            params=parameters,
+            ttl=utils.CACHE_TTL["fred"]
         ).text
 
+        return self._parse_historical_data(response)
+
+    async def historical_data_async(self) -> pd.DataFrame:
+        parameters = {"id": self.dataset}
+
+        response = await utils.async_get(
+            url=self._dataset_url,
+            headers=utils.HEADERS,
+            params=parameters,
+            ttl=utils.CACHE_TTL["fred"]
+        )
+
+        return self._parse_historical_data(response.text)
+
+    @utils.instrumented
+    def _parse_historical_data(self, response: str) -> pd.DataFrame:
         df = pd.read_csv(StringIO(response), index_col=0)
         df.index = pd.to_datetime(df.index)
         if self.timestamps:
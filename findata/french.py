@@ -3,7 +3,6 @@ from io import StringIO
 import numpy as np
 import pandas as pd
 import re
-import requests
 from tempfile import TemporaryFile
 from zipfile import ZipFile, BadZipFile
 from . import utils
@@ -85,8 +84,33 @@ class FrenchReader:
                 raise utils.DatasetError(f"Could not fetch data for {self._dataset}")
           
     def read(self) -> dict:
+        response = utils.get(url=self._dataset_url.format(self.dataset), headers=utils.HEADERS, ttl=utils.CACHE_TTL["french"]).content
+        time_series = self._parse_time_series(response)
+
+        # If the dataset is industry data, also fetch the industry definitions
+        if "Industry_Portfolios" in self.dataset:
+            response = utils.get(f"{self._base_url}data_library.html", headers=utils.HEADERS, ttl=utils.CACHE_TTL["french"]).content
+            response = utils.get(self._definitions_url(response), headers=utils.HEADERS, ttl=utils.CACHE_TTL["french"]).content
+            response = utils.get(url=self._industries_url(response), headers=utils.HEADERS, ttl=utils.CACHE_TTL["french"]).content
+            time_series["industries"] = self._parse_industries(response)
+
+        return time_series
+
+    async def read_async(self) -> dict:
+        response = await utils.async_get(url=self._dataset_url.format(self.dataset), headers=utils.HEADERS, ttl=utils.CACHE_TTL["french"])
+        time_series = self._parse_time_series(response.content)
+
+        if "Industry_Portfolios" in self.dataset:
+            response = await utils.async_get(f"{self._base_url}data_library.html", headers=utils.HEADERS, ttl=utils.CACHE_TTL["french"])
+            response = await utils.async_get(self._definitions_url(response.content), headers=utils.HEADERS, ttl=utils.CACHE_TTL["french"])
+            response = await utils.async_get(url=self._industries_url(response.content), headers=utils.HEADERS, ttl=utils.CACHE_TTL["french"])
+            time_series["industries"] = self._parse_industries(response.content)
+
+        return time_series
+
+    @utils.instrumented
+    def _parse_time_series(self, response) -> dict:
         time_series = {}
-        response = requests.get(url=self._dataset_url.format(self.dataset), headers=utils.HEADERS).content
         data = self._read_zip(response)
         data = data.split("\r\n\r\n")
         for chunk in data:
@@ -141,43 +165,42 @@ class FrenchReader:
             
             time_series[name] = df
 
-            # If the dataset is industry data, also fetch the industry definitions
-        if "Industry_Portfolios" in self.dataset:
-            response = requests.get(f"{self._base_url}data_library.html", headers=utils.HEADERS).content
-            soup = BeautifulSoup(response, "lxml")
-            def_url = soup.find("a", {"href": f"ftp/{self.dataset}_CSV.zip"}).find_next("a").get("href")
-            def_url = f"{self._base_url}{def_url}"
-
-            response = requests.get(def_url, headers=utils.HEADERS).content
-            soup = BeautifulSoup(response, "lxml")
-            text_url = soup.find("a", string=re.compile("Download\s+industry\s+definitions")).get("href").replace("../", "")
-            text_url = f"{self._base_url}{text_url}"
-
-            response = requests.get(url=text_url, headers=utils.HEADERS).content
-            industries = {}
-            definitions = self._read_zip(response)
-            for line in definitions.splitlines():
-                if re.findall("^\s*[0-9]+\s+[A-Za-z]+", line) != []:
-                    abbr, sector_name = re.findall("[0-9]+\s+([A-Za-z]+)\s+(.+)", line)[0]
-                    industries[abbr] = {"name": sector_name, "sic": []}
-                elif line == "":
-                    continue
-                else:
-                    lower, upper, industry = re.findall("\s*([0-9]+)-([0-9]+)\s*(.*)", line)[0]
-                    if industry.strip() == "":
-                        industry = None
-                    industries[abbr]["sic"].append({"name": industry, "lower": int(lower), "upper": int(upper)})
-            time_series["industries"] = industries
-
         return time_series
 
+    def _definitions_url(self, library_page) -> str:
+        soup = BeautifulSoup(library_page, "lxml")
+        def_url = soup.find("a", {"href": f"ftp/{self.dataset}_CSV.zip"}).find_next("a").get("href")
+        return f"{self._base_url}{def_url}"
+
+    def _industries_url(self, definitions_page) -> str:
+        soup = BeautifulSoup(definitions_page, "lxml")
+        text_url = soup.find("a", string=re.compile("Download\s+industry\s+definitions")).get("href").replace("../", "")
+        return f"{self._base_url}{text_url}"
+
+    @utils.instrumented
+    def _parse_industries(self, response) -> dict:
+        industries = {}
+        definitions = self._read_zip(response)
+        for line in definitions.splitlines():
+            if re.findall("^\s*[0-9]+\s+[A-Za-z]+", line) != []:
+                abbr, sector_name = re.findall("[0-9]+\s+([A-Za-z]+)\s+(.+)", line)[0]
+                industries[abbr] = {"name": sector_name, "sic": []}
+            elif line == "":
+                continue
+            else:
+                lower, upper, industry = re.findall("\s*([0-9]+)-([0-9]+)\s*(.*)", line)[0]
+                if industry.strip() == "":
+                    industry = None
+                industries[abbr]["sic"].append({"name": industry, "lower": int(lower), "upper": int(upper)})
+        return industries
+
     @property
     def dataset(self):
         return self._dataset
     
     @classmethod
     def datasets(cls) -> list:
-        response = requests.get(f"{cls._base_url}data_library.html", headers=utils.HEADERS).content
+        response = utils.get(f"{cls._base_url}data_library.html", headers=utils.HEADERS, ttl=utils.CACHE_TTL["french"]).content
         soup = BeautifulSoup(response, "lxml")
         datasets = [a_tag.get("href") for a_tag in soup.find_all("a")]
         datasets = [
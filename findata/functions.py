@@ -1,4 +1,5 @@
 from bs4 import BeautifulSoup
+from io import BytesIO
 import pandas as pd
 import re
 import requests
@@ -7,7 +8,10 @@ from . import utils
 
 
 def finra_margin_debt(timestamps=False) -> pd.DataFrame:
-    df = pd.read_excel("https://www.finra.org/sites/default/files/2021-03/margin-statistics.xlsx", index_col=0)
+    df = pd.read_excel(
+        BytesIO(utils.get(url="https://www.finra.org/sites/default/files/2021-03/margin-statistics.xlsx", headers=utils.HEADERS).content),
+        index_col=0
+    )
     df.index = pd.to_datetime(df.index)
     if timestamps:
         df.index = [int(date.timestamp()) for date in df.index]
@@ -17,7 +21,7 @@ def finra_margin_debt(timestamps=False) -> pd.DataFrame:
 
 
 def lei_to_cik(lei: str) -> Optional[int]:
-    response = requests.get(url=f"https://lei.info/{lei}", headers=utils.HEADERS)
+    response = utils.get(url=f"https://lei.info/{lei}", headers=utils.HEADERS)
     if response.status_code != 200:
         raise requests.HTTPError(f"HTTP Response Code: {response.status_code}")
     html = response.text
@@ -31,7 +35,7 @@ def lei_to_cik(lei: str) -> Optional[int]:
 
 def shiller_data(timestamps=False) -> pd.DataFrame:
     df = pd.read_excel(
-        io="https://img1.wsimg.com/blobby/go/e5e77e0b-59d1-44d9-ab25-4763ac982e53/downloads/ie_data.xls",
+        io=BytesIO(utils.get(url="https://img1.wsimg.com/blobby/go/e5e77e0b-59d1-44d9-ab25-4763ac982e53/downloads/ie_data.xls", headers=utils.HEADERS).content),
         sheet_name="Data",
         skiprows=(0,1,2,3,4,5,7),
         skipfooter=1,
@@ -71,7 +75,7 @@ def shiller_data(timestamps=False) -> pd.DataFrame:
 
 
 def sp_index_data(timestamps=False) -> dict:
-    response = requests.get(
+    response = utils.get(
         url="https://www.spglobal.com/spdji/en/documents/additional-material/sp-500-eps-est.xlsx",
         headers=utils.HEADERS
     ).content
@@ -79,7 +83,7 @@ def sp_index_data(timestamps=False) -> dict:
     data = {}
 
     #parse quarterly per-share data 
-    quarterly_data = pd.read_excel(response, sheet_name="QUARTERLY DATA", skiprows=5, index_col=0, engine="openpyxl")
+    quarterly_data = pd.read_excel(BytesIO(response), sheet_name="QUARTERLY DATA", skiprows=5, index_col=0, engine="openpyxl")
     quarterly_data.index.name = "date"
     quarterly_data.rename(
         columns={
@@ -99,7 +103,7 @@ def sp_index_data(timestamps=False) -> dict:
         quarterly_data.index = [int(date.timestamp()) for date in quarterly_data.index]
 
     #parse sector-eps and -price data
-    sector_data = pd.read_excel(response, sheet_name="SECTOR EPS", skiprows=5, index_col=0, engine="openpyxl").iloc[:, 1:-1]
+    sector_data = pd.read_excel(BytesIO(response), sheet_name="SECTOR EPS", skiprows=5, index_col=0, engine="openpyxl").iloc[:, 1:-1]
     sector_data.index.name = "date"
     sector_data = sector_data.T
     sector_data.columns = [item.strip() if isinstance(item, str) else item for item in sector_data.columns]
@@ -1,6 +1,5 @@
 from bs4 import BeautifulSoup
 import pandas as pd
-import requests
 import re
 from . import utils
 
@@ -10,7 +9,7 @@ class MarketscreenerReader:
     
     def __init__(self, identifier) -> None:
         params = {"q": identifier}
-        html = requests.get(url=f"{self._base_url}/search/", params=params, headers=utils.HEADERS).text
+        html = utils.get(url=f"{self._base_url}/search/", params=params, headers=utils.HEADERS).text
         soup = BeautifulSoup(html, "lxml")
         
         try:
@@ -23,12 +22,12 @@ class MarketscreenerReader:
 
     def _get_company_information(self) -> None:
         url = f"{self._company_url}company/"
-        html = requests.get(url=url, headers=utils.HEADERS).text
+        html = utils.get(url=url, headers=utils.HEADERS).text
         self._company_soup = BeautifulSoup(html, "lxml")
 
     def _get_financial_information(self) -> None:
         url = f"{self._company_url}finances/"
-        html = requests.get(url=url, headers=utils.HEADERS).text
+        html = utils.get(url=url, headers=utils.HEADERS).text
         self._financial_soup = BeautifulSoup(html, "lxml")
 
     def _parse_header(self) -> None:
@@ -340,7 +339,7 @@ class MarketscreenerReader:
         source, header = news_types[news_type]
         articles = []
         url = f"{self._company_url}{source}/"
-        html = requests.get(url=url, headers=utils.HEADERS).text
+        html = utils.get(url=url, headers=utils.HEADERS).text
         soup = BeautifulSoup(html, "lxml")
 
         rows = soup.find("h3", string=header).find_next("table").find_all("tr")
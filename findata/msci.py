@@ -3,7 +3,6 @@ import datetime as dt
 import numpy as np
 import pandas as pd
 from pandas.tseries.offsets import BDay
-import requests
 from . import utils
 
 
@@ -119,7 +118,7 @@ class MSCIReader:
             "normalize": self.normalize
         }
 
-        response = requests.get(
+        response = utils.get(
             url=self._base_url,
             params=parameters,
             headers=utils.HEADERS
@@ -158,7 +157,7 @@ class MSCIReader:
 
     @classmethod
     def indices(cls) -> pd.DataFrame:
-        html = requests.get(
+        html = utils.get(
             url="https://www.msci.com/our-solutions/indexes/index-resources/index-tools",
             headers=utils.HEADERS
         ).content
@@ -1,5 +1,4 @@
 from bs4 import BeautifulSoup
-import requests
 from . import utils
 
 
@@ -10,7 +9,7 @@ class NasdaqReader:
 
     def _get_earnings_data(self):
         
-        data = requests.get(
+        data = utils.get(
             url=self._base_url.format(self.ticker, "earnings"),
             headers=utils.HEADERS
         ).content
@@ -1,7 +1,7 @@
 from bs4 import BeautifulSoup
 import pandas as pd
 import re
-import requests
+import time
 from . import utils
 
 
@@ -55,7 +55,7 @@ class EconomistNews:
         while start_reached is False:
             page_counter+=1
             url = f"{cls._base_url}/{section}?page={page_counter}"
-            response = requests.get(url=url, headers=utils.HEADERS)
+            response = utils.get(url=url, headers=utils.HEADERS)
             
             if int(response.url.split("page=")[1]) != page_counter:
                 break
@@ -344,7 +344,7 @@ class FTNews:
             if page_counter == 201:
                 break
             url = f"{cls._base_url}/{section}?page={page_counter}"
-            html = requests.get(url=url, headers=utils.HEADERS).text
+            html = utils.get(url=url, headers=utils.HEADERS).text
             soup = BeautifulSoup(html, "lxml")
             try:
                 tags = soup.find_all("ul", {"class": "o-teaser-collection__list js-stream-list"})[0].find_all("li")
@@ -392,7 +392,7 @@ class NasdaqNews:
     @staticmethod
     def rss_feed(ticker, timestamps=False) -> list:
         url = f"https://www.nasdaq.com/feed/rssoutbound?symbol={ticker}"
-        response = requests.get(url=url, headers=utils.HEADERS).text
+        response = utils.get(url=url, headers=utils.HEADERS).text
         soup = BeautifulSoup(response, "lxml")
         tags = soup.find_all("item")
         
@@ -433,7 +433,7 @@ class SANews:
     @staticmethod
     def rss_feed(ticker, timestamps=False) -> list:
         url = f"https://seekingalpha.com/api/sa/combined/{ticker}.xml"
-        response = requests.get(url=url, headers=utils.HEADERS).text
+        response = utils.get(url=url, headers=utils.HEADERS).text
         soup = BeautifulSoup(response, "lxml")
         tags = soup.find_all("item")
         
@@ -624,9 +624,8 @@ class WSJNews:
             page_counter += 1
             url = f"{cls._base_url}{key}?page={page_counter}"
 
-            retry = True
-            while retry:
-                html = requests.get(url=url, headers=utils.HEADERS).text
+            for attempt in range(utils.RETRY_ATTEMPTS):
+                html = utils.get(url=url, headers=utils.HEADERS).text
                 soup = BeautifulSoup(html, "lxml")
 
                 tag_section = soup.find("div", {"id": "latest-stories"})
@@ -637,7 +636,10 @@ class WSJNews:
                 tags = tag_section.find_all("article")
 
                 if len(tags) != 0:
-                    retry = False
+                    break
+                time.sleep(utils.backoff(attempt))
+            else:
+                raise utils.DatasetError(f"Could not retrieve page {page_counter} of section '{section}'")
             
             for tag in tags:
                 if len(tag.find_all("div", recursive=False)) == 2:
@@ -708,7 +710,7 @@ class WSJNews:
         elif section == "Lifestyle":
             url = url.format("RSSLifestyle")
         
-        response = requests.get(url=url, headers=utils.HEADERS).text
+        response = utils.get(url=url, headers=utils.HEADERS).text
         soup = BeautifulSoup(response, "lxml")
         tags = soup.find_all("item")
 
@@ -1,13 +1,49 @@
+import asyncio
 from bs4 import BeautifulSoup
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 import datetime as dt
+import gzip
+import json
+from lxml import etree
+import mmap
+import numpy as np
+import os
 import pandas as pd
-import requests
+from pathlib import Path
 import re
+import sqlite3
+from tempfile import TemporaryFile
+import threading
+import time
 from typing import Union
+from zipfile import ZipFile
 from . import utils
 
 NoneType = type(None)
 
+_SEARCH_URL = "https://efts.sec.gov/LATEST/search-index"
+_SEARCH_PAGE_SIZE = 100 # hits per page of the full-text search
+_SEARCH_MAX_HITS = 10_000 # the full-text search does not return hits beyond this offset
+_ARCHIVE_URL = "https://www.sec.gov/Archives/edgar"
+_SUBMISSIONS_URL = "https://data.sec.gov/submissions"
+_XBRL_URL = "https://data.sec.gov/api/xbrl"
+
+INDEX_PATH = Path.home() / ".cache" / "findata" / "edgar" / "index.sqlite"
+INDEX_REFRESH_INTERVAL = 60 * 60 # seconds between two checks for new daily indices of the current quarter
+_index = None
+
+SUBMISSIONS_PATH = Path.home() / ".cache" / "findata" / "edgar" / "submissions.sqlite"
+SUBMISSIONS_REFRESH_INTERVAL = 60 * 60 # seconds between two requests for the submissions of the same entity
+_submissions = None
+
+COMPANYFACTS_URL = f"{_ARCHIVE_URL}/daily-index/xbrl/companyfacts.zip"
+COMPANYFACTS_PATH = Path.home() / ".cache" / "findata" / "edgar" / "companyfacts"
+
+RESOLVER_PATH = Path.home() / ".cache" / "findata" / "edgar" / "tickers.json"
+_resolver = None
+_resolver_lock = threading.Lock()
+
 
 def sec_companies() -> list:
     """
@@ -28,7 +64,7 @@ def sec_companies() -> list:
         name : str
             The name of the entity
     """
-    items = requests.get("https://www.sec.gov/files/company_tickers.json", headers=utils.HEADERS_FAKE).json()
+    items = utils.get("https://www.sec.gov/files/company_tickers.json", headers=utils.HEADERS_FAKE, ttl=utils.CACHE_TTL["sec_tickers"]).json()
     items = [
         {
             "cik": item["cik_str"],
@@ -60,7 +96,7 @@ def sec_mutualfunds() -> list:
         entity_cik : int
             The CIK of the issuing entity
     """
-    items = requests.get("https://www.sec.gov/files/company_tickers_mf.json", headers=utils.HEADERS_FAKE).json()["data"]
+    items = utils.get("https://www.sec.gov/files/company_tickers_mf.json", headers=utils.HEADERS_FAKE, ttl=utils.CACHE_TTL["sec_tickers"]).json()["data"]
     items = [
         {
             "ticker": item[3].replace("(", "").replace(")", "").upper() if item[3] not in ("", "N/A") else None,
@@ -73,6 +109,135 @@ def sec_mutualfunds() -> list:
     return items
 
 
+def cik_resolver() -> "CIKResolver":
+    """
+    Returns the process-wide CIKResolver that all SEC functions and classes use to resolve tickers.
+    The resolver loads the lists again as soon as they are older than its refresh interval, also in long-running processes.
+    """
+    global _resolver
+    if _resolver is None:
+        with _resolver_lock:
+            if _resolver is None:
+                _resolver = CIKResolver()
+    return _resolver
+
+
+class CIKResolver:
+    """
+    CIKResolver maps tickers to CIKs, CIKs to tickers and mutual fund class and series CIKs to their issuing entity.
+    The company and mutual fund lists of the SEC are downloaded once and stored on disk, so that new processes resolve tickers
+    without a request until the stored lists are older than the refresh interval.
+
+    Parameters
+    ----------------------
+    path : str or Path (optional)
+        The path of the JSON file that stores the lists, by default ~/.cache/findata/edgar/tickers.json
+    ttl : int (optional)
+        The number of seconds after which the lists are downloaded again, by default CACHE_TTL["sec_tickers"]
+
+    Methods
+    ----------------------
+    cik : int, str or None
+        The CIK of a company ticker or the series CIK of a mutual fund ticker
+    tickers : list of str
+        The tickers of a company CIK or of a mutual fund class or series CIK
+    entity : dict or None
+        The series and entity CIK of a mutual fund class or series CIK
+    refresh : None
+        Downloads the lists again and rebuilds the indexes
+    """
+    def __init__(self, path=None, ttl: int = None) -> None:
+        self._path = Path(RESOLVER_PATH if path is None else path)
+        self._ttl = utils.CACHE_TTL["sec_tickers"] if ttl is None else ttl
+        self._lock = threading.Lock()
+
+    def cik(self, ticker: str, mutualfunds: bool = True) -> Union[int, str, None]:
+        """
+        Returns the CIK of a company ticker. If no company has the ticker and mutualfunds is True,
+        the series CIK of the mutual fund class with the ticker is returned instead.
+        """
+        self._load()
+        ticker = ticker.upper()
+        cik = self._companies_by_ticker.get(ticker)
+        if cik is None and mutualfunds:
+            cik = self._series_by_ticker.get(ticker)
+        return cik
+
+    def tickers(self, cik: Union[int, str]) -> list:
+        """
+        Returns the tickers of a company CIK or of all classes of a mutual fund series or class CIK.
+        """
+        self._load()
+        if isinstance(cik, str) and re.match(r"(S|C)[0-9]{9}", cik.upper()):
+            return list(self._tickers_by_fund.get(cik.upper(), []))
+        return list(self._tickers_by_cik.get(int(cik), []))
+
+    def entity(self, cik: str) -> Union[dict, None]:
+        """
+        Returns a dict with the series_cik and entity_cik of a mutual fund class or series CIK.
+        """
+        self._load()
+        return self._entities.get(cik.upper())
+
+    def refresh(self) -> None:
+        with self._lock:
+            companies, mutualfunds = sec_companies(), sec_mutualfunds()
+            self._build(companies, mutualfunds, self._store(companies, mutualfunds))
+
+    def _is_loaded(self) -> bool:
+        # the lists in memory expire like the stored lists, so long-running processes pick up new tickers as well
+        return hasattr(self, "_companies_by_ticker") and time.time() - self._created <= self._ttl
+
+    def _load(self) -> None:
+        if self._is_loaded():
+            return
+        with self._lock:
+            if self._is_loaded():
+                return
+            try:
+                stored = json.loads(self._path.read_text())
+                if time.time() - stored["created"] > self._ttl:
+                    raise ValueError
+                companies, mutualfunds, created = stored["companies"], stored["mutualfunds"], stored["created"]
+            except (OSError, ValueError, KeyError):
+                companies, mutualfunds = sec_companies(), sec_mutualfunds()
+                created = self._store(companies, mutualfunds)
+            self._build(companies, mutualfunds, created)
+
+    def _store(self, companies: list, mutualfunds: list) -> float:
+        created = time.time()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._path.with_name(f"{self._path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_text(json.dumps({"created": created, "companies": companies, "mutualfunds": mutualfunds}))
+        os.replace(temp_path, self._path)
+        return created
+
+    def _build(self, companies: list, mutualfunds: list, created: float) -> None:
+        companies_by_ticker, tickers_by_cik = {}, {}
+        for item in companies:
+            # the first entry of a ticker is kept, as the SEC lists the primary listing of a company first
+            companies_by_ticker.setdefault(item["ticker"], item["cik"])
+            tickers_by_cik.setdefault(item["cik"], []).append(item["ticker"])
+
+        series_by_ticker, tickers_by_fund, entities = {}, {}, {}
+        for item in mutualfunds:
+            entity = {"series_cik": item["series_cik"], "entity_cik": item["entity_cik"]}
+            entities[item["class_cik"]] = entity
+            entities.setdefault(item["series_cik"], entity)
+            if item["ticker"] is not None:
+                series_by_ticker.setdefault(item["ticker"], item["series_cik"])
+                tickers_by_fund.setdefault(item["class_cik"], []).append(item["ticker"])
+                tickers_by_fund.setdefault(item["series_cik"], []).append(item["ticker"])
+
+        self._tickers_by_cik = tickers_by_cik
+        self._series_by_ticker = series_by_ticker
+        self._tickers_by_fund = tickers_by_fund
+        self._entities = entities
+        self._created = created
+        # assigned last, as _load checks for this attribute
+        self._companies_by_ticker = companies_by_ticker
+
+
 def latest_sec_filings(start=pd.to_datetime("today").isoformat(), timestamps=False) -> list:
     """
     latest_sec_filings returns a list of the latest sec filings that were filed with the SEC.
@@ -118,7 +283,7 @@ def latest_sec_filings(start=pd.to_datetime("today").isoformat(), timestamps=Fal
             "start": page_counter,
             "count": 100
         }
-        html = requests.get(url="https://www.sec.gov/cgi-bin/browse-edgar", params=params, headers=utils.HEADERS_FAKE).text
+        html = utils.get(url="https://www.sec.gov/cgi-bin/browse-edgar", params=params, headers=utils.HEADERS_FAKE).text
         soup = BeautifulSoup(html, "lxml")
         tables = soup.find_all("table")
         if len(tables) != 8:
@@ -215,8 +380,129 @@ def sec_filings(
             The file number of the filing
         film_number : int
             The film number of the filing
+
+    If the local filing index is enabled (see enable_index), filings of CIKs and tickers are looked up in the index instead,
+    which only requests the index files that are not yet stored. Filings filed before the start date of the index are still searched. Filings found in the index have no date of period, file number and film number.
+    If the submissions store is enabled instead (see enable_submissions), filings of CIKs and tickers are looked up in the store,
+    which only requests the filings filed since the last update of the entity.
+    """
+    return list(iter_sec_filings(cik=cik, ticker=ticker, form_types=form_types, start=start, end=end))
+
+
+def iter_sec_filings(
+    cik=None,
+    ticker=None,
+    form_types=None,
+    start="1900-01-01",
+    end=pd.to_datetime("today").date().isoformat(),
+    max_workers=4
+):
     """
-    base_url = "https://efts.sec.gov/LATEST/search-index"
+    Generator version of sec_filings that yields the filings page by page as they arrive, see sec_filings for the parameters and return values.
+    The first page of the full-text search reports the total number of filings, the remaining pages are then requested
+    concurrently by max_workers threads under the SEC rate limit. Timeframes with more filings than the search returns
+    for a single query are split into shorter timeframes.
+    """
+    params = _sec_filings_parameters(cik, ticker, form_types, start, end)
+    if _index is not None and _index._covers(params):
+        _index.update(start, end)
+        yield from _index._query(params)
+        # the index only holds filings from its start date on, so earlier filings are still searched
+        if pd.to_datetime(params["startdt"]) < _index._start:
+            end = min(pd.to_datetime(params["enddt"]), _index._start - pd.Timedelta(days=1))
+            yield from _iter_search({**params, "enddt": end.date().isoformat()}, max_workers)
+        return
+    if _submissions is not None and _submissions._covers(params):
+        _submissions.update(int(params["entityName"]))
+        yield from _submissions._query(params)
+        return
+    yield from _iter_search(params, max_workers)
+
+
+async def sec_filings_async(
+    cik=None,
+    ticker=None,
+    form_types=None,
+    start="1900-01-01",
+    end=pd.to_datetime("today").date().isoformat()
+) -> list:
+    """
+    Asynchronous version of sec_filings, see there for the parameters and return values.
+    Like sec_filings, the enabled local filing index or submissions store is used for filings of CIKs and tickers.
+    """
+    params = _sec_filings_parameters(cik, ticker, form_types, start, end)
+    if (_index is not None and _index._covers(params)) or (_submissions is not None and _submissions._covers(params)):
+        # the local backends are synchronous, so they run in a thread to not block the event loop
+        return await asyncio.to_thread(sec_filings, cik, ticker, form_types, start, end)
+    return await _search_async(params)
+
+
+def _iter_search(params: dict, max_workers: int):
+    first_page = _search_page(params, 0)
+    total = first_page["hits"]["total"]
+    timeframes = _split_timeframe(params, total)
+    if timeframes is not None:
+        for timeframe in timeframes:
+            yield from _iter_search(timeframe, max_workers)
+        return
+
+    yield from _parse_sec_filings(first_page["hits"]["hits"])
+    offsets = range(_SEARCH_PAGE_SIZE, min(total["value"], _SEARCH_MAX_HITS), _SEARCH_PAGE_SIZE)
+    if len(offsets) != 0:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for page in pool.map(lambda offset: _search_page(params, offset), offsets):
+                yield from _parse_sec_filings(page["hits"]["hits"])
+
+
+async def _search_async(params: dict) -> list:
+    first_page = await _search_page_async(params, 0)
+    total = first_page["hits"]["total"]
+    timeframes = _split_timeframe(params, total)
+    if timeframes is not None:
+        filings = []
+        for timeframe_filings in await asyncio.gather(*(_search_async(timeframe) for timeframe in timeframes)):
+            filings.extend(timeframe_filings)
+        return filings
+
+    offsets = range(_SEARCH_PAGE_SIZE, min(total["value"], _SEARCH_MAX_HITS), _SEARCH_PAGE_SIZE)
+    pages = [first_page, *await asyncio.gather(*(_search_page_async(params, offset) for offset in offsets))]
+    return [filing for page in pages for filing in _parse_sec_filings(page["hits"]["hits"])]
+
+
+def _search_page(params: dict, offset: int) -> dict:
+    if offset != 0:
+        params = {**params, "from": offset}
+    return utils.post(_SEARCH_URL, json=params, headers=utils.HEADERS_FAKE).json()
+
+
+async def _search_page_async(params: dict, offset: int) -> dict:
+    if offset != 0:
+        params = {**params, "from": offset}
+    response = await utils.async_post(_SEARCH_URL, json=params, headers=utils.HEADERS_FAKE)
+    return response.json()
+
+
+def _split_timeframe(params: dict, total: dict) -> Union[tuple, None]:
+    """
+    Returns the parameters of the later and the earlier half of the timeframe if the search has more hits than it returns, and None else.
+    If a single day has more hits than the search returns, the timeframe cannot be split any further and a DatasetError is raised.
+    """
+    if total["value"] < _SEARCH_MAX_HITS and total.get("relation", "eq") == "eq":
+        return None
+    start, end = pd.to_datetime(params["startdt"]), pd.to_datetime(params["enddt"])
+    if start >= end:
+        raise utils.DatasetError(
+            f'The full-text search returns at most {_SEARCH_MAX_HITS} filings, but more filings were filed on {start.date().isoformat()}. '
+            "Restrict the search to specific form types or an entity"
+        )
+    middle = start + (end - start) // 2
+    return (
+        {**params, "startdt": (middle + pd.Timedelta(days=1)).date().isoformat(), "enddt": end.date().isoformat()},
+        {**params, "startdt": start.date().isoformat(), "enddt": middle.date().isoformat()}
+    )
+
+
+def _sec_filings_parameters(cik, ticker, form_types, start, end) -> dict:
     params = {
         "startdt": start,
         "enddt": end
@@ -235,23 +521,18 @@ def sec_filings(
     elif isinstance(cik, int):
         params["entityName"] = f"{cik:010}"
     elif isinstance(ticker, str):
-        if utils._companies is None:
-            utils._companies = sec_companies()
-        cik = [item["cik"] for item in utils._companies if item["ticker"] == ticker]
-        if cik == []:
-            if utils._mutualfunds is None:
-                utils._mutualfunds = sec_mutualfunds()
-            cik = [item["series_cik"] for item in utils._mutualfunds if item["ticker"] == ticker]
-            if cik == []:
-                raise ValueError(f'Could not find a corresponding CIK to the ticker "{ticker}".')
-            else:
-                cik = cik[0]
-                params["q"] = cik
+        cik = cik_resolver().cik(ticker)
+        if cik is None:
+            raise ValueError(f'Could not find a corresponding CIK to the ticker "{ticker}".')
+        elif isinstance(cik, str):
+            params["q"] = cik
         else:
-            cik = cik[0]
             params["entityName"] = f"{cik:010}"
+    return params
 
-    files = requests.post(base_url, json=params, headers=utils.HEADERS_FAKE).json()["hits"]["hits"]
+
+@utils.instrumented
+def _parse_sec_filings(files) -> list:
     filings = []
     for file in files:
         info = file["_source"]
@@ -274,10 +555,588 @@ def sec_filings(
     return filings
 
 
+def fetch_filings(filings, form_class=None, max_workers=8, processes=None, rate_limit=None):
+    """
+    fetch_filings downloads and parses many filings concurrently and yields each filing as soon as it is parsed.
+    The documents are downloaded by a pool of threads under the SEC rate limit and parsed by a pool of processes.
+    A filing that cannot be downloaded or parsed is yielded with its error instead of aborting the batch.
+
+    Parameters
+    ----------------------
+    filings : list
+        The filings as returned by sec_filings or latest_sec_filings, or a list of document urls
+    form_class : type (optional)
+        The filing class the documents are parsed with (e.g. Filing4).
+        If None, the class is chosen by the form type of each filing
+    max_workers : int
+        The maximum number of concurrent downloads
+    processes : int (optional)
+        The number of processes that parse the documents, by default the number of CPUs.
+        If 0, the documents are parsed by the download threads instead
+    rate_limit : float (optional)
+        The maximum number of downloads per second if it should be lower than the SEC limit of 10 requests per second
+
+    Returns
+    ----------------------
+    generator of dicts
+        filing : dict or str
+            The filing as given in filings
+        data : _SECFiling or None
+            The parsed filing or None if it could not be downloaded or parsed
+        error : Exception or None
+            The error raised while downloading or parsing the filing, None if there was none
+    """
+    limiter = None if rate_limit is None else utils.RateLimiter(rate_limit)
+    filings = iter(filings)
+    download_pool = ThreadPoolExecutor(max_workers=max_workers)
+    parse_pool = download_pool if processes == 0 else ProcessPoolExecutor(max_workers=processes)
+    pending = {}
+
+    def submit_download():
+        # at most twice as many documents as there are download threads are held in memory at once
+        filing = next(filings, None)
+        if filing is not None:
+            pending[download_pool.submit(_download_filing, filing, form_class, limiter)] = (filing, "download")
+
+    try:
+        for _ in range(2 * max_workers):
+            submit_download()
+        while len(pending) != 0:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                filing, stage = pending.pop(future)
+                if stage == "download":
+                    submit_download()
+                try:
+                    result = future.result()
+                except Exception as error:
+                    yield {"filing": filing, "data": None, "error": error}
+                    continue
+                if stage == "download":
+                    pending[parse_pool.submit(_parse_filing, *result)] = (filing, "parse")
+                else:
+                    yield {"filing": filing, "data": result, "error": None}
+    finally:
+        for future in pending:
+            future.cancel()
+        download_pool.shutdown(wait=True, cancel_futures=True)
+        parse_pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _document_url(filing) -> str:
+    if isinstance(filing, str):
+        return filing
+    url = filing["document_url"] if "document_url" in filing else filing["url"]
+    return url.replace("-index.htm", ".txt")
+
+
+def _form_class(filing) -> type:
+    form_type = filing if isinstance(filing, str) else filing.get("type", filing.get("form_type"))
+    form_classes = {
+        "3": Filing3,
+        "4": Filing4,
+        "5": Filing5,
+        "SC 13D": Filing13D,
+        "SC 13G": Filing13G,
+        "13F-HR": Filing13F,
+        "NPORT-P": FilingNPORT,
+        "10-K": Filing10K,
+        "10-Q": Filing10Q
+    }
+    if not isinstance(form_type, str) or form_type.replace("/A", "") not in form_classes:
+        raise ValueError(f'No filing class for form type "{form_type}", form_class has to be given')
+    return form_classes[form_type.replace("/A", "")]
+
+
+def _download_filing(filing, form_class, limiter) -> tuple:
+    if form_class is None:
+        form_class = _form_class(filing)
+    url = _document_url(filing)
+    if limiter is not None:
+        limiter.acquire()
+    return form_class, _SECFiling._from_url(url)
+
+
+def _parse_filing(form_class: type, file: str):
+    return form_class(file=file)
+
+
+def enable_index(path=None, start="1993-01-01"):
+    """
+    Enables the local filing index, which sec_filings then uses to look up filings of CIKs and tickers.
+    Only filings filed on or after start are kept in the index, as the index of all quarters since 1993 takes up several gigabytes.
+    """
+    global _index
+    _index = SECIndex(path=path, start=start)
+    return _index
+
+
+def disable_index() -> None:
+    global _index
+    _index = None
+
+
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS filings (
+    cik INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    form_type TEXT NOT NULL,
+    date_filed TEXT NOT NULL,
+    accession_number TEXT NOT NULL,
+    PRIMARY KEY (cik, accession_number)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS filings_cik_date ON filings (cik, date_filed);
+CREATE INDEX IF NOT EXISTS filings_form_date ON filings (form_type, date_filed);
+CREATE TABLE IF NOT EXISTS sources (
+    name TEXT PRIMARY KEY,
+    loaded REAL NOT NULL
+);
+"""
+
+
+class SECIndex:
+    """
+    SECIndex keeps the EDGAR master index of all filings in a local SQLite database, so that filings can be looked up without a request to the SEC.
+    Quarters that have ended are downloaded once from the quarterly master index files. The current quarter is loaded from the daily
+    master index files, of which only those that have been published since the last update are downloaded.
+
+    Parameters
+    ----------------------
+    path : str or Path (optional)
+        The path of the database file, by default ~/.cache/findata/edgar/index.sqlite
+    start : str
+        The ISO-8601 date from which on filings are kept in the index
+
+    Methods
+    ----------------------
+    update : int
+        Downloads the index files of a timeframe that are not yet stored and returns the number of new filings
+    filings : list of dicts
+        The filings of an entity, of specific form types and within a given timeframe in the format of sec_filings
+    """
+    def __init__(self, path=None, start="1993-01-01") -> None:
+        self._path = Path(INDEX_PATH if path is None else path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._start = max(pd.to_datetime(start), pd.to_datetime("1993-01-01"))
+        with self._connect() as connection:
+            connection.executescript(_INDEX_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(self._path, timeout=60)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def update(self, start="1993-01-01", end=pd.to_datetime("today").date().isoformat()) -> int:
+        """
+        Downloads the index files between the start and the end date that are not yet stored and returns the number of new filings.
+        """
+        today = pd.to_datetime("today")
+        start = max(pd.to_datetime(start), self._start)
+        end = min(pd.to_datetime(end), today)
+        if start > end:
+            return 0
+
+        with self._connect() as connection:
+            sources = dict(connection.execute("SELECT name, loaded FROM sources").fetchall())
+
+        count = 0
+        for period in pd.period_range(start, end, freq="Q"):
+            quarter = f"{period.year}/QTR{period.quarter}"
+            if f"full-index/{quarter}" in sources:
+                continue
+            if (period.year, period.quarter) < (today.year, today.quarter):
+                count += self._load(f"full-index/{quarter}", f"{_ARCHIVE_URL}/full-index/{quarter}/master.gz")
+            elif time.time() - sources.get(f"daily-index/{quarter}", 0) > INDEX_REFRESH_INTERVAL:
+                # the quarterly index of the current quarter changes every day, so only the new daily indices are loaded
+                response = utils.get(f"{_ARCHIVE_URL}/daily-index/{quarter}/index.json", headers=utils.HEADERS_FAKE)
+                if response.status_code == 404:
+                    continue
+                for item in response.json()["directory"]["item"]:
+                    name = f"daily-index/{quarter}/{item['name']}"
+                    if re.fullmatch(r"master\.[0-9]{8}\.idx", item["name"]) and name not in sources:
+                        count += self._load(name, f"{_ARCHIVE_URL}/{name}")
+                with self._connect() as connection:
+                    connection.execute("INSERT OR REPLACE INTO sources VALUES (?, ?)", (f"daily-index/{quarter}", time.time()))
+        return count
+
+    def _load(self, name: str, url: str) -> int:
+        response = utils.get(url, headers=utils.HEADERS_FAKE)
+        if response.status_code != 200:
+            raise utils.DatasetError(f'Could not retrieve the index file "{url}"')
+        content = response.content
+        if content[:2] == b"\x1f\x8b":
+            content = gzip.decompress(content)
+        rows = _parse_master_index(content.decode("latin-1"))
+        with self._connect() as connection:
+            changes = connection.total_changes
+            connection.executemany("INSERT OR IGNORE INTO filings VALUES (?, ?, ?, ?, ?)", rows)
+            count = connection.total_changes - changes
+            connection.execute("INSERT OR REPLACE INTO sources VALUES (?, ?)", (name, time.time()))
+        return count
+
+    def filings(
+        self,
+        cik=None,
+        ticker=None,
+        form_types=None,
+        start="1900-01-01",
+        end=pd.to_datetime("today").date().isoformat()
+    ) -> list:
+        """
+        Returns the stored filings of a specific entity, of specific form types and within a given timeframe in the format of sec_filings.
+        The index is not updated, see the update method.
+        """
+        params = _sec_filings_parameters(cik, ticker, form_types, start, end)
+        if not self._covers(params):
+            raise ValueError("The filing index can only be searched by the CIK of an entity, not by mutual fund series, classes or names")
+        return self._query(params)
+
+    def _covers(self, params: dict) -> bool:
+        return "q" not in params and params.get("entityName", "0").isdigit()
+
+    def _query(self, params: dict) -> list:
+        query = "SELECT cik, form_type, date_filed, accession_number FROM filings WHERE date_filed BETWEEN ? AND ?"
+        arguments = [pd.to_datetime(params["startdt"]).date().isoformat(), pd.to_datetime(params["enddt"]).date().isoformat()]
+        if "entityName" in params:
+            query += " AND cik = ?"
+            arguments.append(int(params["entityName"]))
+        if "forms" in params:
+            query += f" AND form_type IN ({', '.join('?' * len(params['forms']))})"
+            arguments.extend(params["forms"])
+        query += " ORDER BY date_filed DESC, accession_number DESC"
+
+        with self._connect() as connection:
+            rows = connection.execute(query, arguments).fetchall()
+
+        filings = []
+        for cik, form_type, date_filed, accession_number in rows:
+            filing_url = f"{_ARCHIVE_URL}/data/{cik}/{accession_number.replace('-', '')}/{accession_number}-index.htm"
+            filings.append(
+                {
+                    "type": form_type,
+                    "filing_url": filing_url,
+                    "document_url": filing_url.replace("-index.htm", ".txt"),
+                    "date_filed": date_filed,
+                    "date_of_period": None,
+                    "accession_number": accession_number,
+                    "file_number": None,
+                    "film_number": None
+                }
+            )
+        return filings
+
+
+@utils.instrumented
+def _parse_master_index(text: str) -> list:
+    """
+    Returns the entries of a master index file (CIK|Company Name|Form Type|Date Filed|Filename) as tuples of the columns of the filings table.
+    """
+    rows = []
+    lines = text.splitlines()
+    separator = next((index for index, line in enumerate(lines) if line.startswith("-----")), len(lines))
+    for line in lines[separator+1:]:
+        fields = line.split("|")
+        if len(fields) < 5:
+            continue
+        # company names can contain the separator as well
+        cik, name, form_type, date_filed, filename = fields[0], "|".join(fields[1:-3]), fields[-3], fields[-2], fields[-1]
+        if len(date_filed) == 8:
+            date_filed = f"{date_filed[:4]}-{date_filed[4:6]}-{date_filed[6:]}"
+        accession_number = filename.rsplit("/", 1)[-1].replace(".txt", "")
+        rows.append((int(cik), name, form_type, date_filed, accession_number))
+    return rows
+
+
+def enable_submissions(path=None):
+    """
+    Enables the local submissions store, which sec_filings then uses to look up filings of CIKs and tickers if the filing index is not enabled.
+    """
+    global _submissions
+    _submissions = SECSubmissions(path=path)
+    return _submissions
+
+
+def disable_submissions() -> None:
+    global _submissions
+    _submissions = None
+
+
+_SUBMISSIONS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS filings (
+    cik INTEGER NOT NULL,
+    accession_number TEXT NOT NULL,
+    form_type TEXT NOT NULL,
+    date_filed TEXT NOT NULL,
+    date_of_period TEXT,
+    file_number TEXT,
+    film_number INTEGER,
+    PRIMARY KEY (cik, accession_number)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS filings_cik_date ON filings (cik, date_filed);
+CREATE TABLE IF NOT EXISTS entities (
+    cik INTEGER PRIMARY KEY,
+    watermark TEXT,
+    updated REAL NOT NULL
+);
+"""
+
+
+class SECSubmissions:
+    """
+    SECSubmissions keeps the filings of entities from the EDGAR submissions API (data.sec.gov/submissions) in a local SQLite database.
+    The first update of an entity loads all of its filings including the paginated older files. Later updates only store the filings
+    filed on or after the watermark, i.e. the latest filing date stored for the entity, and only request older files if the recent
+    filings do not reach back to the watermark.
+
+    Parameters
+    ----------------------
+    path : str or Path (optional)
+        The path of the database file, by default ~/.cache/findata/edgar/submissions.sqlite
+
+    Methods
+    ----------------------
+    update : int
+        Requests the filings of an entity that are newer than the watermark and returns the number of new filings
+    filings : list of dicts
+        The filings of an entity, of specific form types and within a given timeframe in the format of sec_filings
+    """
+    def __init__(self, path=None) -> None:
+        self._path = Path(SUBMISSIONS_PATH if path is None else path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.executescript(_SUBMISSIONS_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(self._path, timeout=60)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def update(self, cik: int, force: bool = False) -> int:
+        """
+        Requests the filings of an entity that were filed on or after the watermark and returns the number of new filings.
+        Entities that were updated less than SUBMISSIONS_REFRESH_INTERVAL seconds ago are skipped unless force is True.
+        """
+        cik = int(cik)
+        with self._connect() as connection:
+            entity = connection.execute("SELECT watermark, updated FROM entities WHERE cik = ?", (cik,)).fetchone()
+        watermark, updated = entity if entity is not None else (None, 0)
+        if not force and time.time() - updated < SUBMISSIONS_REFRESH_INTERVAL:
+            return 0
+
+        response = utils.get(f"{_SUBMISSIONS_URL}/CIK{cik:010}.json", headers=utils.HEADERS_FAKE)
+        if response.status_code == 404:
+            raise ValueError(f'Could not find the submissions of the CIK "{cik}".')
+        elif response.status_code != 200:
+            raise utils.DatasetError(f'Could not retrieve the submissions of the CIK "{cik}"')
+        filings = response.json()["filings"]
+        rows = _parse_submissions(cik, filings["recent"], watermark)
+
+        # the recent filings only cover the last year or the last 1000 filings, older filings are split into separate files
+        recent_dates = filings["recent"]["filingDate"]
+        if watermark is None or (len(recent_dates) != 0 and min(recent_dates) > watermark):
+            for file in filings.get("files", []):
+                if watermark is not None and file["filingTo"] < watermark:
+                    continue
+                response = utils.get(f"{_SUBMISSIONS_URL}/{file['name']}", headers=utils.HEADERS_FAKE)
+                if response.status_code != 200:
+                    raise utils.DatasetError(f'Could not retrieve the submissions file "{file["name"]}"')
+                rows.extend(_parse_submissions(cik, response.json(), watermark))
+
+        with self._connect() as connection:
+            changes = connection.total_changes
+            connection.executemany("INSERT OR IGNORE INTO filings VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            count = connection.total_changes - changes
+            watermark = max([row[3] for row in rows], default=watermark)
+            connection.execute("INSERT OR REPLACE INTO entities VALUES (?, ?, ?)", (cik, watermark, time.time()))
+        return count
+
+    def filings(
+        self,
+        cik=None,
+        ticker=None,
+        form_types=None,
+        start="1900-01-01",
+        end=pd.to_datetime("today").date().isoformat()
+    ) -> list:
+        """
+        Updates the stored filings of an entity and returns its filings of specific form types and within a given timeframe in the format of sec_filings.
+        """
+        params = _sec_filings_parameters(cik, ticker, form_types, start, end)
+        if not self._covers(params):
+            raise ValueError("The submissions can only be searched by the CIK of an entity, not by mutual fund series, classes or names")
+        self.update(int(params["entityName"]))
+        return self._query(params)
+
+    def _covers(self, params: dict) -> bool:
+        return "q" not in params and params.get("entityName", "").isdigit()
+
+    def _query(self, params: dict) -> list:
+        query = (
+            "SELECT cik, accession_number, form_type, date_filed, date_of_period, file_number, film_number FROM filings "
+            "WHERE cik = ? AND date_filed BETWEEN ? AND ?"
+        )
+        arguments = [
+            int(params["entityName"]),
+            pd.to_datetime(params["startdt"]).date().isoformat(),
+            pd.to_datetime(params["enddt"]).date().isoformat()
+        ]
+        if "forms" in params:
+            query += f" AND form_type IN ({', '.join('?' * len(params['forms']))})"
+            arguments.extend(params["forms"])
+        query += " ORDER BY date_filed DESC, accession_number DESC"
+
+        with self._connect() as connection:
+            rows = connection.execute(query, arguments).fetchall()
+
+        filings = []
+        for cik, accession_number, form_type, date_filed, date_of_period, file_number, film_number in rows:
+            filing_url = f"{_ARCHIVE_URL}/data/{cik}/{accession_number.replace('-', '')}/{accession_number}-index.htm"
+            filings.append(
+                {
+                    "type": form_type,
+                    "filing_url": filing_url,
+                    "document_url": filing_url.replace("-index.htm", ".txt"),
+                    "date_filed": date_filed,
+                    "date_of_period": date_of_period,
+                    "accession_number": accession_number,
+                    "file_number": file_number,
+                    "film_number": film_number
+                }
+            )
+        return filings
+
+
+def _parse_submissions(cik: int, columns: dict, watermark: str = None) -> list:
+    """
+    Returns the filings of the column-oriented filing lists of the submissions API as tuples of the columns of the filings table.
+    Only filings filed on or after the watermark are returned.
+    """
+    rows = []
+    for accession_number, form_type, date_filed, date_of_period, file_number, film_number in zip(
+        columns["accessionNumber"],
+        columns["form"],
+        columns["filingDate"],
+        columns["reportDate"],
+        columns["fileNumber"],
+        columns["filmNumber"]
+    ):
+        if watermark is not None and date_filed < watermark:
+            continue
+        rows.append(
+            (
+                cik,
+                accession_number,
+                form_type,
+                date_filed,
+                date_of_period or None,
+                file_number or None,
+                int(film_number) if film_number.isdigit() else None
+            )
+        )
+    return rows
+
+
+_DOCUMENT_HEADER = re.compile(r"<(TYPE|SEQUENCE|FILENAME|DESCRIPTION)>([^\n<]*)")
+_HEADER_ROLES = {"FILER", "FILED BY", "SUBJECT COMPANY", "REPORTING-OWNER", "ISSUER"}
+_HEADER_BLOCKS = {"COMPANY DATA", "OWNER DATA", "FILING VALUES", "BUSINESS ADDRESS", "MAIL ADDRESS", "FORMER COMPANY"}
+# expected format of the values, including the tabs that align them after the key
+_HEADER_FIELDS = {
+    key: re.compile(pattern) for key, pattern in {
+        "PUBLIC DOCUMENT COUNT": r"\t{2}([0-9]+)",
+        "ACCESSION NUMBER": r"\t{2}([0-9\-]+)",
+        "CONFORMED SUBMISSION TYPE": r"\t(.+)",
+        "FILED AS OF DATE": r"\t{2}([0-9]{8})",
+        "CONFORMED PERIOD OF REPORT": r"\t([0-9]{8})",
+        "DATE AS OF CHANGE": r"\t{2}([0-9]{8})",
+        "EFFECTIVENESS DATE": r"\t{2}([0-9]{8})",
+        "GROUP MEMBERS": r"\t{2}(.+)",
+        "SEC FILE NUMBER": r"\t([0-9\-]+)",
+        "FILM NUMBER": r"\t{2}([0-9\-]+)",
+        "COMPANY CONFORMED NAME": r"\t{3}(.+)",
+        "CENTRAL INDEX KEY": r"\t{3}([0-9]+)",
+        "STANDARD INDUSTRIAL CLASSIFICATION": r"\t([^\[0-9]+)\[([0-9]+)\]",
+        "IRS NUMBER": r"\t{4}([0-9]+)",
+        "STATE OF INCORPORATION": r"\t{3}([A-Z]{2})",
+        "FISCAL YEAR END": r"\t{3}([0-9]{4})",
+        "FORMER CONFORMED NAME": r"\t(.+)",
+        "DATE OF NAME CHANGE": r"\t([0-9]{8})",
+        "STREET 1": r"\t{2}(.*)",
+        "STREET 2": r"\t{2}(.*)",
+        "CITY": r"\t{3}(.+)",
+        "STATE": r"\t{3}(.+)",
+        "ZIP": r"\t{3}(.+)",
+        "BUSINESS PHONE": r"\t{2}(.+)"
+    }.items()
+}
+
+
+@utils.instrumented
+def _tokenize_header(header: str) -> tuple:
+    """
+    Splits the header into its "KEY:<tabs>VALUE" lines in a single scan and returns the lines and the entity sections.
+    The lines are returned as a list of (key, value) tuples in the order of the header. Entity sections are dicts with the role, the first value
+    of each key from the role line to the next role line and the (name, values) tuples of its blocks (e.g. the business address).
+    Values keep the tabs that separate them from the key, as the fields are validated by their alignment.
+    """
+    lines = [line.lstrip("\t ").partition(":") for line in header.split("\n")]
+    lines = [(key, value) for key, separator, value in lines if separator]
+    entities = []
+    entity_values = None
+    block_values = None
+    for key, value in lines:
+        if key in _HEADER_ROLES and not value.strip():
+            entity_values = {}
+            block_values = None
+            entities.append({"role": key, "values": entity_values, "blocks": []})
+        elif entity_values is None:
+            continue
+        elif key in _HEADER_BLOCKS and not value.strip():
+            block_values = {}
+            entities[-1]["blocks"].append((key, block_values))
+            entity_values.setdefault(key, value)
+        else:
+            entity_values.setdefault(key, value)
+            if block_values is not None:
+                block_values.setdefault(key, value)
+    return lines, entities
+
+
+def _header_field(values: dict, key: str) -> Union[str, tuple, None]:
+    """
+    Returns the value of a key if it has the expected format and None else. Fields with several parts are returned as a tuple.
+    """
+    value = values.get(key)
+    if value is None:
+        return None
+    match = _HEADER_FIELDS[key].match(value)
+    if match is None:
+        return None
+    return match.group(1) if match.re.groups == 1 else match.groups()
+
+
+def _header_date(value: str) -> Union[str, None]:
+    """
+    Converts a YYYYMMDD header date into an ISO date string.
+    """
+    if value is None:
+        return None
+    return dt.date(year=int(value[:4]), month=int(value[4:6]), day=int(value[6:8])).isoformat()
+
+
 class _SECFiling:
     """
     _SECFiling is the parent class of all SEC filing classes. Hence, each filing class, irrespective of the form type, has the attributes provided by _SECFiling.
     The base class governs the splitting of the file into the header section and the document section and extracts all of the header information.
+    Filings are created from the file string, the path of a local file, the file url or a cik and a date. Local files are memory-mapped,
+    so only the header and the sub-documents that are parsed are read from disk.
 
     The header section contains file-related information such as the date and what entites are involved and how they are related.
     There are four different entity roles: filer, subject company, reporting owner and issuer. Every form type has specific entity roles
@@ -299,6 +1158,8 @@ class _SECFiling:
         The document that consists of all the form-specific information
     document_count: int
         The document number of the filing / how many filings the entity had submitted before + 1
+    documents: list
+        The type, sequence, filename, description and offsets in the file of each sub-document of the filing
     effectiveness_date: str
         The ISO-8601 effectiveness date of the
     file: str
@@ -320,17 +1181,25 @@ class _SECFiling:
 
     Methods
     -----------------------
-    None
+    document(name: str) -> str
+        Returns the text of the sub-document with the given filename or type
+    document_url(name: str) -> str
+        Returns the archive url of the sub-document with the given filename or type
     """
-    session = requests.Session()
+    # number of characters of the document that are passed to the XML parser at once
+    _chunk_size = 2**20
 
     def __init__(
         self,
         form_type="all",
         **kwargs
     ) -> None:
+        self._path = None
         if "file" in kwargs:
             file = kwargs["file"]
+        elif "path" in kwargs:
+            self._path = kwargs["path"]
+            file = None
         elif "url" in kwargs:
             file = self._from_url(kwargs["url"])
         elif all(param in kwargs for param in ("cik", "date")):
@@ -348,55 +1217,197 @@ class _SECFiling:
             else:
                 file = self._from_url(filings[0]["document_url"])
         else:
-            raise ValueError("SEC Filing classes have to be called with the file string, the file url or a cik and a filing data")
+            raise ValueError("SEC Filing classes have to be called with the file string, the file path, the file url or a cik and a filing data")
         
-        self._file = file.replace("&nbsp;", " ")
-
-        if "<SEC-HEADER>" in self._file:
-            header_open, header_close = "<SEC-HEADER>", "</SEC-HEADER>"
-        elif "<IMS-HEADER>" in self._file:
-            header_open, header_close = "<IMS-HEADER>", "</IMS-HEADER>"
-        else:
-            raise utils.DatasetError(f"Could not find a header section")
-        self._header = self._file[self._file.find(header_open):self._file.find(header_close)] + header_close
-        self._document = self._file[self._file.find("<DOCUMENT>"):]
-        
-        self._is_html = True if ("<html>" in self._file or "<HTML>" in self._file) else False
-        self._is_xml = True if ("<xml>" in self._file or "<XML>" in self._file) else False
-        
-        file_number = re.findall(r"SEC FILE NUMBER:\t([0-9\-]+)", self._header)
-        if len(file_number) == 0:
-            file_number = None
-        else:
-            self._file_number = file_number[0]
-        
-        film_number = re.findall(r"FILM NUMBER:\t{2}([0-9\-]+)", self._header)
-        if len(film_number) == 0:
-            film_number = None
-        else:
-            self._film_number = int(film_number[0])
+        # the raw file is kept as it is, entities such as &nbsp; are only replaced in the parts of the file that are read.
+        # Local files are only mapped while they are read, so the file is None for them otherwise
+        self._file = file
+
+        with self._mapped():
+            if self._find("<SEC-HEADER>") != -1:
+                header_open, header_close = "<SEC-HEADER>", "</SEC-HEADER>"
+            elif self._find("<IMS-HEADER>") != -1:
+                header_open, header_close = "<IMS-HEADER>", "</IMS-HEADER>"
+            else:
+                raise utils.DatasetError(f"Could not find a header section")
+            self._header = (self._read(self._find(header_open), self._find(header_close)) + header_close).replace("&nbsp;", " ")
+            
+            self._is_html = self._find("<html>") != -1 or self._find("<HTML>") != -1
+            self._is_xml = self._find("<xml>") != -1 or self._find("<XML>") != -1
         
         self._parse_header()
 
+    def __getstate__(self) -> dict:
+        # the parse trees are only needed while the document is parsed and are often nested too deeply to be pickled,
+        # which is necessary to return filings from the worker processes of fetch_filings
+        return {key: value for key, value in self.__dict__.items() if not isinstance(value, BeautifulSoup)}
+
+    @contextmanager
+    def _mapped(self):
+        """
+        Maps a local file into memory for the reads inside the block, so only the parts of the file that are read have to be loaded.
+        Outside of such blocks each read maps the file on its own and filings that are kept around do not hold a file descriptor.
+        """
+        if self._path is None or self._file is not None:
+            yield
+            return
+        with open(self._path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            self._file = mapped
+            try:
+                yield
+            finally:
+                self._file = None
+
+    def _find(self, text: str, start: int = 0) -> int:
+        """
+        Returns the offset of the first occurrence of the text in the raw file after start or -1 if the text does not occur.
+        """
+        with self._mapped():
+            if isinstance(self._file, str):
+                return self._file.find(text, start)
+            return self._file.find(text.encode("utf-8"), start)
+
+    def _read(self, start: int, end: int = None) -> str:
+        """
+        Returns the raw file between the offsets. Local files are only decoded between the offsets,
+        as UTF-8 or as Latin-1 if the bytes are no valid UTF-8.
+        """
+        with self._mapped():
+            if isinstance(self._file, str):
+                return self._file[start:end]
+            raw = self._file[start:end]
+        try:
+            return raw.decode("utf-8")
+        except UnicodeDecodeError as error:
+            if error.reason != "unexpected end of data":
+                return raw.decode("latin-1")
+            # the range ends within a multi-byte character, which is left out
+            return raw[:error.start].decode("utf-8")
+
+    @property
+    def _document(self) -> str:
+        """
+        Returns the document section of all sub-documents, which is only read from the file when a subclass first parses it.
+        """
+        if not hasattr(self, "_document_text"):
+            self._document_text = self._read(self._find("<DOCUMENT>")).replace("&nbsp;", " ")
+        return self._document_text
+
+    @_document.setter
+    def _document(self, document: str) -> None:
+        self._document_text = document
+
+    @property
+    def _document_bounds(self) -> list:
+        """
+        Returns the offsets of each <DOCUMENT> block in the raw file as a list of (start, end) tuples.
+        """
+        if not hasattr(self, "_bounds"):
+            self._bounds = []
+            with self._mapped():
+                start = self._find("<DOCUMENT>")
+                while start != -1:
+                    end = self._find("</DOCUMENT>", start)
+                    end = len(self._file) if end == -1 else end + len("</DOCUMENT>")
+                    self._bounds.append((start, end))
+                    start = self._find("<DOCUMENT>", end)
+        return self._bounds
+
+    def _sub_document(self, index: int, size: int = None) -> str:
+        """
+        Returns the text of a single <DOCUMENT> block, only that block is read and has its entities replaced.
+        If size is given, only the first size characters of the block are read, e.g. to look at the <TYPE> and <FILENAME> lines.
+        """
+        start, end = self._document_bounds[index]
+        if size is not None:
+            end = min(end, start + size)
+        return self._read(start, end).replace("&nbsp;", " ")
+
+    def _find_document(self, name: str) -> int:
+        """
+        Returns the index of the first sub-document with the given filename or type. If no sub-document matches, raise a ValueError instead.
+        """
+        for index, document in enumerate(self.documents):
+            if name in (document["filename"], document["type"]):
+                return index
+        raise ValueError(f'No document with filename or type "{name}" in filing "{self._accession_number}"')
+
+    def document(self, name: str) -> str:
+        """
+        Returns the text between the <TEXT> tags of the first sub-document with the given filename or type (e.g. "EX-21").
+        Only that sub-document is read from the file.
+        """
+        text = self._sub_document(self._find_document(name))
+        start = text.find("<TEXT>")
+        end = text.rfind("</TEXT>")
+        if start == -1:
+            return ""
+        return text[start + len("<TEXT>"):end if end != -1 else len(text)].strip("\r\n")
+
+    def document_url(self, name: str) -> str:
+        """
+        Returns the archive url of the first sub-document with the given filename or type.
+        The document can be downloaded on its own from that url, which avoids downloading the full submission for a single exhibit.
+        """
+        filename = self.documents[self._find_document(name)]["filename"]
+        if filename is None:
+            raise ValueError(f'The document "{name}" of filing "{self._accession_number}" has no filename')
+        # some subclasses replace the list of filers with the only filer, e.g. FilingNPORT
+        entities = []
+        for entity in (self._filer, self._issuer, self._subject_company, self._reporting_owner):
+            if isinstance(entity, dict):
+                entities.append(entity)
+            elif entity is not None:
+                entities.extend(entity)
+        cik = next((entity["cik"] for entity in entities if entity.get("cik") is not None), None)
+        if cik is None:
+            raise utils.DatasetError(f'Filing "{self._accession_number}" has no entity with a CIK')
+        return f"{_ARCHIVE_URL}/data/{cik}/{self._accession_number.replace('-', '')}/{filename}"
+
     @classmethod
     def _from_url(cls, url: str) -> str:
         """
         Takes the document url, retrieves the document file from the web and returns it. If the document file does not exist, raise a DatasetError instead.
         """
-        file = cls.session.get(
+        file = utils.get(
             url=url,
-            headers=utils.HEADERS_FAKE
+            headers=utils.HEADERS_FAKE,
+            ttl=utils.CACHE_TTL["sec_archive"] if "/Archives/edgar/" in url else None
         ).text
         if "<Message>The specified key does not exist.</Message>" in file:
             raise utils.DatasetError(f'No filing exists for url "{url}"')
         return file
 
+    @classmethod
+    async def _from_url_async(cls, url: str) -> str:
+        """
+        Asynchronous version of _from_url.
+        """
+        response = await utils.async_get(
+            url=url,
+            headers=utils.HEADERS_FAKE,
+            ttl=utils.CACHE_TTL["sec_archive"] if "/Archives/edgar/" in url else None
+        )
+        file = response.text
+        if "<Message>The specified key does not exist.</Message>" in file:
+            raise utils.DatasetError(f'No filing exists for url "{url}"')
+        return file
+
+    @classmethod
+    async def from_url_async(cls, url: str):
+        """
+        Retrieves the document file without blocking the event loop and returns the parsed filing.
+        Parsing itself happens synchronously once the file has arrived.
+        """
+        return cls(file=await cls._from_url_async(url))
+
     def _check_amendment(self) -> bool:
         """
         Returns True if the form type ends with /A and is hence an amendment to another filing and False else.
         """
         return True if self.submission_type.endswith("/A") else False
         
+    @utils.instrumented
     def _parse_header(self) -> None:
         """
         Splits the header section into subsections of each entity role and parses the respective role if it exists.
@@ -405,170 +1416,82 @@ class _SECFiling:
         Some documents only have a filer entity (e.g. Form 10-K), some documents have filer and subject entities (e.g. Form 13D) and some have
         reporting owner and issuer entities (e.g. Form 4).
         """
-        self._document_count = int(re.findall(r"PUBLIC DOCUMENT COUNT:\t{2}([0-9]+)", self._header)[0])
-        self._accession_number = re.findall(r"ACCESSION NUMBER:\t{2}([0-9\-]+)", self._header)[0]
-        self._submission_type = re.findall(r"CONFORMED SUBMISSION TYPE:\t(.+)", self._header)[0]
+        self._header_lines, entities = _tokenize_header(self._header)
+        values = dict(reversed(self._header_lines))
+        # former names are listed for every entity as soon as any entity of the header has a former name
+        self._has_former_names = "FORMER COMPANY" in values
+
+        self._document_count = int(_header_field(values, "PUBLIC DOCUMENT COUNT"))
+        self._accession_number = _header_field(values, "ACCESSION NUMBER")
+        self._submission_type = _header_field(values, "CONFORMED SUBMISSION TYPE")
         self._is_amendment = self._check_amendment()
-        
-        date_filed = re.findall(r"FILED AS OF DATE:\t{2}([0-9]{8})", self._header)[0]
-        date_filed = dt.date(
-            year=int(date_filed[:4]),
-            month=int(date_filed[4:6]),
-            day=int(date_filed[6:8])
-        ).isoformat()
-        self._date_filed = date_filed
-        
-        date_of_period = re.findall(r"CONFORMED PERIOD OF REPORT:\t([0-9]{8})", self._header)
-        if len(date_of_period) == 0:
-            date_of_period = None
-        else:
-            date_of_period = date_of_period[0]
-            date_of_period = dt.date(
-                year=int(date_of_period[:4]),
-                month=int(date_of_period[4:6]),
-                day=int(date_of_period[6:8])
-            ).isoformat()
-        self._date_of_period = date_of_period
-
-        date_of_change = re.findall(r"DATE AS OF CHANGE:\t{2}([0-9]{8})", self._header)
-        if len(date_of_change) == 0:
-            date_of_change = None
-        else:
-            date_of_change = date_of_change[0]
-            date_of_change = dt.date(
-                year=int(date_of_change[:4]),
-                month=int(date_of_change[4:6]),
-                day=int(date_of_change[6:8])
-            ).isoformat()
-            self._date_of_change = date_of_change
-
-        effectiveness_date = re.findall(r"EFFECTIVENESS DATE:\t{2}([0-9]{8})", self._header)
-        if len(effectiveness_date) == 0:
-            effectiveness_date = None
-        else:
-            effectiveness_date = effectiveness_date[0]
-            effectiveness_date = dt.date(
-                year=int(effectiveness_date[:4]),
-                month=int(effectiveness_date[4:6]),
-                day=int(effectiveness_date[6:8])
-            ).isoformat()
-        self._effectiveness_date = effectiveness_date
-        
-        indices = []
-        
-        filer_indices = [item.start() for item in re.finditer(r"FILER:", self._header)]
-        if len(filer_indices) == 0:
-            filer_indices = [item.start() for item in re.finditer(r"FILED BY:", self._header)]
-        
-        for index in filer_indices:
-            indices.append(index)
-        
-        subject_index = self._header.find("SUBJECT COMPANY:") 
-        if subject_index != -1:
-            indices.append(subject_index)
-        
-        reporting_owner_indices = [item.start() for item in re.finditer(r"REPORTING-OWNER:", self._header)]
-        for index in reporting_owner_indices:
-            indices.append(index)
-        
-        issuer_index = self._header.find("ISSUER:")
-        if issuer_index != -1:
-            indices.append(issuer_index)
-        
-        indices = sorted(indices)
-        
-        self._filer = self._parse_header_subsection(filer_indices, indices)
-        self._subject_company = self._parse_header_subsection(subject_index, indices)
-        self._reporting_owner = self._parse_header_subsection(reporting_owner_indices, indices)
-        self._issuer = self._parse_header_subsection(issuer_index, indices)
-    
-    def _parse_header_subsection(self, index: Union[int, list], indices: list) -> Union[list, dict, None]:
-        """
-        Takes the start and end indices of the section of an entity role as a parameter and parses and returns the section of that entity role.
-        """
-        if isinstance(index, list):
-            data = []
-            if len(index) != 0:
-                for item in index:
-                    if indices.index(item)+1 == len(indices):
-                        subsection = self._header[item:]
-                    else:
-                        subsection = self._header[item:indices[indices.index(item)+1]]
-                    data.append(self._parse_entity_data(subsection))
-            else:
-                data = None
-        else:
-            if index != -1:
-                if indices.index(index)+1 == len(indices):
-                    subsection = self._header[index:]
-                else:
-                    subsection = self._header[index:indices[indices.index(index)+1]]
-                data = self._parse_entity_data(subsection)
-            else:
-                data = None           
-        
-        return data
-    
-    def _parse_entity_data(self, section: str) -> dict:
+
+        self._date_filed = _header_date(_header_field(values, "FILED AS OF DATE"))
+        self._date_of_period = _header_date(_header_field(values, "CONFORMED PERIOD OF REPORT"))
+        self._date_of_change = _header_date(_header_field(values, "DATE AS OF CHANGE"))
+        self._effectiveness_date = _header_date(_header_field(values, "EFFECTIVENESS DATE"))
+
+        self._file_number = _header_field(values, "SEC FILE NUMBER")
+        film_number = _header_field(values, "FILM NUMBER")
+        self._film_number = None if film_number is None else int(film_number)
+
+        filers = [entity for entity in entities if entity["role"] == "FILER"]
+        if len(filers) == 0:
+            filers = [entity for entity in entities if entity["role"] == "FILED BY"]
+        subject_company = next((entity for entity in entities if entity["role"] == "SUBJECT COMPANY"), None)
+        reporting_owners = [entity for entity in entities if entity["role"] == "REPORTING-OWNER"]
+        issuer = next((entity for entity in entities if entity["role"] == "ISSUER"), None)
+
+        self._filer = [self._parse_entity_data(entity) for entity in filers] if len(filers) != 0 else None
+        self._subject_company = self._parse_entity_data(subject_company) if subject_company is not None else None
+        self._reporting_owner = [self._parse_entity_data(entity) for entity in reporting_owners] if len(reporting_owners) != 0 else None
+        self._issuer = self._parse_entity_data(issuer) if issuer is not None else None
+
+    def _parse_entity_data(self, entity: dict) -> dict:
         """
         Parses entity-related data and returns a dictionary of structured data.
         """
+        values = entity["values"]
+
+        name = _header_field(values, "COMPANY CONFORMED NAME").strip()
+        cik = int(_header_field(values, "CENTRAL INDEX KEY"))
         
-        name = re.findall(r"COMPANY CONFORMED NAME:\t{3}(.+)", section)[0]
-        name = name.strip()
-        
-        cik = int(re.findall(r"CENTRAL INDEX KEY:\t{3}([0-9]+)", section)[0])
-        
-        sic = re.findall(r"STANDARD INDUSTRIAL CLASSIFICATION:\t{1}([^\[0-9]+)\[([0-9]+)\]", section)
-        if len(sic) == 0:
+        sic = _header_field(values, "STANDARD INDUSTRIAL CLASSIFICATION")
+        if sic is None:
             sic_name, sic_code = None, None
         else:
-            sic_name, sic_code = sic[0]
+            sic_name, sic_code = sic
             sic_name = sic_name.strip()
             if sic_name == "":
                 sic_name = None
             sic_code = int(sic_code)
         
-        irs = re.findall(r"IRS NUMBER:\t{4}([0-9]+)", section)
-        if len(irs) == 0:
-            irs = None
-        else:
-            irs = int(irs[0])
+        irs = _header_field(values, "IRS NUMBER")
+        if irs is not None:
+            irs = int(irs)
         
-        state = re.findall(r"STATE OF INCORPORATION:\t{3}([A-Z]{2})", section)
-        if len(state) == 0:
-            state = None
-        else:
-            state = state[0].strip()
+        state = _header_field(values, "STATE OF INCORPORATION")
         
-        fiscal_year_end = re.findall(r"FISCAL YEAR END:\t{3}([0-9]{4})", section)
-        if len(fiscal_year_end) == 0:
-            fiscal_year_end = None
-        else:
-            month = int(fiscal_year_end[0][:2])
-            day = int(fiscal_year_end[0][2:])
+        fiscal_year_end = _header_field(values, "FISCAL YEAR END")
+        if fiscal_year_end is not None:
             fiscal_year_end = {
-                "month": month,
-                "day": day
+                "month": int(fiscal_year_end[:2]),
+                "day": int(fiscal_year_end[2:])
             }
         
-        business_address, mail_address = self._parse_addresses(section)
+        business_address, mail_address = self._parse_addresses(entity)
         
-        if self._header.find("FORMER COMPANY:") == -1:
+        if not self._has_former_names:
             former_names = None
         else:
-            former_names = re.findall(r"FORMER CONFORMED NAME:\t(.+)\n\s+DATE OF NAME CHANGE:\t([0-9]{8})", section)
-            former_names = [
-                {
-                    "name": item[0],
-                    "date_of_change": dt.date(
-                                        year=int(item[1][:4]),
-                                        month=int(item[1][4:6]),
-                                        day=int(item[1][6:8])
-                                    ).isoformat()
-                }
-                for item in former_names
-            ]
+            former_names = []
+            for block, block_values in entity["blocks"]:
+                if block != "FORMER COMPANY":
+                    continue
+                former_name = _header_field(block_values, "FORMER CONFORMED NAME")
+                date_of_change = _header_field(block_values, "DATE OF NAME CHANGE")
+                if former_name is not None and date_of_change is not None:
+                    former_names.append({"name": former_name, "date_of_change": _header_date(date_of_change)})
         
         data = {
             "name": name,
@@ -587,90 +1510,82 @@ class _SECFiling:
         
         return data
     
-    def _parse_addresses(self, section) -> tuple:
+    def _parse_addresses(self, entity: dict) -> tuple:
         """
         Parses the address sections and returns a tuple of dictionaries of business and mail address data.
         """
-        business_index = section.find("BUSINESS ADDRESS:")
-        mail_index = section.find("MAIL ADDRESS:")
-        
-        if business_index == -1 and mail_index == -1:
-            return None, None
-        
-        if business_index == -1:
-            business_section = None
-            mail_section = section[mail_index:]
-        elif mail_index == -1:
-            business_section = section[business_index:]
-            mail_section = None
-        elif business_index < mail_index:
-            business_section = section[business_index:mail_index]
-            mail_section = section[mail_index:]
-        elif business_index > mail_index:
-            business_section = section[business_section:]
-            mail_section = section[mail_section:business_section]
-        
-        if business_section is None:
-            business_address = None
+        blocks = dict(reversed(entity["blocks"]))
+
+        if "BUSINESS ADDRESS" in blocks:
+            business_address = self._parse_single_address(blocks["BUSINESS ADDRESS"])
         else:
-            business_address = self._parse_single_address(business_section)
+            business_address = None
         
-        if mail_section is None:
-            mail_address = None
-        else:
-            mail_address = self._parse_single_address(mail_section)
+        if "MAIL ADDRESS" in blocks:
+            mail_address = self._parse_single_address(blocks["MAIL ADDRESS"])
             del mail_address["phone"]
+        else:
+            mail_address = None
         
         return business_address, mail_address
     
-    def _parse_single_address(self, section) -> dict:
+    def _parse_single_address(self, values: dict) -> dict:
         """
         Returns the data of a specific address, either the business of the mail address.
         """
-        if "STREET 1:" in section:
-            street1 = re.findall(r"STREET 1:\t{2}(.*)", section)[0]
-        else:
-            street1 = None
-        
-        if "STREET 2:" in section:
-            street2 = re.findall(r"STREET 2:\t{2}(.*)", section)[0]
-        else:
-            street2 = None
-        
-        if "CITY:" in section:
-            city = re.findall(r"CITY:\t{3}(.+)", section)[0]
-        else:
-            city = None
-        
-        if "STATE:" in section:
-            state = re.findall(r"STATE:\t{3}(.+)", section)[0]
-        else:
-            state = None
-        
-        if "ZIP:" in section:
-            zip_ = re.findall(r"ZIP:\t{3}(.+)", section)
-            try:
-                zip_ = int(zip_[0])
-            except ValueError:
-                zip_ = None
-        else:
+        zip_ = _header_field(values, "ZIP")
+        try:
+            zip_ = int(zip_)
+        except (TypeError, ValueError):
             zip_ = None
         
-        if "BUSINESS PHONE:" in section:
-            phone = re.findall(r"BUSINESS PHONE:\t{2}(.+)", section)[0].upper()
-        else:
-            phone = None
+        phone = _header_field(values, "BUSINESS PHONE")
+        if phone is not None:
+            phone = phone.upper()
 
         address = {
-            "street1": street1,
-            "street2": street2,
-            "city": city,
-            "state": state,
+            "street1": _header_field(values, "STREET 1"),
+            "street2": _header_field(values, "STREET 2"),
+            "city": _header_field(values, "CITY"),
+            "state": _header_field(values, "STATE"),
             "zip": zip_,
             "phone": phone
         }
         
         return address
+
+    def _iter_xml_elements(self, name: str):
+        """
+        Yields the elements with the given lowercase tag name from the XML documents of the filing as soon as they have been read.
+        The documents are passed to an lxml parser in chunks and each element is cleared after it has been processed,
+        so memory usage does not grow with the size of the documents.
+        """
+        for xml_open in re.finditer(r"<XML>\s*", self._document, re.IGNORECASE):
+            xml_close = re.compile(r"</XML>", re.IGNORECASE).search(self._document, xml_open.end())
+            start, end = xml_open.end(), xml_close.start() if xml_close is not None else len(self._document)
+            parser = etree.XMLPullParser(events=("end",), recover=True, huge_tree=True)
+            for position in range(start, end, self._chunk_size):
+                parser.feed(self._document[position:min(position + self._chunk_size, end)])
+                for _, element in parser.read_events():
+                    if element.tag.rpartition("}")[2].lower() != name:
+                        continue
+                    yield element
+                    element.clear()
+                    while element.getprevious() is not None:
+                        del element.getparent()[0]
+            parser.close()
+
+    def _strip_xml_element(self, name: str) -> str:
+        """
+        Returns the document without the first element with the given tag name, e.g. a section that is streamed separately by _iter_xml_elements.
+        """
+        element_open = re.search(rf"<(\w+:)?{name}[\s>]", self._document, re.IGNORECASE)
+        if element_open is None:
+            return self._document
+        element_close = re.compile(rf"</(\w+:)?{name}>", re.IGNORECASE).search(self._document, element_open.start())
+        if element_close is None:
+            return self._document
+        return self._document[:element_open.start()] + self._document[element_close.end():]
     
     @property
     def accession_number(self) -> str:
@@ -707,6 +1622,34 @@ class _SECFiling:
         """
         return self._document_count
 
+    @property
+    def documents(self) -> list:
+        """
+        Returns the type, sequence, filename and description of each <DOCUMENT> block of the filing, together with its start and end offset in the file.
+        Only the first lines of each block are read. The offsets are byte offsets for filings read from a path and character offsets for file strings.
+        Both only coincide for ASCII files, so HTTP range requests of the submission need the byte offsets of a filing read from a path.
+        """
+        if not hasattr(self, "_documents"):
+            self._documents = []
+            with self._mapped():
+                heads = [self._sub_document(index, size=1024) for index in range(len(self._document_bounds))]
+            for head, (start, end) in zip(heads, self._document_bounds):
+                if "<TEXT>" in head:
+                    head = head[:head.find("<TEXT>")]
+                values = dict(_DOCUMENT_HEADER.findall(head))
+                sequence = values.get("SEQUENCE", "").strip()
+                self._documents.append(
+                    {
+                        "type": values.get("TYPE", "").strip() or None,
+                        "sequence": int(sequence) if sequence.isdigit() else None,
+                        "filename": values.get("FILENAME", "").strip() or None,
+                        "description": values.get("DESCRIPTION", "").strip() or None,
+                        "start": start,
+                        "end": end
+                    }
+                )
+        return self._documents
+
     @property
     def effectiveness_date(self) -> str:
         """
@@ -808,6 +1751,7 @@ class Filing3(_SECFiling):
         assert len(self.reporting_owner) != 0
         assert self.issuer is not None
 
+    @utils.instrumented
     def _parse_document(self) -> None:
         if not self.is_xml:
             raise NotImplementedError("Filing 3 classes can only be called on XML compliant files")
@@ -1165,12 +2109,14 @@ class Filing4(Filing3):
                 "name": self._transaction_codes[direction_abbr]
             }
 
-            shares_owned = holding.find("posttransactionamounts").find("sharesownedfollowingtransaction")
             shares = amount.find("transactionshares")
             if shares is not None:
                 shares = int(shares.find("value").text.replace(".", ""))
+
+            shares_owned = holding.find("posttransactionamounts").find("sharesownedfollowingtransaction")
+            if shares_owned is not None:
                 post_transaction_owned = {
-                    "value": shares,
+                    "value": int(shares_owned.find("value").text.replace(".", "")),
                     "type": {
                         "abbr": "SH",
                         "name": "Shares"
@@ -1204,7 +2150,7 @@ class Filing4(Filing3):
                         "swap_involved": swap_involved,
                         "footnote_id": footnote_id
                     },
-                    "post_transaction_owned": shares_owned,
+                    "post_transaction_owned": post_transaction_owned,
                     "direction": direction,
                     "ownership_type": ownership_type
                 }
@@ -1413,6 +2359,7 @@ class Filing13G(_SECFiling):
     def __repr__(self) -> str:
         return f"Filing {self.submission_type}(Filer: {self.filer[0]['name']}, Subject: {self.subject_company['name']}, Date: {self.date_filed})"
 
+    @utils.instrumented
     def _parse_document(self) -> None:
         if self.is_html:
             document = BeautifulSoup(self._document).get_text()
@@ -1435,7 +2382,7 @@ class Filing13G(_SECFiling):
                 break
         self._date_of_period = pd.to_datetime(self._date_of_period).date().isoformat()
 
-        self._group_members = re.findall(r"GROUP MEMBERS:\t{2}(.+)", self._header)
+        self._group_members = [match.group(1) for match in map(_HEADER_FIELDS["GROUP MEMBERS"].match, (value for key, value in self._header_lines if key == "GROUP MEMBERS")) if match is not None]
 
         if self.is_amendment:
             for match in (
@@ -1597,6 +2544,8 @@ class Filing13F(_SECFiling):
     --------------------------
     aggregate_portfolio : list of dicts
         A list of portfolio holdings that includes holding-specific information in each dictionary. Separately reported holdings with different managers are aggregated.
+    investments_frame : pd.DataFrame
+        The investments as a DataFrame with typed columns, one row per information table entry
     """
     def __init__(self, filing_type="13F-HR", **kwargs):
         super().__init__(filing_type, **kwargs)
@@ -1604,9 +2553,11 @@ class Filing13F(_SECFiling):
         assert self.filer is not None
         self._parse_document()
     
+    @utils.instrumented
     def _parse_document(self) -> None:
         if self.is_xml:
-            self._soup = BeautifulSoup(self._document, "lxml")
+            # the information table makes up most of the document and is streamed separately by _iter_holdings_from_xml
+            self._soup = BeautifulSoup(self._strip_xml_element("informationTable"), "lxml")
             if self.is_amendment:
                 amendment_type = self._soup.find("amendmenttype").text
                 amendment_number = int(self._soup.find("amendmentno").text)
@@ -1640,7 +2591,6 @@ class Filing13F(_SECFiling):
                     }
                     self._other_reporting_managers.append(dct)
             
-            self._investments = self._parse_holdings_from_xml()
             self._other_managers = self._parse_other_managers_from_xml()
             self._signature = self._parse_signature_from_xml()
             self._summary = self._parse_summary_from_xml()
@@ -1726,68 +2676,154 @@ class Filing13F(_SECFiling):
             "included_managers": included_managers
         }
     
-    def _parse_holdings_from_xml(self) -> list:       
-        if "n1:infoTable" in self._document:
-            prefix = "n1:"
-        elif "ns1:infoTable" in self._document:
-            prefix = "ns1:"
-        else:
-            prefix = ""
-        
+    @utils.instrumented
+    def _parse_holdings_from_xml(self) -> list:
+        # the market values of filings before 2023 are reported in thousands
+        scale = 1_000 if pd.to_datetime(self.date_filed) < pd.to_datetime("2023-01-01") else 1
+
         securities = []
-        
-        entries = self._soup.find_all(f"{prefix}infotable")
-        for entry in entries:
-            name = entry.find(f"{prefix}nameofissuer").text
-            title = entry.find(f"{prefix}titleofclass").text
-            cusip = entry.find(f"{prefix}cusip").text
-            market_value = int(float(entry.find(f"{prefix}value").text))
-            if pd.to_datetime(self.date_filed) < pd.to_datetime("2023-01-01"):
-                market_value *= 1_000
-            amount = int(float(entry.find(f"{prefix}sshprnamt").text))
-            amount_type = entry.find(f"{prefix}sshprnamttype").text
+        for entry in self._iter_holdings_from_xml():
+            market_value = int(float(entry["value"])) * scale
             quantity = {
-                "amount": amount,
-                "type": amount_type
+                "amount": int(float(entry["sshprnamt"])),
+                "type": entry["sshprnamttype"]
             }
-            option = entry.find(f"{prefix}putcall")
-            if option is not None:
-                option = option.text
-            investment_discretion = entry.find(f"{prefix}investmentdiscretion").text
-            included_managers = entry.find(f"{prefix}othermanager")
+            included_managers = entry.get("othermanager")
             if included_managers is not None:
-                included_managers = included_managers.text.strip().upper()
+                included_managers = included_managers.strip().upper()
                 if included_managers in ("", "NONE"):
                     included_managers = None
                 else:
                     included_managers = re.findall(r"([0-9]+)", included_managers)
                     included_managers = [int(index[0]) for index in included_managers]
             voting_authority = {
-                "sole" : int(float(entry.find(f"{prefix}sole").text)),
-                "shared": int(float(entry.find(f"{prefix}shared").text)),
-                "none": int(float(entry.find(f"{prefix}none").text))
+                "sole" : int(float(entry["sole"])),
+                "shared": int(float(entry["shared"])),
+                "none": int(float(entry["none"]))
             }
         
             securities.append(
                 {
-                    "name": name,
-                    "title": title,
-                    "cusip": cusip,
+                    "name": entry["nameofissuer"],
+                    "title": entry["titleofclass"],
+                    "cusip": entry["cusip"],
                     "market_value": market_value,
                     "quantity": quantity,
-                    "option": option,
-                    "investment_discretion": investment_discretion,
+                    "option": entry.get("putcall"),
+                    "investment_discretion": entry["investmentdiscretion"],
                     "included_managers": included_managers,
                     "voting_authority": voting_authority
                 }
             )
         
         return securities
-        
+
+    def _iter_holdings_from_xml(self):
+        """
+        Yields each entry of the information table as a dict of the text of its fields, keyed by their lowercase tag names.
+        """
+        for element in self._iter_xml_elements("infotable"):
+            entry = {}
+            for field in element.iterdescendants(etree.Element):
+                entry.setdefault(field.tag.rpartition("}")[2].lower(), field.text or "")
+            yield entry
+
+    def investments_frame(self) -> pd.DataFrame:
+        """
+        Returns the investments as a DataFrame with one row per entry of the information table.
+        In contrast to the investments attribute, the frame is built directly from the XML document without creating a dict per holding,
+        which makes it the faster and more memory-efficient choice to compare the holdings of many filings.
+
+        Returns
+        ----------------------
+        pd.DataFrame
+            name : str
+            title : str
+            cusip : category
+            market_value : int64
+            amount : int64
+            amount_type : category
+            option : category
+            investment_discretion : category
+            voting_sole : Int64
+            voting_shared : Int64
+            voting_none : Int64
+        The voting authority columns are missing (pd.NA) for entries without a voting authority.
+        """
+        if not self.is_xml:
+            raise NotImplementedError("Text file parsing is not implemented yet.")
+
+        scale = 1_000 if pd.to_datetime(self.date_filed) < pd.to_datetime("2023-01-01") else 1
+        fields = {
+            "name": "nameofissuer",
+            "title": "titleofclass",
+            "cusip": "cusip",
+            "market_value": "value",
+            "amount": "sshprnamt",
+            "amount_type": "sshprnamttype",
+            "option": "putcall",
+            "investment_discretion": "investmentdiscretion",
+            "voting_sole": "sole",
+            "voting_shared": "shared",
+            "voting_none": "none"
+        }
+        columns = {column: [] for column in fields}
+        for entry in self._iter_holdings_from_xml():
+            for column, field in fields.items():
+                columns[column].append(entry.get(field))
+
+        frame = pd.DataFrame(
+            {
+                "name": pd.Series(columns["name"], dtype=str),
+                "title": pd.Series(columns["title"], dtype=str),
+                "cusip": pd.Categorical(columns["cusip"]),
+                "market_value": pd.to_numeric(pd.Series(columns["market_value"], dtype=object)).astype("int64") * scale,
+                "amount": pd.to_numeric(pd.Series(columns["amount"], dtype=object)).astype("int64"),
+                "amount_type": pd.Categorical(columns["amount_type"]),
+                "option": pd.Categorical(columns["option"]),
+                "investment_discretion": pd.Categorical(columns["investment_discretion"]),
+                **{
+                    column: np.trunc(pd.to_numeric(pd.Series(columns[column], dtype=object))).astype("Int64")
+                    for column in ("voting_sole", "voting_shared", "voting_none")
+                }
+            }
+        )
+        return frame
+
     def _parse_holdings_from_text(self) -> dict:
         return
     
-    def aggregate_portfolio(self, sorted_by="percentage") -> list:
+    def aggregate_portfolio(self, sorted_by="percentage", as_frame=False) -> Union[list, pd.DataFrame]:
+        """
+        Returns the portfolio holdings with separately reported holdings of the same security (name, title, CUSIP and option) aggregated.
+
+        Parameters
+        ----------------------
+        sorted_by : str or None
+            The variable by which the holdings are sorted, "percentage" by default.
+            If None, the holdings are in the order in which they first appear in the filing.
+        as_frame : bool
+            If True, returns a DataFrame instead of a list of dicts, by default False
+
+        Returns
+        ----------------------
+        list of dicts
+            name : str
+            title : str
+            cusip : str
+            option : str or None
+            percentage : float
+            market_value : int
+            quantity : dict
+                amount : int
+                type : str
+            voting_authority : dict
+                sole : int
+                shared : int
+                none : int
+        or pd.DataFrame with the columns name, title, cusip, option, percentage, market_value,
+        amount, amount_type, voting_sole, voting_shared and voting_none
+        """
         sort_variables = (
             None,
             "name",
@@ -1800,53 +2836,59 @@ class Filing13F(_SECFiling):
         )
         if sorted_by not in (sort_variables):
             raise ValueError(f"sorting variable has to be in {sort_variables}")
-            
-        portfolio = {}
-        for security in self.investments:
-            name = security["name"]
-            title = security["title"]
-            cusip = security["cusip"]
-            option = security["option"]
-            if (name, title, cusip, option) in portfolio:
-                portfolio[(name, title, cusip, option)]["market_value"] += security["market_value"]
-                portfolio[(name, title, cusip, option)]["quantity"]["amount"] += security["quantity"]["amount"]
-                portfolio[(name, title, cusip, option)]["voting_authority"]["sole"] += security["voting_authority"]["sole"]
-                portfolio[(name, title, cusip, option)]["voting_authority"]["shared"] += security["voting_authority"]["shared"]
-                portfolio[(name, title, cusip, option)]["voting_authority"]["none"] += security["voting_authority"]["none"]
-            else:
-                portfolio[(name, title, cusip, option)] = {
-                    "market_value": security["market_value"],
-                    "quantity": security["quantity"],
-                    "investment_discretion": security["investment_discretion"],
-                    "voting_authority": security["voting_authority"]
-                }
-        
-        portfolio_value = sum([security["market_value"] for security in portfolio.values()])
-        no_holdings = len(portfolio)
-        
-        portfolio = [
+
+        if not hasattr(self, "_investments_frame"):
+            self._investments_frame = self.investments_frame()
+        portfolio = self._investments_frame.groupby(["name", "title", "cusip", "option"], sort=False, dropna=False, observed=True).agg(
+            market_value=("market_value", "sum"),
+            amount=("amount", "sum"),
+            amount_type=("amount_type", "first"),
+            investment_discretion=("investment_discretion", "first"),
+            voting_sole=("voting_sole", "sum"),
+            voting_shared=("voting_shared", "sum"),
+            voting_none=("voting_none", "sum")
+        ).reset_index()
+
+        market_values = portfolio["market_value"].tolist()
+        portfolio_value = sum(market_values)
+        if len(portfolio) == 1:
+            portfolio.insert(4, "percentage", [1])
+        else:
+            portfolio.insert(4, "percentage", [round(value / portfolio_value, 4) for value in market_values])
+        portfolio["option"] = portfolio["option"].astype(object).where(portfolio["option"].notna(), None)
+
+        if sorted_by is not None:
+            # sorted is stable in both directions, so equal values keep the order in which they first appear in the filing
+            values = portfolio[sorted_by].tolist()
+            order = sorted(range(len(values)), key=values.__getitem__, reverse=sorted_by in ("market_value", "amount", "percentage"))
+            portfolio = portfolio.iloc[order].reset_index(drop=True)
+        portfolio = portfolio.drop(columns="investment_discretion")
+
+        if as_frame:
+            return portfolio
+
+        return [
             {
                 "name": name,
                 "title": title,
                 "cusip": cusip,
                 "option": option,
-                "percentage": round(float(values["market_value"] / portfolio_value), 4) if no_holdings != 1 else 1,
-                "market_value": values["market_value"],
-                "quantity": values["quantity"],
-                "voting_authority": values["voting_authority"]
+                "percentage": percentage,
+                "market_value": market_value,
+                "quantity": {
+                    "amount": amount,
+                    "type": amount_type
+                },
+                "voting_authority": {
+                    "sole": sole,
+                    "shared": shared,
+                    "none": none
+                }
             }
-            for (name, title, cusip, option), values in portfolio.items()
+            for name, title, cusip, option, percentage, market_value, amount, amount_type, sole, shared, none in zip(
+                *(portfolio[column].tolist() for column in portfolio.columns)
+            )
         ]
-        
-        desc = True if sorted_by in ("market_value", "amount", "percentage") else False
-        
-        if sorted_by is not None:
-            if sorted_by == "amount":
-                portfolio = sorted(portfolio, key=lambda x: x["quantity"][sorted_by], reverse=desc)
-            else:
-                portfolio = sorted(portfolio, key=lambda x: x[sorted_by], reverse=desc)
-        
-        return portfolio
     
     @property
     def amendment_information(self) -> Union[dict, None]:
@@ -1858,6 +2900,8 @@ class Filing13F(_SECFiling):
     
     @property
     def investments(self) -> list:
+        if not hasattr(self, "_investments"):
+            self._investments = self._parse_holdings_from_xml()
         return self._investments
     
     @property
@@ -1877,6 +2921,67 @@ class Filing13F(_SECFiling):
         return self._summary
 
 
+class _XMLNode:
+    """
+    Wraps an lxml element in the subset of the BeautifulSoup interface (find, find_all, get, text and contents)
+    that the NPORT parsing methods use. As with BeautifulSoup's "lxml" parser, tag and attribute names are lowercase.
+    """
+    __slots__ = ("_element",)
+
+    def __init__(self, element) -> None:
+        self._element = element
+
+    @classmethod
+    def from_element(cls, element):
+        """
+        Strips the namespaces from the tag and attribute names of the element and its descendants, lowercases them and returns the wrapped element.
+        """
+        for item in element.iter(etree.Element):
+            item.tag = etree.QName(item).localname.lower()
+            if len(item.attrib) != 0:
+                attributes = {etree.QName(key).localname.lower(): value for key, value in item.attrib.items()}
+                item.attrib.clear()
+                item.attrib.update(attributes)
+        return cls(element)
+
+    def find(self, name: str):
+        element = next(self._element.iterdescendants(name), None)
+        return None if element is None else _XMLNode(element)
+
+    def find_all(self, name: str) -> list:
+        return [_XMLNode(element) for element in self._element.iterdescendants(name)]
+
+    def get(self, key: str, default=None):
+        return self._element.get(key, default)
+
+    @property
+    def name(self) -> str:
+        return self._element.tag
+
+    @property
+    def text(self) -> str:
+        return "".join(self._element.itertext())
+
+    @property
+    def contents(self) -> list:
+        element = self._element
+        contents = [_XMLString(element.text)] if element.text else []
+        for child in element.iterchildren(etree.Element):
+            contents.append(_XMLNode(child))
+            if child.tail:
+                contents.append(_XMLString(child.tail))
+        return contents
+
+
+class _XMLString(str):
+    """
+    Text between the child elements of an _XMLNode, the counterpart of BeautifulSoup's NavigableString.
+    """
+    @property
+    def text(self) -> str:
+        return str(self)
+
+
 class FilingNPORT(_SECFiling):
     """
     FilingNPORT classes extract information from filings of form "NPORT-P" and their amendments "NPORT-P/A".
@@ -1920,6 +3025,8 @@ class FilingNPORT(_SECFiling):
     --------------------------
     portfolio : list of dicts
         A list of all portfolio holdings (long and short) that includes holding-specific information in each dictionary
+    iter_investments : generator of dicts
+        Yields the portfolio holdings one at a time without keeping the parsed document in memory
     """
     _asset_types = {
         "ABS": "Asset-backed securities",
@@ -1994,175 +3101,185 @@ class FilingNPORT(_SECFiling):
     def __repr__(self) -> str:
         return f"{self.submission_type} Filing({self.general_information['series']['cik']}|{self.general_information['series']['name']}|{self.general_information['reporting_date']})"
 
+    @utils.instrumented
     def _parse_document(self) -> None:
         """
         Parse the filing-specific data. If the document is not XML-compliant, raise a NotImplementedError.
         """
         if self.is_xml:
-            self._soup = BeautifulSoup(self._document, "lxml")
+            # the investment section makes up most of the document and is streamed separately by iter_investments
+            self._soup = BeautifulSoup(self._strip_xml_element("invstOrSecs"), "lxml")
             self._general_information = self._parse_general_information()
             self._fund_information = self._parse_fund_information()
-            self._investments = self._parse_investments()
             self._explanatory_notes = self._parse_explanatory_notes()
             self._signature = self._parse_signature()
         else:
             raise NotImplementedError("NPORT Filing classes can only be called on XML-compliant files")
-        
-        self._has_short_positions = True if any(item["amount"]["quantity"] < 0 for item in self._investments if item["amount"]["quantity"] is not None) else False
     
+    @utils.instrumented
     def _parse_investments(self) -> list:
         """
         Returns a list of all holdings in the fund's portfolio.
         Each holding carries general information such as the market value and holding-specific information depending on the security type.
         A sorted list of the investments can be accessed by the .portfolio method.
         """
-        entries = self._soup.find("invstorsecs")
-        if entries is None:
-            return []
-        investments = []
-        for entry in entries.find_all("invstorsec"):
-            issuer_name = entry.find("name").text
-            if issuer_name == "N/A":
-                issuer_name = None
-            issuer_lei = entry.find("lei").text
-            if issuer_lei == "N/A":
-                issuer_lei = None
-            issuer = {
-                "name": issuer_name,
-                "lei": issuer_lei
-            }
-            
-            title = entry.find("title").text
-            if title == "N/A":
-                title = None
+        return list(self.iter_investments())
 
-            identifier = {}
-            cusip = entry.find("cusip").text
-            if cusip != "N/A" and cusip != "0"*9:
-                identifier["cusip"] = cusip
-            other_identifier = entry.find("identifiers")
-            isin = other_identifier.find("isin")
-            if isin is not None:
-                isin_value = isin.get("value")
-                if isin_value is None:
-                    isin_value = isin.text
-                if isin_value == "N/A":
-                    isin_value = None
-                identifier["isin"] = isin_value
-            ticker = other_identifier.find("ticker")
-            if ticker is not None:
-                ticker_value = ticker.get("value")
-                if ticker_value is None:
-                    ticker_value = ticker.text
-                if ticker_value == "N/A":
-                    ticker_value = None  
-                identifier["ticker"] = ticker_value
-            other = other_identifier.find_all("other")
-            for item in other:
-                other_name = item.get("otherdesc").lower()
-                other_value = item.get("value")
-                identifier[other_name] = other_value
-
-            percentage = entry.find("pctval").text
-            percentage = None if percentage == "N/A" else round(float(percentage) / 100, 6)
-            market_value = entry.find("valusd").text
-            market_value = None if market_value == "N/A" else float(market_value)
-            quantity = entry.find("balance").text
-            quantity = None if quantity == "N/A" else float(quantity)
-            quantity_type_abbr = entry.find("units").text
-            if quantity_type_abbr == "N/A" or quantity_type_abbr is None:
-                raise ValueError
-            quantity_type = {"name": self._quantity_types[quantity_type_abbr], "abbr": quantity_type_abbr}
-            
-            currency = entry.find("curcd")
-            if currency is None:
-                currency = entry.find("currencyconditional")
-                currency_name = currency.get("curcd")
-                exchange_rate = currency.get("exchangert")
-                exchange_rate = None if exchange_rate == "N/A" else round(float(exchange_rate), 6)
-            else:
-                currency_name = currency.text
-                exchange_rate = None
-            if currency_name == "N/A":
-                currency_name = None
-            currency = {
-                "abbr": currency_name,
-                "exchange_rate": exchange_rate
+    def iter_investments(self):
+        """
+        Yields the holdings of the fund's portfolio one at a time, in the same format as the .portfolio method.
+        The investment section is read incrementally with lxml and each holding is discarded after it has been parsed,
+        so memory usage does not grow with the number of holdings.
+        """
+        if hasattr(self, "_investments"):
+            yield from self._investments
+            return
+
+        for element in self._iter_xml_elements("invstorsec"):
+            yield self._parse_investment(_XMLNode.from_element(element))
+
+    def _parse_investment(self, entry) -> dict:
+        """
+        Returns the data of a single holding in the fund's portfolio.
+        """
+        issuer_name = entry.find("name").text
+        if issuer_name == "N/A":
+            issuer_name = None
+        issuer_lei = entry.find("lei").text
+        if issuer_lei == "N/A":
+            issuer_lei = None
+        issuer = {
+            "name": issuer_name,
+            "lei": issuer_lei
+        }
+        
+        title = entry.find("title").text
+        if title == "N/A":
+            title = None
+
+        identifier = {}
+        cusip = entry.find("cusip").text
+        if cusip != "N/A" and cusip != "0"*9:
+            identifier["cusip"] = cusip
+        other_identifier = entry.find("identifiers")
+        isin = other_identifier.find("isin")
+        if isin is not None:
+            isin_value = isin.get("value")
+            if isin_value is None:
+                isin_value = isin.text
+            if isin_value == "N/A":
+                isin_value = None
+            identifier["isin"] = isin_value
+        ticker = other_identifier.find("ticker")
+        if ticker is not None:
+            ticker_value = ticker.get("value")
+            if ticker_value is None:
+                ticker_value = ticker.text
+            if ticker_value == "N/A":
+                ticker_value = None  
+            identifier["ticker"] = ticker_value
+        other = other_identifier.find_all("other")
+        for item in other:
+            other_name = item.get("otherdesc").lower()
+            other_value = item.get("value")
+            identifier[other_name] = other_value
+
+        percentage = entry.find("pctval").text
+        percentage = None if percentage == "N/A" else round(float(percentage) / 100, 6)
+        market_value = entry.find("valusd").text
+        market_value = None if market_value == "N/A" else float(market_value)
+        quantity = entry.find("balance").text
+        quantity = None if quantity == "N/A" else float(quantity)
+        quantity_type_abbr = entry.find("units").text
+        if quantity_type_abbr == "N/A" or quantity_type_abbr is None:
+            raise ValueError
+        quantity_type = {"name": self._quantity_types[quantity_type_abbr], "abbr": quantity_type_abbr}
+        
+        currency = entry.find("curcd")
+        if currency is None:
+            currency = entry.find("currencyconditional")
+            currency_name = currency.get("curcd")
+            exchange_rate = currency.get("exchangert")
+            exchange_rate = None if exchange_rate == "N/A" else round(float(exchange_rate), 6)
+        else:
+            currency_name = currency.text
+            exchange_rate = None
+        if currency_name == "N/A":
+            currency_name = None
+        currency = {
+            "abbr": currency_name,
+            "exchange_rate": exchange_rate
+        }
+        
+        amount = {
+            "percentage": percentage,
+            "market_value": market_value,
+            "quantity": quantity,
+            "quantity_type": quantity_type,
+            "currency": currency
+        }
+        
+        payoff_direction = entry.find("payoffprofile").text
+        if payoff_direction == "N/A":
+            payoff_direction = None
+        
+        # asset and issuer type
+        asset_type = entry.find("assetcat")
+        if asset_type is not None:
+            asset_type_abbr = asset_type.text
+            asset_type = {"name": self._asset_types[asset_type_abbr], "abbr": asset_type_abbr}
+        else:
+            asset_type_name = entry.find("assetconditional").get("desc")
+            asset_type = {"name": asset_type_name, "abbr": "OTH"}
+        
+        issuer_type = entry.find("issuercat")
+        if issuer_type is None:
+            issuer["type"] = {
+                "name": entry.find("issuerconditional").get("desc"),
+                "abbr": "OTH"
             }
-            
-            amount = {
-                "percentage": percentage,
-                "market_value": market_value,
-                "quantity": quantity,
-                "quantity_type": quantity_type,
-                "currency": currency
+        else:
+            issuer["type"] = {
+                "name": self._issuer_types[issuer_type.text],
+                "abbr": issuer_type.text
             }
-            
-            payoff_direction = entry.find("payoffprofile").text
-            if payoff_direction == "N/A":
-                payoff_direction = None
-            
-            # asset and issuer type
-            asset_type = entry.find("assetcat")
-            if asset_type is not None:
-                asset_type_abbr = asset_type.text
-                asset_type = {"name": self._asset_types[asset_type_abbr], "abbr": asset_type_abbr}
-            else:
-                asset_type_name = entry.find("assetconditional").get("desc")
-                asset_type = {"name": asset_type_name, "abbr": "OTH"}
-            
-            issuer_type = entry.find("issuercat")
-            if issuer_type is None:
-                issuer["type"] = {
-                    "name": entry.find("issuerconditional").get("desc"),
-                    "abbr": "OTH"
-                }
-            else:
-                issuer["type"] = {
-                    "name": self._issuer_types[issuer_type.text],
-                    "abbr": issuer_type.text
-                }
-            country = entry.find("invcountry").text
-            if country == "N/A":
-                country = None
-            issuer["country"] = country
-            
-            restricted_security = entry.find("isrestrictedsec").text
-            if restricted_security == "Y":
-                restricted_security = True
-            elif restricted_security == "N":
-                restricted_security = False
-            assert isinstance(restricted_security, bool)
-            
-            liquidity_classification = None
-            
-            fair_value_level = entry.find("fairvallevel").text
-            fair_value_level = None if fair_value_level == "N/A" else int(fair_value_level)
-            
-            debt_information = self._get_debt_information(entry)
-            repo_information = self._get_repo_information(entry)
-            derivative_information = self._get_derivative_information(entry)
-            securities_lending = self._get_lending_information(entry)
-            
-            investments.append(
-                {
-                    "issuer": issuer,
-                    "title": title,
-                    "identifier": identifier,
-                    "amount": amount,
-                    "payoff_direction": payoff_direction,
-                    "asset_type": asset_type,
-                    "restricted_security": restricted_security,
-                    "liquidity_classification": liquidity_classification,
-                    "us_gaap_fair_value_hierarchy": fair_value_level,
-                    "debt_information": debt_information,
-                    "repo_information": repo_information,
-                    "derivative_information": derivative_information,
-                    "securities_lending": securities_lending
-                }
-            )
+        country = entry.find("invcountry").text
+        if country == "N/A":
+            country = None
+        issuer["country"] = country
+        
+        restricted_security = entry.find("isrestrictedsec").text
+        if restricted_security == "Y":
+            restricted_security = True
+        elif restricted_security == "N":
+            restricted_security = False
+        assert isinstance(restricted_security, bool)
+        
+        liquidity_classification = None
         
-        return investments
+        fair_value_level = entry.find("fairvallevel").text
+        fair_value_level = None if fair_value_level == "N/A" else int(fair_value_level)
+        
+        debt_information = self._get_debt_information(entry)
+        repo_information = self._get_repo_information(entry)
+        derivative_information = self._get_derivative_information(entry)
+        securities_lending = self._get_lending_information(entry)
+        
+        return {
+            "issuer": issuer,
+            "title": title,
+            "identifier": identifier,
+            "amount": amount,
+            "payoff_direction": payoff_direction,
+            "asset_type": asset_type,
+            "restricted_security": restricted_security,
+            "liquidity_classification": liquidity_classification,
+            "us_gaap_fair_value_hierarchy": fair_value_level,
+            "debt_information": debt_information,
+            "repo_information": repo_information,
+            "derivative_information": derivative_information,
+            "securities_lending": securities_lending
+        }
     
     def _get_debt_information(self, entry) -> Union[dict, None]:
         """
@@ -2828,7 +3945,8 @@ class FilingNPORT(_SECFiling):
             identifier = None if identifier == "N/A" else identifier
 
             description = reference_section.find("narrativedesc")
-            description = None if (description is not None and description.text == "N/A") else description
+            if description is not None:
+                description = None if description.text == "N/A" else description.text
 
             return {
                 "type": "Index",
@@ -3717,6 +4835,9 @@ class FilingNPORT(_SECFiling):
         if sorted_by not in (sort_variables):
             raise ValueError(f"sorting variable has to be in {sort_variables}")
 
+        if not hasattr(self, "_investments"):
+            self._investments = self._parse_investments()
+
         if sorted_by is None:
             portfolio = self._investments
         else:
@@ -3761,6 +4882,8 @@ class FilingNPORT(_SECFiling):
         """
         Returns True if the fund portfolio has at least one holding with negative market value, and False else.
         """
+        if not hasattr(self, "_has_short_positions"):
+            self._has_short_positions = any(item["amount"]["quantity"] < 0 for item in self.portfolio() if item["amount"]["quantity"] is not None)
         return self._has_short_positions
 
     @property
@@ -4170,13 +5293,10 @@ class SECFundamentals:
         elif isinstance(cik, int):
             self._cik = cik
         elif isinstance(ticker, str):
-            if utils._companies is None:
-                utils._companies = sec_companies()
-            companies = utils._companies
-            cik = [item["cik"] for item in companies if item["ticker"] == ticker]
-            if cik == []:
+            cik = cik_resolver().cik(ticker, mutualfunds=False)
+            if cik is None:
                 raise ValueError(f'Could not find a corresponding CIK to the ticker "{ticker}".')
-            self._cik = cik[0]
+            self._cik = cik
         else:
             raise ValueError('Either CIK has to be of type "int" or "str" or ticker has to be of type "str".')
 
@@ -4192,15 +5312,25 @@ class SECFundamentals:
 
     @property
     def data(self) -> dict:
+        if not hasattr(self, "_data"):
+            self._data = self._derive_data()
         return self._data
 
+    @property
+    def facts(self) -> pd.DataFrame:
+        """
+        All US-GAAP facts of the entity in long format with the columns concept, unit, start, end, val, fy, fp, form and filed.
+        Stock variables have no start date.
+        """
+        return self._facts
+
     @property
     def accounting_standard(self) -> str:
         return self._accounting_standard
 
     @property
     def var_keys(self) -> set:
-        return self._var_keys
+        return set(self._concepts)
 
     def get_variable(self, name: str) -> dict:
         if name not in self._popular_variables:
@@ -4220,16 +5350,142 @@ class SECFundamentals:
 
         return data
 
-    def _get_data(self) -> None:
-        self._data = {}
-        self._var_keys = set()
+    @classmethod
+    def frame(cls, concept: str, unit: str, period: str) -> pd.DataFrame:
+        """
+        Returns the value of a concept of all companies for a single calendar period from the frames API of the SEC.
+        Each company contributes the fact whose period is closest to the calendar period, so the values of companies with differing fiscal years are comparable.
+
+        Parameters
+        ----------------------
+        concept : str
+            A US-GAAP concept (e.g. "Revenues") or one of the variable names of get_variable (e.g. "Revenue"), for which all concepts of the variable are combined
+        unit : str
+            The unit of the values (e.g. "USD", "shares" or "USD-per-shares")
+        period : str
+            The calendar year (e.g. "CY2023") or quarter (e.g. "CY2023Q4") of flow variables or the instant at the end of a quarter (e.g. "CY2023Q4I") of stock variables
+
+        Returns
+        ----------------------
+        pd.DataFrame
+            cik : int
+                The CIK of the company
+            name : str
+                The name of the company
+            location : str
+                The location of the company
+            start : str
+                The ISO-8601 start date of the fact, None for stock variables
+            end : str
+                The ISO-8601 end date of the fact
+            value : int or float
+                The value of the fact
+            accession_number : str
+                The accession number of the filing that reported the fact
+            concept : str
+                The US-GAAP concept of the fact
+        """
+        if not re.fullmatch(r"CY[0-9]{4}(Q[1-4]I?)?", period):
+            raise ValueError('The period has to be a calendar year (e.g. "CY2023"), a calendar quarter (e.g. "CY2023Q4") or the instant at the end of a quarter (e.g. "CY2023Q4I")')
+
+        values = {}
+        for key in cls._popular_variables.get(concept, (concept,)):
+            url = f"{_XBRL_URL}/frames/us-gaap/{key}/{unit}/{period}.json"
+            response = utils.get(url=url, headers=utils.HEADERS_FAKE, ttl=utils.CACHE_TTL["sec_frames"])
+            if response.status_code == 404:
+                continue
+            elif response.status_code != 200:
+                raise utils.DatasetError(f'Could not retrieve the frame "{key}/{unit}/{period}"')
+            # like in get_variable, the values of later concepts of a variable replace those of earlier ones
+            for item in response.json()["data"]:
+                values[item["cik"]] = {
+                    "cik": item["cik"],
+                    "name": item["entityName"],
+                    "location": item.get("loc"),
+                    "start": item.get("start"),
+                    "end": item["end"],
+                    "value": item["val"],
+                    "accession_number": item["accn"],
+                    "concept": key
+                }
+
+        columns = ["cik", "name", "location", "start", "end", "value", "accession_number", "concept"]
+        return pd.DataFrame(list(values.values()), columns=columns).sort_values("cik", ignore_index=True)
+
+    @classmethod
+    def bulk_load(cls, source: Union[str, Path] = COMPANYFACTS_URL, directory=None, ciks=None) -> int:
+        """
+        Converts the companyfacts archive of the SEC, which holds the facts of all companies, into a Parquet dataset and returns the number of companies written.
+        The facts of each company are stored in the format of the facts property in directory/cik=<CIK>/facts.parquet sorted by concept,
+        so that the dataset can be read with pd.read_parquet(directory) and filtered by CIK and concept. All files share one schema, in which the values are stored as floats. Requires pyarrow.
+
+        Parameters
+        ----------------------
+        source : str or Path
+            The url or path of the archive, by default the nightly archive of the SEC
+        directory : str or Path (optional)
+            The directory of the dataset, by default ~/.cache/findata/edgar/companyfacts
+        ciks : iterable of int (optional)
+            The CIKs of the companies to load, by default all companies that report US-GAAP facts
+        """
+        pyarrow = _import_pyarrow()
+        import pyarrow.parquet
+        # all partitions share one schema, otherwise the types inferred from the facts of each company
+        # (e.g. int64 values or a start column without any date) conflict when the dataset is read
+        schema = pyarrow.schema([
+            ("concept", pyarrow.string()),
+            ("unit", pyarrow.string()),
+            ("start", pyarrow.string()),
+            ("end", pyarrow.string()),
+            ("val", pyarrow.float64()),
+            ("fy", pyarrow.int64()),
+            ("fp", pyarrow.string()),
+            ("form", pyarrow.string()),
+            ("filed", pyarrow.string())
+        ])
+        directory = Path(COMPANYFACTS_PATH if directory is None else directory)
+        count = 0
+        for fundamentals in cls.iter_bulk(source, ciks=ciks):
+            path = directory / f"cik={fundamentals.cik}" / "facts.parquet"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            facts = fundamentals.facts.sort_values(["concept", "unit", "end"], kind="stable")
+            pyarrow.parquet.write_table(pyarrow.Table.from_pandas(facts, schema=schema, preserve_index=False), path)
+            count += 1
+        return count
+
+    @classmethod
+    def iter_bulk(cls, source: Union[str, Path] = COMPANYFACTS_URL, ciks=None):
+        """
+        Yields a SECFundamentals object for each company of the companyfacts archive that reports US-GAAP facts, see bulk_load for the parameters.
+        The archive is read member by member, so only the facts of a single company are held in memory. Archives given by url are
+        downloaded into a temporary file first, as the members of a zip file can only be located from the end of the file.
+        """
+        ciks = None if ciks is None else set(int(cik) for cik in ciks)
+        with _open_archive(source) as archive:
+            for member in archive.infolist():
+                match = re.fullmatch(r"CIK([0-9]{10})\.json", member.filename)
+                if match is None or (ciks is not None and int(match.group(1)) not in ciks):
+                    continue
+                with archive.open(member) as file:
+                    data = json.load(file)
+                facts = data.get("facts", {})
+                if "us-gaap" not in facts or "ifrs-full" in facts:
+                    continue
+                fundamentals = cls.__new__(cls)
+                fundamentals._cik = int(match.group(1))
+                fundamentals._name = data["entityName"]
+                fundamentals._parse_facts(facts)
+                yield fundamentals
 
-        url = f"https://data.sec.gov/api/xbrl/companyfacts/CIK{self.cik:010}.json"
-        json = requests.get(url=url, headers=utils.HEADERS_FAKE).json()
+    def _get_data(self) -> None:
+        url = f"{_XBRL_URL}/companyfacts/CIK{self.cik:010}.json"
+        json = utils.get(url=url, headers=utils.HEADERS_FAKE, ttl=utils.CACHE_TTL["sec_companyfacts"]).json()
 
         self._name = json["entityName"]
-        facts = json["facts"]
+        self._parse_facts(json["facts"])
 
+    @utils.instrumented
+    def _parse_facts(self, facts: dict) -> None:
         if "ifrs-full" in facts:
             raise ValueError
 
@@ -4238,86 +5494,125 @@ class SECFundamentals:
         elif "us-gaap" in facts:
             self._accounting_standard = "US-GAAP"
 
+        self._concepts = {}
+        concepts, units, entries = [], [], []
         for key, dct in facts["us-gaap"].items():
-            self._var_keys.add(key)
-            label = dct["label"]
-            description = dct["description"]
-            if len(dct["units"]) == 1:
-                unit = list(dct["units"])[0]
-            else:
-                unit = sorted(dct["units"].items(), key=lambda x: len(x[1]), reverse=True)[0][0]
-
-            quarterly_parsed_data = self._parse_quarterly_data(dct["units"][unit])
-            yearly_parsed_data = self._parse_yearly_data(dct["units"][unit])
-
-            self._data[key] = {
+            # the unit with the most facts is used for the yearly and quarterly data
+            unit = max(dct["units"], key=lambda unit: len(dct["units"][unit]))
+            self._concepts[key] = {
                 "label": dct["label"],
                 "description": dct["description"],
-                "unit": unit,
-                "yearly_data": yearly_parsed_data,
-                "quarterly_data": quarterly_parsed_data
+                "unit": unit
+            }
+            for unit, unit_entries in dct["units"].items():
+                concepts.extend([key] * len(unit_entries))
+                units.extend([unit] * len(unit_entries))
+                entries.extend(unit_entries)
+
+        facts = pd.DataFrame.from_records(entries, columns=["start", "end", "val", "fy", "fp", "form", "filed"])
+        facts.insert(0, "concept", concepts)
+        facts.insert(1, "unit", units)
+        self._facts = facts
+        # the val column converts the integers of concepts with float values to floats,
+        # so the data is derived from the values as they are reported to keep integers exact
+        self._values = [entry["val"] for entry in entries]
+
+    def _derive_data(self) -> dict:
+        facts = self._facts.assign(val=pd.Series(self._values, dtype=object))
+        units = pd.Series({key: concept["unit"] for key, concept in self._concepts.items()}, dtype=object)
+        facts = facts[facts["unit"] == facts["concept"].map(units)].reset_index(drop=True)
+
+        # concepts without any fact with a start date are stock variables, all others are flow variables
+        flow = facts["start"].notna().groupby(facts["concept"]).transform("any")
+        start = pd.to_datetime(facts["start"], format="%Y-%m-%d")
+        end = pd.to_datetime(facts["end"], format="%Y-%m-%d")
+        months = (end.dt.year - start.dt.year) * 12 + end.dt.month - start.dt.month
+        facts = facts.assign(flow=flow, months=months)
+        facts = facts[facts["end"].notna()]
+
+        quarterly = pd.concat([self._stock_quarterly_data(facts[~facts["flow"]]), self._flow_quarterly_data(facts[facts["flow"]])])
+        yearly = self._yearly_data(facts)
+        quarterly = self._group_by_concept(quarterly)
+        yearly = self._group_by_concept(yearly)
+
+        data = {}
+        for key, concept in self._concepts.items():
+            data[key] = {
+                "label": concept["label"],
+                "description": concept["description"],
+                "unit": concept["unit"],
+                "yearly_data": yearly.get(key, {}),
+                "quarterly_data": quarterly.get(key, {})
             }
-
-    def _parse_quarterly_data(self, entries: dict) -> dict:
-        if not any("start" in item for item in entries): # stock variables
-            data = [item for item in entries if "end" in item]
-            data = {entry["end"]: entry["val"] for entry in data}
-        else: # flow variables
-            data = {}
-            entries = [item for item in entries if "end" in item and "start" in item]
-            for entry in sorted(entries, key=lambda x: x["end"]):
-                if self._month_diff(entry["end"], entry["start"]) <= 3:
-                    data[entry["end"]] = {
-                        "value": entry["val"],
-                        "single_quarter": True,
-                        "quarter": entry["fp"]
-                    }
-                else:
-                    data[entry["end"]] = {
-                        "value": entry["val"],
-                        "single_quarter": False,
-                        "quarter": entry["fp"]
-                    }
-
-            data = list(data.items())
-            for index, (date, dct) in enumerate(data):
-                if dct["single_quarter"] is False:
-                    if dct["quarter"] == "Q2":
-                        if index >= 1 and data[index-1][1]["value"] is not None:
-                            dct["value"] = dct["value"] - data[index-1][1]["value"]
-                        else:
-                            dct["value"] = None
-                    elif dct["quarter"] == "Q3":
-                        if index >= 2 and not any(value is None for value in (data[index-1][1]["value"], data[index-2][1]["value"])):
-                            dct["value"] = dct["value"] - data[index-1][1]["value"] - data[index-2][1]["value"]
-                        else:
-                            dct["value"] = None
-                    elif dct["quarter"] == "FY":
-                        if index >= 3 and not any(value is None for value in (data[index-1][1]["value"], data[index-2][1]["value"], data[index-3][1]["value"])):
-                            dct["value"] = dct["value"] - data[index-1][1]["value"] - data[index-2][1]["value"] - data[index-3][1]["value"]
-                        else:
-                            dct["value"] = None
-
-            data = {date: dct["value"] for date, dct in data if dct["value"] is not None}
-
         return data
 
-    def _parse_yearly_data(self, entries: dict) -> dict:
-        if not any("start" in entry for entry in entries): # stock variables
-            data = [entry for entry in entries if entry["form"] in ("10-K", "10-K/A") if "end" in entry]
-        else: # flow variables
-            data = [
-                entry for entry in entries if entry["form"] in ("10-K", "10-K/A")
-                if "end" in entry and "start" in entry
-                and self._month_diff(entry["end"], entry["start"]) > 10
-            ]
-
-        return {entry["end"]: entry["val"] for entry in data}
-
-    def _month_diff(self, date1: str, date2: str) -> int:
-        date1 = pd.to_datetime(date1)
-        date2 = pd.to_datetime(date2)
-        return (date1.year - date2.year) * 12 + date1.month - date2.month
+    def _stock_quarterly_data(self, facts: pd.DataFrame) -> pd.Series:
+        return facts.groupby(["concept", "end"], sort=False)["val"].last()
+
+    @utils.instrumented
+    def _flow_quarterly_data(self, facts: pd.DataFrame) -> pd.Series:
+        facts = facts[facts["start"].notna()]
+        facts = facts.sort_values(["concept", "end"], kind="stable").drop_duplicates(["concept", "end"], keep="last")
+
+        # values that span more than a quarter are year-to-date values of the second or third quarter or of the fiscal year,
+        # from which the values of the preceding quarters are subtracted to get the value of the single quarter
+        lags = facts["fp"].map({"Q2": 1, "Q3": 2, "FY": 3}).fillna(0).to_numpy(dtype=int)
+        cumulative = (facts["months"] > 3).to_numpy() & (lags > 0)
+        positions = facts.groupby("concept", sort=False).cumcount().to_numpy()
+
+        # the preceding values can themselves be differenced, so the values are differenced in order. Only the year-to-date values
+        # are visited and the arithmetic is done on the reported numbers, so integers stay integers and large values stay exact
+        values = facts["val"].tolist()
+        for index in np.flatnonzero(cumulative).tolist():
+            lag = lags[index]
+            preceding = values[index - lag:index] if positions[index] >= lag else [None]
+            if any(value is None for value in preceding):
+                values[index] = None
+                continue
+            for value in reversed(preceding):
+                values[index] = values[index] - value
+
+        data = pd.Series(values, index=pd.MultiIndex.from_frame(facts[["concept", "end"]]), dtype=object)
+        return data[data.notna()]
+
+    @utils.instrumented
+    def _yearly_data(self, facts: pd.DataFrame) -> pd.Series:
+        facts = facts[facts["form"].isin(("10-K", "10-K/A")) & (~facts["flow"] | (facts["months"] > 10))]
+        return facts.groupby(["concept", "end"], sort=False)["val"].last()
+
+    def _group_by_concept(self, data: pd.Series) -> dict:
+        concepts = {}
+        for key, values in data.groupby(level=0, sort=False):
+            concepts[key] = dict(zip(values.index.get_level_values(1), values.tolist()))
+        return concepts
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Parquet datasets require pyarrow to be installed (pip install pyarrow)")
+    return pyarrow
+
+
+@contextmanager
+def _open_archive(source: Union[str, Path]):
+    if isinstance(source, str) and re.match(r"https?://", source):
+        with TemporaryFile() as temp_file:
+            response = utils.get(source, headers=utils.HEADERS_FAKE, stream=True)
+            try:
+                if response.status_code != 200:
+                    raise utils.DatasetError(f'Could not retrieve the archive "{source}"')
+                for chunk in response.iter_content(chunk_size=2**20):
+                    temp_file.write(chunk)
+            finally:
+                response.close()
+            temp_file.seek(0)
+            with ZipFile(temp_file) as archive:
+                yield archive
+    else:
+        with ZipFile(source) as archive:
+            yield archive
 
 
 class Filing10K(_SECFiling):
@@ -4327,7 +5622,7 @@ class Filing10K(_SECFiling):
         assert len(self.filer) != 0
         
         try:
-            assert "</XBRL>" in self._document and "</XBRL>" in self._document
+            assert self._find("</XBRL>") != -1
         except AssertionError:
             raise NotImplementedError(
                 """
@@ -4364,8 +5659,10 @@ class Filing10K(_SECFiling):
         return self._shareholders_equity
 
     @property
-    def reports(self):
-        return self._reports
+    def reports(self) -> dict:
+        if not hasattr(self, "_statements"):
+            self._parse_statement_section()
+        return {statement["id"]: statement for statement in self._statements}
 
     @property
     def statements(self) -> dict:
@@ -4381,39 +5678,53 @@ class Filing10K(_SECFiling):
 
     @property
     def data(self) -> dict:
-        return self._data
+        if not hasattr(self, "_values"):
+            self._parse_value_section()
+        return self._values
+
+    @property
+    def labels(self) -> dict:
+        if not hasattr(self, "_labels"):
+            self._parse_label_section()
+        return self._labels
+
+    @property
+    def presentation(self) -> dict:
+        if not hasattr(self, "_presentation"):
+            self._parse_presentation_section()
+        return self._presentation
     
+    @utils.instrumented
     def _parse_document(self) -> None:
-        sections = self._document.split("<FILENAME>")
-        
-        statement_section = [section for section in sections if re.findall("^[a-z0-9-]+\\.xsd\n", section)][0]
-        start_index = statement_section.lower().find("<xbrl")
-        self._statement_section = BeautifulSoup(statement_section[start_index:], "lxml-xml")
-        self._parse_statement_section()
-        
-        label_section = [section for section in sections if re.findall("^[a-z0-9-]+_lab\\.xml\n", section)][0]
-        start_index = label_section.lower().find("<xbrl")
-        self._label_section = BeautifulSoup(label_section[start_index:], "lxml-xml")
-        self._parse_label_section()
-        
-        presentation_section = [section for section in sections if re.findall("^[a-z0-9-]+_pre\\.xml\n", section)][0]
-        start_index = presentation_section.lower().find("<xbrl")
-        self._presentation_section = BeautifulSoup(presentation_section[start_index:], "lxml-xml")
-        self._parse_presentation_section()
-        
-        value_section = [section for section in sections if re.findall("^[a-z0-9-_]+_htm.xml\n", section)][0]
-        start_index = value_section.lower().find("<xbrl")
-        self._value_section = BeautifulSoup(value_section[start_index:], "lxml-xml")
-        self._parse_value_section()
+        # only the XBRL sections are located here, each of them is parsed when a property first needs it.
+        # The sub-documents are identified by their filename in the document index and only the four XBRL documents are read in full
+        filenames = [document["filename"] or "" for document in self.documents]
+        self._sections = {}
+        with self._mapped():
+            for name, pattern in (
+                ("statement", "[a-z0-9-]+\\.xsd"),
+                ("label", "[a-z0-9-]+_lab\\.xml"),
+                ("presentation", "[a-z0-9-]+_pre\\.xml"),
+                ("value", "[a-z0-9-_]+_htm.xml")
+            ):
+                index = [index for index, filename in enumerate(filenames) if re.fullmatch(pattern, filename)][0]
+                section = self._sub_document(index)
+                self._sections[name] = section[section.lower().find("<xbrl"):]
         
         #self._description_section = BeautifulSoup([section for section in sections if re.findall("^MetaLinks.json\n", section)][0])
+
+    def _section(self, name: str) -> BeautifulSoup:
+        attribute = f"_{name}_section"
+        if not hasattr(self, attribute):
+            setattr(self, attribute, BeautifulSoup(self._sections[name], "lxml-xml"))
+        return getattr(self, attribute)
     
     def _parse_statement_section(self) -> None:
         self._statements = []
         self._company_elements = []
         
         # parse company-specific elements
-        for tag in self._statement_section.find_all("xs:element"):
+        for tag in self._section("statement").find_all("xs:element"):
             self._company_elements.append(
                 {
                     "name": tag.get("name"),
@@ -4427,7 +5738,7 @@ class Filing10K(_SECFiling):
             )
         
         # parse statements and disclosures
-        for statement in self._statement_section.find_all("link:roleType"):
+        for statement in self._section("statement").find_all("link:roleType"):
             statement_type, title = re.findall("(?i)[0-9]+ - ([a-z]+) - (.+)", statement.find("link:definition").text)[0]
             
             self._statements.append(
@@ -4440,7 +5751,7 @@ class Filing10K(_SECFiling):
             )
     
     def _parse_presentation_section(self) -> None:
-        statements = self._presentation_section.find_all("link:presentationLink")
+        statements = self._section("presentation").find_all("link:presentationLink")
         
         self._presentation = {}
         for statement in statements:
@@ -4461,7 +5772,7 @@ class Filing10K(_SECFiling):
 
     def _parse_label_section(self) -> None:
         self._labels = {}
-        for tag in self._label_section.find_all("link:label"):
+        for tag in self._section("label").find_all("link:label"):
             label_id = tag.get("xlink:label").split("_")[-1]
             if label_id not in self._labels:
                 self._labels[label_id] = {}
@@ -4469,76 +5780,148 @@ class Filing10K(_SECFiling):
             self._labels[label_id][tag.get("xlink:role").split("/")[-1]] = tag.text.strip()        
     
     def _parse_value_section(self) -> None:
-        context = {}
-        for tag in self._value_section.find_all("context"):
-            period = tag.find("period")
-            if period.find("instant") is None:
-                start = period.find("startDate").text
-                end = period.find("endDate").text
-            else:
-                start = None
-                end = period.find("instant").text
-            
-            if tag.find("segment") is None:
-                segments = None
-            else:
-                segments = []
-                for segment_tag in tag.find("segment").find_all("xbrldi:explicitMember"):
-                    segments.append(segment_tag.text.strip().split(":")[-1])
-                
-                if tag.find("segment").find("xbrldi:typedMember") is not None:
-                    for segment_tag in tag.find("segment").find("xbrldi:typedMember").find_all(re.compile(".+")):
-                         segments.append(segment_tag.text.strip().split(":")[-1])
-        
-            context[tag.get("id")] = {
-                "start": start,
-                "end": end,
-                "segments": segments
-            }
-        
-        units = {}
-        for tag in self._value_section.find_all("unit"):
-            if tag.find("unitnumerator") is not None:
-                numerator = tag.find("unitNumerator").find("measure").text
-                denominator = tag.find("unitDenominator").find("measure").text
-                units[tag.get("id")] = {
-                    "numerator": numerator,
-                    "denominator": denominator
-                }
-            else:
-                units[tag.get("id")] = tag.find("measure").text
+        contexts, units, facts = _read_xbrl_instance(self._sections["value"])
         
         self._values = {}
-        
-        for tag in self._value_section.find("xbrl").find_all(re.compile("^(?!context|unit).+"), recursive=False):
-            if tag.name == "schemaRef" or tag.get("contextRef") is None: continue
-            var = tag.name
-            if var not in self._values:
-                self._values[var] = []
+        self._fact_rows = []
+        for concept, value, context_id, unit_id, decimals in facts:
+            if concept not in self._values:
+                self._values[concept] = []
 
-            value = tag.text
             if value.isdigit():
-                if "." in value:
-                    value = float(value)
-                else:
-                    value = int(value)
+                value = int(value)
             elif value.lower() in ("true", "yes"):
                 value = True
             elif value.lower() in ("false", "no"):
                 value = False
 
-            data = {
-                "value": value,
-                "context": context[tag.get("contextRef")],
-                "unit": None if tag.get("unitRef") is None else units[tag.get("unitRef")]
-            }
+            context = contexts[context_id]
+            unit = None if unit_id is None else units[unit_id]
+            self._values[concept].append(
+                {
+                    "value": value,
+                    "context": context,
+                    "unit": unit
+                }
+            )
+            if isinstance(unit, dict):
+                unit = f"{unit['numerator']}/{unit['denominator']}"
+            self._fact_rows.append((concept, value, context["start"], context["end"], context["segments"], unit, decimals))
 
-            self._values[var].append(data)
+    @property
+    def facts(self) -> pd.DataFrame:
+        """
+        All facts of the XBRL instance with the columns concept, value, start, end, dimensions, unit and decimals.
+        """
+        if not hasattr(self, "_fact_rows"):
+            self._parse_value_section()
+        return pd.DataFrame(self._fact_rows, columns=["concept", "value", "start", "end", "dimensions", "unit", "decimals"])
 
     def _parse_descriptions(self) -> None:
         return
 
 
+def _local_name(element) -> str:
+    return element.tag.rpartition("}")[2]
+
+
+def _element_text(element) -> str:
+    if len(element) == 0:
+        return element.text or ""
+    return "".join(element.itertext())
+
+
+_XBRL_ROOT = re.compile(r"<(?:[A-Za-z_][\w.-]*:)?xbrl[\s>]")
+
+
+@utils.instrumented
+def _read_xbrl_instance(text: str, chunk_size: int = 2**20) -> tuple:
+    """
+    Reads an XBRL instance document in a single pass and returns its contexts and units as lookup tables by id
+    and its facts as tuples of the concept, the value, the context id, the unit id and the decimals.
+    Every top-level element is cleared after it has been read, so memory usage does not grow with the number of facts.
+    """
+    contexts, units, facts = {}, {}, []
+    # the instance document of a submission is wrapped in <XBRL> tags and preceded by an XML declaration,
+    # so the parser starts at the xbrl root element of the instance itself
+    root = _XBRL_ROOT.search(text)
+    start = 0 if root is None else root.start()
+    parser = etree.XMLPullParser(events=("end",), recover=True, huge_tree=True)
+    for position in range(start, len(text), chunk_size):
+        parser.feed(text[position:position + chunk_size])
+        for _, element in parser.read_events():
+            # only the children of the root element are contexts, units and facts
+            parent = element.getparent()
+            if parent is None or parent.getparent() is not None or not isinstance(element.tag, str):
+                continue
+
+            name = _local_name(element)
+            if name.startswith("context"):
+                contexts[element.get("id")] = _read_xbrl_context(element)
+            elif name.startswith("unit"):
+                units[element.get("id")] = _read_xbrl_unit(element)
+            elif name != "schemaRef" and element.get("contextRef") is not None:
+                facts.append((name, _element_text(element), element.get("contextRef"), element.get("unitRef"), element.get("decimals")))
+
+            element.clear()
+            while element.getprevious() is not None:
+                del parent[0]
+    parser.close()
+    return contexts, units, facts
+
+
+def _read_xbrl_context(element) -> dict:
+    start = end = instant = segment = None
+    for child in element.iter():
+        if not isinstance(child.tag, str):
+            continue
+        name = _local_name(child)
+        if name == "startDate" and start is None:
+            start = child.text
+        elif name == "endDate" and end is None:
+            end = child.text
+        elif name == "instant" and instant is None:
+            instant = child.text
+        elif name == "segment" and segment is None:
+            segment = child
+
+    if instant is not None:
+        start, end = None, instant
+
+    segments = None
+    if segment is not None:
+        segments = []
+        for member in segment.iter():
+            if isinstance(member.tag, str) and _local_name(member) == "explicitMember":
+                segments.append(_element_text(member).strip().split(":")[-1])
+        typed_member = next((member for member in segment.iter() if isinstance(member.tag, str) and _local_name(member) == "typedMember"), None)
+        if typed_member is not None:
+            for member in typed_member.iterdescendants():
+                if isinstance(member.tag, str):
+                    segments.append(_element_text(member).strip().split(":")[-1])
+
+    return {
+        "start": start,
+        "end": end,
+        "segments": segments
+    }
+
+
+def _read_xbrl_unit(element) -> Union[str, dict]:
+    measures = {}
+    for child in element.iter():
+        if isinstance(child.tag, str) and _local_name(child) in ("unitNumerator", "unitDenominator"):
+            measure = next((measure for measure in child.iter() if isinstance(measure.tag, str) and _local_name(measure) == "measure"), None)
+            measures[_local_name(child)] = None if measure is None else _element_text(measure)
+    if measures:
+        return {
+            "numerator": measures.get("unitNumerator"),
+            "denominator": measures.get("unitDenominator")
+        }
+    measure = next((measure for measure in element.iter() if isinstance(measure.tag, str) and _local_name(measure) == "measure"), None)
+    return None if measure is None else _element_text(measure)
+
+
 class Filing10Q(Filing10K):
     def __init__(self, filing_type="10-Q", **kwargs):
         super().__init__(filing_type, **kwargs)
\ No newline at end of file
@@ -1,7 +1,6 @@
 import json
 import pandas as pd
 import re
-import requests
 from typing import Optional
 from . import utils
 
@@ -20,7 +19,7 @@ class StratosphereReader:
         return f"StratosphereReader({self.ticker})"
     
     def _get_data(self, suffix) -> dict:
-        html = requests.get(
+        html = utils.get(
             url=self._base_url.format(self.ticker, suffix),
             headers=utils.HEADERS
         ).text
@@ -270,7 +269,7 @@ class StratosphereReader:
 
     @staticmethod
     def fund_letters(timestamps=False) -> list:
-        html = requests.get(
+        html = utils.get(
             url="https://www.stratosphere.io/fund-letters/",
             headers=utils.HEADERS
         ).text
@@ -293,7 +292,7 @@ class StratosphereReader:
 
     @staticmethod
     def investors() -> list:
-        html = requests.get(
+        html = utils.get(
             url="https://www.stratosphere.io/super-investors/",
             headers=utils.HEADERS
         ).text
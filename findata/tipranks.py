@@ -1,7 +1,6 @@
 from bs4 import BeautifulSoup
 import pandas as pd
 import re
-import requests
 from . import utils
 
 
@@ -14,7 +13,7 @@ class TipranksAnalystReader:
     def _get_analyst_data(self) -> str:
         if not hasattr(self, "_analyst_data"):
             name_encoded = self.name.lower().replace(" ", "-")
-            self._analyst_data = requests.get(
+            self._analyst_data = utils.get(
                 url=f"{self._base_url}{name_encoded}",
                 headers=utils.HEADERS
             ).text
@@ -145,7 +144,7 @@ class TipranksStockReader:
 
     def _get_ratings_data(self):
         if not hasattr(self, "_ratings_data"):
-            self._ratings_data = requests.get(
+            self._ratings_data = utils.get(
                 url=f"{self._base_url}getData/",
                 headers=utils.TIPRANKS_HEADERS,
                 params={"name": self.ticker}
@@ -320,7 +319,7 @@ class TipranksStockReader:
         return data
     
     def news_sentiment(self, timestamps=False) -> dict:
-        data = requests.get(
+        data = utils.get(
             url=f"{self._base_url}getNewsSentiments/",
             headers=utils.TIPRANKS_HEADERS,
             params={"ticker": self.ticker}
@@ -473,7 +472,7 @@ class TipranksStockReader:
 
     @classmethod
     def trending_stocks(cls, timestamps=False) -> list:
-        data = requests.get(
+        data = utils.get(
             url=f"{cls._base_url}gettrendingstocks/",
             headers=utils.TIPRANKS_HEADERS,
             params={
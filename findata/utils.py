@@ -1,7 +1,22 @@
+import asyncio
 import configparser
+import functools
+import hashlib
+import json
 import os
+import random
+import threading
+import time
+import weakref
+from contextlib import contextmanager
 from copy import deepcopy
+from datetime import timedelta
+from email.utils import parsedate_to_datetime
 from pathlib import Path
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 
 class TickerError(ValueError):
     pass
@@ -37,8 +52,936 @@ else:
     CHROMEDRIVER_PATH = f"{Path(__file__).parents[3]}/chromedriver.exe"
     YAHOO_CRUMB = None
 
-_companies = None
-_mutualfunds = None
+# Shared HTTP transport. All readers route their requests through get/post so that
+# TCP and TLS connections are pooled per host and kept alive across calls.
+POOL_CONNECTIONS = 32 # number of hosts whose connection pools are kept open
+POOL_MAXSIZE = 16 # number of connections kept open per host
+TIMEOUT = 60
+
+try:
+    import brotli
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi
+        ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        ACCEPT_ENCODING = "gzip, deflate"
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _create_session(pool_connections: int, pool_maxsize: int) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+def session() -> requests.Session:
+    """
+    Returns the process-wide requests session that holds the per-host connection pools.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _create_session(POOL_CONNECTIONS, POOL_MAXSIZE)
+    return _session
+
+
+def configure_transport(pool_connections: int = None, pool_maxsize: int = None) -> None:
+    """
+    Sets the number of per-host connection pools and the number of connections kept open per host.
+    Open connections of the current transport are closed and the new transport is created on the next request.
+    """
+    global _session, POOL_CONNECTIONS, POOL_MAXSIZE
+    with _session_lock:
+        if pool_connections is not None:
+            POOL_CONNECTIONS = pool_connections
+        if pool_maxsize is not None:
+            POOL_MAXSIZE = pool_maxsize
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+# Rate limits in requests per second, keyed by host. A limit applies to the host itself
+# and to all of its subdomains unless a subdomain has its own limit, e.g. the SEC limit
+# is shared by www.sec.gov, efts.sec.gov and data.sec.gov as the SEC allows at most
+# 10 requests per second per user across all of its hosts.
+RATE_LIMITS = {
+    "sec.gov": 10
+}
+RATE_LIMIT_DIRECTORY = Path.home() / ".cache" / "findata" / "ratelimits"
+
+_rate_limiters = {}
+_rate_limiters_lock = threading.Lock()
+
+
+class _FileLock:
+    def __init__(self, path) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+    def __enter__(self):
+        self._file = open(self._path, "a+b")
+        if os.name == "nt":
+            import msvcrt
+            self._file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    pass
+        else:
+            import fcntl
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        return self._file
+
+    def __exit__(self, *args) -> None:
+        if os.name == "nt":
+            import msvcrt
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+
+
+class RateLimiter:
+    """
+    RateLimiter is a token bucket that refills with rate tokens per second up to a maximum of burst tokens.
+    Each request takes one token and has to wait until the bucket holds a token again if it is empty.
+
+    If cross_process is True, the bucket state is kept in a lock file and shared by all processes that use the same host.
+    """
+    def __init__(self, rate: float, burst: float = None, cross_process: bool = False, path=None) -> None:
+        if rate <= 0:
+            raise ValueError("rate has to be positive")
+        self._rate = rate
+        self._burst = rate if burst is None else burst
+        self._tokens = self._burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._file_lock = _FileLock(path) if cross_process else None
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def burst(self) -> float:
+        return self._burst
+
+    def reserve(self) -> float:
+        """
+        Takes a token and returns the number of seconds the caller has to wait before sending the request.
+        """
+        with self._lock:
+            if self._file_lock is None:
+                now = time.monotonic()
+                self._tokens, self._updated = self._take(self._tokens, self._updated, now)
+                tokens = self._tokens
+            else:
+                with self._file_lock as file:
+                    now = time.time()
+                    file.seek(0)
+                    state = file.read().split()
+                    if len(state) == 2:
+                        tokens, updated = float(state[0]), float(state[1])
+                    else:
+                        tokens, updated = self._burst, now
+                    tokens, updated = self._take(tokens, updated, now)
+                    file.seek(0)
+                    file.truncate()
+                    file.write(f"{tokens} {updated}".encode())
+                    file.flush()
+        return 0.0 if tokens >= 0 else -tokens / self._rate
+
+    def acquire(self) -> float:
+        """
+        Blocks until a token is available and returns the number of seconds waited.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def _take(self, tokens: float, updated: float, now: float) -> tuple:
+        tokens = min(self._burst, tokens + (now - updated) * self._rate)
+        return tokens - 1, now
+
+
+def set_rate_limit(host: str, rate: float = None, burst: float = None, cross_process: bool = False) -> None:
+    """
+    Sets the maximum number of requests per second for the given host (e.g. "finance.yahoo.com" or "finviz.com").
+    If rate is None, the limit of the host is removed.
+    If cross_process is True, the limit is shared with all other processes of the machine through a lock file.
+    """
+    host = host.lower()
+    with _rate_limiters_lock:
+        if rate is None:
+            RATE_LIMITS.pop(host, None)
+            _rate_limiters.pop(host, None)
+        else:
+            RATE_LIMITS[host] = rate
+            _rate_limiters[host] = RateLimiter(
+                rate=rate,
+                burst=burst,
+                cross_process=cross_process,
+                path=RATE_LIMIT_DIRECTORY / f"{host}.lock"
+            )
+
+
+def rate_limiter(url: str):
+    """
+    Returns the RateLimiter that applies to the host of the given url or None if the host is not rate limited.
+    """
+    host = (urlsplit(url).hostname or "").lower()
+    parts = host.split(".")
+    for index in range(len(parts) - 1):
+        domain = ".".join(parts[index:])
+        if domain in RATE_LIMITS:
+            with _rate_limiters_lock:
+                if domain not in _rate_limiters:
+                    _rate_limiters[domain] = RateLimiter(RATE_LIMITS[domain])
+                return _rate_limiters[domain]
+    return None
+
+
+# Retry policy. Failed requests are retried with exponential backoff and jitter
+# unless the server specifies how long to wait with a Retry-After header.
+RETRY_ATTEMPTS = 5 # maximum number of attempts per request
+RETRY_BACKOFF = 1 # seconds before the first retry, doubled with each further retry
+RETRY_MAX_BACKOFF = 60 # upper bound of a single pause in seconds
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Responses of these hosts that contain one of the markers are rate limited, even if the status code is 200.
+RATE_LIMIT_MARKERS = {
+    "finviz.com": (
+        b"This IP address has performed an unusual high number of requests and has been temporarily rate limited",
+    ),
+    "sec.gov": (
+        b"Request Rate Threshold Exceeded",
+    )
+}
+
+
+def backoff(attempt: int, retry_after: float = None, max_backoff: float = None) -> float:
+    """
+    Returns the number of seconds to wait before the given retry attempt (starting at 0).
+    If the server sent a Retry-After value, that value is used instead of the exponential backoff.
+    """
+    max_backoff = RETRY_MAX_BACKOFF if max_backoff is None else max_backoff
+    if retry_after is not None:
+        return min(retry_after, max_backoff)
+    delay = min(max_backoff, RETRY_BACKOFF * 2**attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def is_rate_limited(response: requests.Response) -> bool:
+    """
+    Returns True if the response signals that the requests to its host are rate limited.
+    """
+    if response.status_code == 429:
+        return True
+    host = (urlsplit(response.url).hostname or "").lower()
+    for domain, markers in RATE_LIMIT_MARKERS.items():
+        if host == domain or host.endswith(f".{domain}"):
+            return any(marker in response.content for marker in markers)
+    return False
+
+
+def _retry_after(response: requests.Response):
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _send(method: str, url: str, **kwargs) -> requests.Response:
+    limiter = rate_limiter(url)
+    wait_time = 0.0
+    for attempt in range(RETRY_ATTEMPTS):
+        if limiter is not None:
+            wait_time += limiter.acquire()
+        last_attempt = attempt + 1 == RETRY_ATTEMPTS
+        try:
+            response = session().request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if last_attempt:
+                raise
+            pause = backoff(attempt)
+            time.sleep(pause)
+            wait_time += pause
+            continue
+        if last_attempt:
+            break
+        if response.status_code in RETRY_STATUS_CODES or (not kwargs.get("stream", False) and is_rate_limited(response)):
+            response.close()
+            pause = backoff(attempt, _retry_after(response))
+            time.sleep(pause)
+            wait_time += pause
+            continue
+        break
+    response.attempts = attempt + 1
+    response.wait_time = wait_time
+    return response
+
+
+# Instrumentation. Hooks are called with one dictionary per request and per parsing stage,
+# which allows to tell apart time spent waiting for a host from time spent parsing.
+_hooks = ()
+
+
+def add_hook(hook) -> None:
+    """
+    Registers a callable that is called with an event dictionary after each request and each instrumented parsing stage.
+
+    Request events
+    ----------------------
+    type : "request"
+    method : str
+    host : str
+    url_template : str
+        The url without query parameters and with numeric path segments (e.g. CIKs and accession numbers) replaced by "{}"
+    status : int
+    bytes : int
+        The size of the decoded response body
+    cache : str or None
+        "hit", "revalidated", "miss" or "fixture", None if the request was not cacheable
+    attempts : int
+    ttfb : float
+        Seconds until the response headers arrived
+    download_time : float
+        Seconds spent sending the request and reading the body, excluding time to first byte and waiting
+    wait_time : float
+        Seconds spent waiting for the rate limiter and between retries
+    total_time : float
+
+    Parse events
+    ----------------------
+    type : "parse"
+    source : str
+        The module of the parsing stage (e.g. "sec")
+    name : str
+        The qualified name of the parsing stage (e.g. "Filing13F._parse_document")
+    duration : float
+    error : str or None
+        The name of the exception if the stage failed
+    """
+    global _hooks
+    _hooks = _hooks + (hook,)
+
+
+def remove_hook(hook) -> None:
+    global _hooks
+    _hooks = tuple(item for item in _hooks if item is not hook)
+
+
+def _emit(event: dict) -> None:
+    for hook in _hooks:
+        hook(event)
+
+
+def url_template(url: str) -> str:
+    parts = urlsplit(url)
+    segments = []
+    for segment in parts.path.split("/"):
+        stem, dot, extension = segment.partition(".")
+        if stem != "" and stem.replace("-", "").isdigit():
+            segment = "{}" + dot + extension
+        segments.append(segment)
+    return f"{parts.scheme}://{parts.netloc}{'/'.join(segments)}"
+
+
+def _report(method: str, url: str, response: requests.Response, start: float, cache) -> None:
+    if not _hooks:
+        return
+    total_time = time.perf_counter() - start
+    wait_time = getattr(response, "wait_time", 0.0)
+    ttfb = response.elapsed.total_seconds()
+    _emit(
+        {
+            "type": "request",
+            "method": method.upper(),
+            "host": (urlsplit(url).hostname or "").lower(),
+            "url_template": url_template(url),
+            "status": response.status_code,
+            "bytes": len(response._content) if isinstance(response._content, bytes) else None, # unread streams are not consumed
+            "cache": cache,
+            "attempts": getattr(response, "attempts", 0),
+            "ttfb": ttfb,
+            "download_time": max(0.0, total_time - wait_time - ttfb),
+            "wait_time": wait_time,
+            "total_time": total_time
+        }
+    )
+
+
+@contextmanager
+def span(name: str, source: str = None):
+    """
+    Reports the duration of the enclosed block as a parse event to the registered hooks.
+    """
+    if not _hooks:
+        yield
+        return
+    start = time.perf_counter()
+    error = None
+    try:
+        yield
+    except BaseException as exception:
+        error = type(exception).__name__
+        raise
+    finally:
+        _emit(
+            {
+                "type": "parse",
+                "source": source,
+                "name": name,
+                "duration": time.perf_counter() - start,
+                "error": error
+            }
+        )
+
+
+def instrumented(func):
+    """
+    Decorator that reports each call of a parsing function as a parse event to the registered hooks.
+    """
+    name = func.__qualname__
+    source = func.__module__.split(".")[-1]
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _hooks:
+            return func(*args, **kwargs)
+        with span(name, source):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+class Metrics:
+    """
+    Metrics is a hook that aggregates request events per host and parse events per parsing stage.
+
+        metrics = utils.Metrics()
+        utils.add_hook(metrics)
+        ...
+        metrics.requests["www.sec.gov"]["download_time"]
+    """
+    def __init__(self) -> None:
+        self._requests = {}
+        self._parsing = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: dict) -> None:
+        with self._lock:
+            if event["type"] == "request":
+                host = self._requests.setdefault(
+                    event["host"],
+                    {
+                        "count": 0, "errors": 0, "bytes": 0, "hits": 0, "revalidated": 0, "misses": 0,
+                        "ttfb": 0.0, "download_time": 0.0, "wait_time": 0.0, "total_time": 0.0
+                    }
+                )
+                host["count"] += 1
+                host["errors"] += event["status"] >= 400
+                host["bytes"] += event["bytes"] or 0
+                if event["cache"] in ("hit", "fixture"):
+                    host["hits"] += 1
+                elif event["cache"] == "revalidated":
+                    host["revalidated"] += 1
+                elif event["cache"] == "miss":
+                    host["misses"] += 1
+                for key in ("ttfb", "download_time", "wait_time", "total_time"):
+                    host[key] += event[key]
+            elif event["type"] == "parse":
+                stage = self._parsing.setdefault(event["name"], {"count": 0, "errors": 0, "duration": 0.0})
+                stage["count"] += 1
+                stage["errors"] += event["error"] is not None
+                stage["duration"] += event["duration"]
+
+    @property
+    def requests(self) -> dict:
+        return deepcopy(self._requests)
+
+    @property
+    def parsing(self) -> dict:
+        return deepcopy(self._parsing)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._requests = {}
+            self._parsing = {}
+
+
+# Response cache. Each source declares how long its responses stay fresh; the values
+# are looked up at request time and can therefore be overridden by the user.
+CACHE_TTL = {
+    "aqr": 24 * 60 * 60,
+    "fred": 60 * 60,
+    "french": 24 * 60 * 60,
+    "sec_archive": float("inf"), # filings in the EDGAR archive are immutable
+    "sec_companyfacts": 24 * 60 * 60,
+    "sec_frames": 24 * 60 * 60,
+    "sec_tickers": 24 * 60 * 60,
+    "yahoo": 5 * 60
+}
+CACHE_DIRECTORY = Path.home() / ".cache" / "findata" / "http"
+CACHE_MAX_SIZE = 2 * 1024**3 # bytes
+
+_cache = None
+
+
+class ResponseCache:
+    """
+    ResponseCache stores raw response bodies on disk, keyed by the method, the url including its query parameters and the request body.
+    Each entry consists of a body file and a json file with the status code, the headers and the time the entry was stored or last revalidated.
+    If the total size of all bodies exceeds max_size, the least recently used entries are evicted.
+    """
+    _stored_headers = ("Content-Type", "Date", "ETag", "Expires", "Last-Modified")
+
+    def __init__(self, directory, max_size: int = CACHE_MAX_SIZE) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_size = max_size
+        self._size = None
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @staticmethod
+    def key(method: str, url: str, params=None, data=None, json_=None) -> str:
+        url = requests.Request(method, url, params=params).prepare().url
+        body = json.dumps(json_, sort_keys=True) if json_ is not None else data
+        if isinstance(body, dict):
+            body = json.dumps(body, sort_keys=True)
+        if isinstance(body, str):
+            body = body.encode()
+        digest = hashlib.sha256(f"{method.upper()} {url}".encode())
+        if body is not None:
+            digest.update(b"\n" + body)
+        return digest.hexdigest()
+
+    def _paths(self, key: str) -> tuple:
+        folder = self._directory / key[:2]
+        return folder / f"{key}.json", folder / f"{key}.body"
+
+    def load(self, key: str):
+        """
+        Returns a tuple of the metadata dictionary and the body of the entry or None if there is no entry for the given key.
+        """
+        entry = self._read(key)
+        if entry is not None:
+            now = time.time()
+            try:
+                os.utime(self._paths(key)[1], (now, now))
+            except OSError:
+                pass
+        return entry
+
+    def _read(self, key: str):
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, "r") as file:
+                meta = json.load(file)
+            with open(body_path, "rb") as file:
+                body = file.read()
+        except (FileNotFoundError, ValueError):
+            return None
+        return meta, body
+
+    def _meta(self, response: requests.Response) -> dict:
+        return {
+            "url": response.url,
+            "status_code": response.status_code,
+            "encoding": response.encoding,
+            "headers": {name: response.headers[name] for name in self._stored_headers if name in response.headers},
+            "stored": time.time()
+        }
+
+    def store(self, key: str, response: requests.Response) -> None:
+        meta_path, body_path = self._paths(key)
+        meta_path.parent.mkdir(exist_ok=True)
+        body = response.content
+        meta = self._meta(response)
+        with self._lock:
+            size = self._current_size()
+            if body_path.exists():
+                size -= body_path.stat().st_size
+            self._write(body_path, body)
+            self._write(meta_path, json.dumps(meta).encode())
+            self._size = size + len(body)
+            if self._size > self._max_size:
+                self._evict()
+
+    def refresh(self, key: str, meta: dict) -> None:
+        """
+        Marks a revalidated entry as fresh again.
+        """
+        meta_path, _ = self._paths(key)
+        meta["stored"] = time.time()
+        self._write(meta_path, json.dumps(meta).encode())
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self._directory.glob("*/*"):
+                path.unlink()
+            self._size = 0
+
+    @staticmethod
+    def _write(path: Path, content: bytes) -> None:
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(temp_path, "wb") as file:
+            file.write(content)
+        os.replace(temp_path, path)
+
+    def _current_size(self) -> int:
+        if self._size is None:
+            self._size = sum(path.stat().st_size for path in self._directory.glob("*/*.body"))
+        return self._size
+
+    def _evict(self) -> None:
+        bodies = sorted(self._directory.glob("*/*.body"), key=lambda path: path.stat().st_mtime)
+        for body_path in bodies:
+            if self._size <= self._max_size:
+                break
+            size = body_path.stat().st_size
+            body_path.unlink()
+            body_path.with_suffix(".json").unlink(missing_ok=True)
+            self._size -= size
+
+
+def enable_cache(directory=None, max_size: int = None) -> ResponseCache:
+    """
+    Enables the on-disk response cache. Requests that are sent with a time-to-live (ttl) are then served from the cache while they are fresh
+    and revalidated with a conditional request (ETag or Last-Modified) once they are stale.
+    """
+    global _cache
+    _cache = ResponseCache(
+        directory=CACHE_DIRECTORY if directory is None else directory,
+        max_size=CACHE_MAX_SIZE if max_size is None else max_size
+    )
+    return _cache
+
+
+def disable_cache() -> None:
+    global _cache
+    _cache = None
+
+
+def _cached_response(meta: dict, body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = meta["status_code"]
+    response.reason = meta.get("reason")
+    response._content = body
+    response._content_consumed = True
+    response.headers = CaseInsensitiveDict(meta["headers"])
+    response.url = meta["url"]
+    response.encoding = meta["encoding"]
+    response.from_cache = True
+    return response
+
+
+# Record/replay transport. In record mode every response is additionally written to a
+# fixture directory, in replay mode responses are served from that directory only, so that
+# tests and benchmarks run offline and independent of network latency.
+_fixtures = None
+
+
+class FixtureError(LookupError):
+    pass
+
+
+class FixtureStore(ResponseCache):
+    """
+    FixtureStore keeps recorded responses in the same layout as ResponseCache, but never evicts entries and keeps all response headers except cookies.
+
+    Modes
+    ----------------------
+    record
+        Every request goes to the network and its response is written to the store.
+    replay
+        Every request is served from the store. A request without a recorded response raises a FixtureError.
+    once
+        Recorded responses are replayed, missing responses are fetched from the network and recorded.
+    """
+    _modes = ("record", "replay", "once")
+
+    def __init__(self, directory, mode: str = "replay", latency: float = 0) -> None:
+        if mode not in self._modes:
+            raise ValueError(f"mode has to be one of {self._modes}")
+        super().__init__(directory, max_size=float("inf"))
+        self._mode = mode
+        self._latency = latency
+
+    @property
+    def latency(self) -> float:
+        return self._latency
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    def _meta(self, response: requests.Response) -> dict:
+        meta = super()._meta(response)
+        meta["reason"] = response.reason
+        meta["headers"] = {name: value for name, value in response.headers.items() if name.lower() != "set-cookie"}
+        return meta
+
+    def replay(self, method: str, url: str, kwargs: dict):
+        """
+        Returns the recorded response or None if the request has to be sent over the network.
+        """
+        if self._mode == "record":
+            return None
+        key = self.key(method, url, kwargs.get("params"), kwargs.get("data"), kwargs.get("json"))
+        entry = self._read(key)
+        if entry is None:
+            if self._mode == "replay":
+                raise FixtureError(f'No recorded response for {method} "{url}" (params: {kwargs.get("params")}) in {self._directory}')
+            return None
+        response = _cached_response(*entry)
+        response.from_fixture = True
+        return response
+
+    def record(self, method: str, url: str, kwargs: dict, response: requests.Response) -> None:
+        # transient failures are not recorded, otherwise they would be replayed forever
+        if response.status_code in RETRY_STATUS_CODES or is_rate_limited(response) or kwargs.get("stream", False):
+            return
+        key = self.key(method, url, kwargs.get("params"), kwargs.get("data"), kwargs.get("json"))
+        self.store(key, response)
+
+
+def enable_fixtures(directory, mode: str = "replay", latency: float = 0) -> FixtureStore:
+    """
+    Enables the record/replay transport for all requests sent via request, get and post and their asynchronous counterparts.
+    Replayed responses are returned after a constant latency in seconds (default: 0) and bypass rate limits, retries and the response cache.
+    """
+    global _fixtures
+    _fixtures = FixtureStore(directory=directory, mode=mode, latency=latency)
+    return _fixtures
+
+
+def disable_fixtures() -> None:
+    global _fixtures
+    _fixtures = None
+
+
+def _lookup(method: str, url: str, ttl: float, kwargs: dict) -> tuple:
+    """
+    Returns the cache key, the cache entry and the cached response if the entry is still fresh.
+    If the entry is stale, conditional request headers are added to kwargs.
+    """
+    if _cache is None or ttl is None or kwargs.get("stream", False):
+        return None, None, None
+    key = _cache.key(method, url, kwargs.get("params"), kwargs.get("data"), kwargs.get("json"))
+    entry = _cache.load(key)
+    if entry is None:
+        return key, None, None
+    meta, body = entry
+    if time.time() - meta["stored"] < ttl:
+        return key, entry, _cached_response(meta, body)
+    headers = dict(kwargs.get("headers") or {})
+    if "ETag" in meta["headers"]:
+        headers["If-None-Match"] = meta["headers"]["ETag"]
+    if "Last-Modified" in meta["headers"]:
+        headers["If-Modified-Since"] = meta["headers"]["Last-Modified"]
+    kwargs["headers"] = headers
+    return key, entry, None
+
+
+def _update(key: str, entry: tuple, response: requests.Response) -> requests.Response:
+    if key is not None and _cache is not None:
+        if response.status_code == 304 and entry is not None:
+            _cache.refresh(key, entry[0])
+            return _cached_response(*entry)
+        if response.status_code == 200:
+            _cache.store(key, response)
+    response.from_cache = False
+    return response
+
+
+def request(method: str, url: str, ttl: float = None, **kwargs) -> requests.Response:
+    """
+    Sends an HTTP request over the shared transport. Takes the same keyword arguments as requests.request.
+
+    If the response cache is enabled and a time-to-live in seconds is given, responses are stored on disk.
+    Fresh entries are returned without any network request and stale entries are revalidated with a conditional request.
+    """
+    kwargs.setdefault("timeout", TIMEOUT)
+    start = time.perf_counter()
+    fixtures = _fixtures
+    if fixtures is not None:
+        response = fixtures.replay(method, url, kwargs)
+        if response is not None:
+            if fixtures.latency:
+                time.sleep(fixtures.latency)
+            _report(method, url, response, start, "fixture")
+            return response
+    key, entry, response = _lookup(method, url, ttl, kwargs)
+    if response is not None:
+        cache = "hit"
+    else:
+        response = _update(key, entry, _send(method, url, **kwargs))
+        cache = None if key is None else ("revalidated" if response.from_cache else "miss")
+    if fixtures is not None:
+        fixtures.record(method, url, kwargs, response)
+    _report(method, url, response, start, cache)
+    return response
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return request("POST", url, **kwargs)
+
+
+# Asynchronous transport. The coroutines mirror request/get/post on top of aiohttp and
+# share the response cache, the rate limiters and the retry policy with the synchronous
+# transport. They return requests.Response objects, so readers can reuse their parsing code.
+_async_sessions = weakref.WeakKeyDictionary()
+
+
+def _import_aiohttp():
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError("The asynchronous API requires aiohttp to be installed (pip install aiohttp)")
+    return aiohttp
+
+
+def async_session():
+    """
+    Returns the aiohttp session of the running event loop that holds the per-host connection pools.
+    """
+    aiohttp = _import_aiohttp()
+    loop = asyncio.get_running_loop()
+    session = _async_sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(limit=POOL_CONNECTIONS * POOL_MAXSIZE, limit_per_host=POOL_MAXSIZE)
+        session = aiohttp.ClientSession(connector=connector, headers={"Accept-Encoding": ACCEPT_ENCODING})
+        _async_sessions[loop] = session
+    return session
+
+
+async def close_async_session() -> None:
+    """
+    Closes the aiohttp session of the running event loop.
+    """
+    session = _async_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+async def _async_send(method: str, url: str, **kwargs) -> requests.Response:
+    aiohttp = _import_aiohttp()
+    from yarl import URL
+
+    params = kwargs.pop("params", None)
+    if params is not None:
+        url = requests.Request(method, url, params=params).prepare().url
+    timeout = kwargs.pop("timeout", TIMEOUT)
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+    kwargs.pop("stream", None)
+
+    limiter = rate_limiter(url)
+    wait_time = 0.0
+    for attempt in range(RETRY_ATTEMPTS):
+        if limiter is not None:
+            wait = limiter.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                wait_time += wait
+        last_attempt = attempt + 1 == RETRY_ATTEMPTS
+        try:
+            start = time.perf_counter()
+            async with async_session().request(method, URL(url, encoded=True), timeout=timeout, **kwargs) as http_response:
+                response = requests.Response()
+                response.elapsed = timedelta(seconds=time.perf_counter() - start)
+                response.status_code = http_response.status
+                response.reason = http_response.reason
+                response._content = await http_response.read()
+                response.headers = CaseInsensitiveDict(http_response.headers)
+                response.url = str(http_response.url)
+                response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if last_attempt:
+                raise
+            pause = backoff(attempt)
+            await asyncio.sleep(pause)
+            wait_time += pause
+            continue
+        if last_attempt:
+            break
+        if response.status_code in RETRY_STATUS_CODES or is_rate_limited(response):
+            pause = backoff(attempt, _retry_after(response))
+            await asyncio.sleep(pause)
+            wait_time += pause
+            continue
+        break
+    response.attempts = attempt + 1
+    response.wait_time = wait_time
+    return response
+
+
+async def async_request(method: str, url: str, ttl: float = None, **kwargs) -> requests.Response:
+    """
+    Sends an HTTP request over the asynchronous transport. Takes the same keyword arguments as request.
+    """
+    kwargs.setdefault("timeout", TIMEOUT)
+    start = time.perf_counter()
+    fixtures = _fixtures
+    if fixtures is not None:
+        response = fixtures.replay(method, url, kwargs)
+        if response is not None:
+            if fixtures.latency:
+                await asyncio.sleep(fixtures.latency)
+            _report(method, url, response, start, "fixture")
+            return response
+    key, entry, response = _lookup(method, url, ttl, kwargs)
+    if response is not None:
+        cache = "hit"
+    else:
+        response = _update(key, entry, await _async_send(method, url, **kwargs))
+        cache = None if key is None else ("revalidated" if response.from_cache else "miss")
+    if fixtures is not None:
+        fixtures.record(method, url, kwargs, response)
+    _report(method, url, response, start, cache)
+    return response
+
+
+async def async_get(url: str, **kwargs) -> requests.Response:
+    return await async_request("GET", url, **kwargs)
+
+
+async def async_post(url: str, **kwargs) -> requests.Response:
+    return await async_request("POST", url, **kwargs)
+
 
 SERVER_ERROR_MESSAGE = b"<?xml version='1.0' encoding='UTF-8'?><Error><Code>AccessDenied</Code><Message>Access denied.</Message><Details>Anonymous caller does not have storage.objects.get access to the Google Cloud Storage object. Permission 'storage.objects.get' denied on resource (or it may not exist).</Details></Error>"
 
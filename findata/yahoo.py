@@ -5,7 +5,6 @@ from html import unescape
 import numpy as np
 import pandas as pd
 import re
-import requests
 import time
 from typing import Optional
 from . import utils
@@ -168,7 +167,7 @@ class YahooReader:
             data = json_data
         else:
             # parse html data
-            html = requests.get(f"https://finance.yahoo.com/quote/{self.ticker}/{suffix}", headers=utils.YAHOO_HEADERS).text
+            html = utils.get(f"https://finance.yahoo.com/quote/{self.ticker}/{suffix}", headers=utils.YAHOO_HEADERS).text
             soup = BeautifulSoup(html, "lxml")
 
             html_data = {}
@@ -418,7 +417,25 @@ class YahooReader:
         return ordered_data
     
     def _request_data(self) -> dict:
-        parameters = {
+        data = utils.get(
+            url=self._main_url.format(self.ticker),
+            params=self._summary_parameters(),
+            headers=utils.YAHOO_HEADERS,
+            ttl=utils.CACHE_TTL["yahoo"]
+        ).json()
+        return self._parse_summary(data)
+
+    async def _request_data_async(self) -> dict:
+        response = await utils.async_get(
+            url=self._main_url.format(self.ticker),
+            params=self._summary_parameters(),
+            headers=utils.YAHOO_HEADERS,
+            ttl=utils.CACHE_TTL["yahoo"]
+        )
+        return self._parse_summary(response.json())
+
+    def _summary_parameters(self) -> dict:
+        return {
             "modules": ",".join(
                 (
                     "assetProfile",
@@ -461,13 +478,9 @@ class YahooReader:
             "formatted": False,
             "crumb": utils.YAHOO_CRUMB
         }
-        
-        data = requests.get(
-            url=self._main_url.format(self.ticker),
-            params=parameters,
-            headers=utils.YAHOO_HEADERS
-        ).json()
 
+    @utils.instrumented
+    def _parse_summary(self, data) -> dict:
         if data["quoteSummary"]["error"] is not None:
             raise utils.TickerError(f"no data found for ticker '{self.ticker}'")
         data = data["quoteSummary"]["result"][0]
@@ -533,7 +546,7 @@ class YahooReader:
                 "offset": offset,
                 "size": 100
             }
-            html = requests.get(
+            html = utils.get(
                 url=f"https://finance.yahoo.com/calendar/earnings",
                 params=params,
                 headers=utils.YAHOO_HEADERS
@@ -766,6 +779,39 @@ class YahooReader:
             print("Warning: option price data is bugged and hence is not implemented!")
             return
 
+        reponse = utils.get(
+            url=self._price_url.format(self.ticker),
+            params=self._historical_data_parameters(frequency, start, end),
+            headers=utils.YAHOO_HEADERS
+        )
+        return self._parse_historical_data(reponse, frequency, returns, timestamps)
+
+    async def historical_data_async(
+        self,
+        frequency="1d",
+        start=dt.date(1930, 1, 1),
+        end=dt.date.today(),
+        returns=True,
+        timestamps=False
+    ) -> Optional[dict]:
+        """
+        Asynchronous version of historical_data, see there for the parameters
+        """
+        if not hasattr(self, "_raw_data"):
+            self._raw_data = await self._request_data_async()
+
+        if self.security_type == "OPTION":
+            print("Warning: option price data is bugged and hence is not implemented!")
+            return
+
+        reponse = await utils.async_get(
+            url=self._price_url.format(self.ticker),
+            params=self._historical_data_parameters(frequency, start, end),
+            headers=utils.YAHOO_HEADERS
+        )
+        return self._parse_historical_data(reponse, frequency, returns, timestamps)
+
+    def _historical_data_parameters(self, frequency, start, end) -> dict:
         if frequency not in ("1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo"):
             raise ValueError('frequency has to be one of ("1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo")')
 
@@ -805,7 +851,7 @@ class YahooReader:
         elif (end - start) > 60*60*24*365*100:
             raise ValueError("daily and monthly data can only be fetched for 100 years per request")
 
-        parameters = {
+        return {
             "period1": start,
             "period2": end,
             "interval": frequency,
@@ -813,12 +859,8 @@ class YahooReader:
             "includeAdjustedClose": True
         }
 
-        reponse = requests.get(
-            url=self._price_url.format(self.ticker),
-            params=parameters,
-            headers=utils.YAHOO_HEADERS
-        )
-
+    @utils.instrumented
+    def _parse_historical_data(self, reponse, frequency, returns, timestamps) -> Optional[dict]:
         url = reponse.url
         data = reponse.json()
         
@@ -1104,14 +1146,14 @@ class YahooReader:
 
     def logo(self) -> Optional[bytes]:
         if self.profile() is not None and "website" in self.profile().keys():
-            response = requests.get(
+            response = utils.get(
                 url=f"https://logo.clearbit.com/{self.profile()['website']}",
                 headers=utils.YAHOO_HEADERS
             ).content
             if response != b"\n":
                 return response
 
-        response = requests.get(
+        response = utils.get(
             url=f"https://storage.googleapis.com/iexcloud-hl37opg/api/logos/{self.ticker.replace('-', '.')}.png",
             headers=utils.YAHOO_HEADERS
         ).content
@@ -1153,7 +1195,7 @@ class YahooReader:
             "strikeMax": strike_max
         }
 
-        options_list = requests.get(
+        options_list = utils.get(
             url=self._options_url.format(self.ticker),
             headers=utils.YAHOO_HEADERS,
             params=parameters
@@ -1395,33 +1437,36 @@ class YahooReader:
         """
         This classmethod takes an isin or other identifier and returns the corresponding Yahoo ticker if it exists.
         If there is no corresponding ticker found, None is returned instead.
+        If the requests are rate limited, the lookup is retried with exponential backoff and a PermissionError is raised
+        once utils.RETRY_ATTEMPTS attempts have failed. pause is the upper bound in seconds of the backoff between two attempts,
+        not a fixed pause after each rate-limited request.
         """
         params = {"yfin-usr-qry": identifier}
-        response = requests.get(cls._quote_url, params=params, headers=utils.YAHOO_HEADERS)
+        response = utils.get(cls._quote_url, params=params, headers=utils.YAHOO_HEADERS)
         try:
             ticker = re.findall(r"https://finance.yahoo.com/quote/([A-Z0-9\.]+)/", response.url)[0].strip()
             return ticker
         except IndexError:
             # check if the http requests are rate limited or if the ticker does not exist
-            limited = True
-            while limited:
-                try:
-                    params_appl = {"yfin-usr-qry": "US0378331005"}
-                    response_appl = requests.get(cls._quote_url, params=params_appl, headers=utils.YAHOO_HEADERS)
-                    ticker = re.findall(fr"{cls._quote_url}([A-Z0-9\.]+)\?.tsrc=fin-srch", response_appl.url)[0].strip()
-                    limited = False
-                except IndexError:
-                    print(f"Rate limited: Pause {pause} seconds")
-                    time.sleep(pause)
+            params_appl = {"yfin-usr-qry": "US0378331005"}
+            for attempt in range(utils.RETRY_ATTEMPTS):
+                response_appl = utils.get(cls._quote_url, params=params_appl, headers=utils.YAHOO_HEADERS)
+                if re.findall(fr"{cls._quote_url}([A-Z0-9\.]+)\?.tsrc=fin-srch", response_appl.url):
+                    break
+                time.sleep(utils.backoff(attempt, max_backoff=pause))
+            else:
+                raise PermissionError("Requests have been rate limited")
+            # the first lookup may have been rate limited as well, so it is repeated now that requests go through again
+            response = utils.get(cls._quote_url, params=params, headers=utils.YAHOO_HEADERS)
             try:
-                ticker = re.findall(fr"{cls._quote_url}([A-Z0-9\.]+)\?.tsrc=fin-srch", response.url)[0].strip()
+                ticker = re.findall(fr"{cls._quote_url}([A-Z0-9\.]+)(?:/|\?.tsrc=fin-srch)", response.url)[0].strip()
             except IndexError:
                 ticker = None
             return ticker
 
     @staticmethod
     def currencies() -> list:
-        data = requests.get(
+        data = utils.get(
             url="https://query1.finance.yahoo.com/v1/finance/currencies",
             headers=utils.YAHOO_HEADERS
         ).json()
@@ -0,0 +1,59 @@
+from findata import utils
+from pathlib import Path
+import pytest
+
+FIXTURE_DIRECTORY = Path(__file__).parent / "fixtures"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--http-mode",
+        choices=("live", "record", "replay", "once"),
+        default="live",
+        help=(
+            "live: send all requests to the websites, "
+            "record: send all requests and store the responses in tests/fixtures, "
+            "replay: serve all responses from tests/fixtures and skip the tests whose responses have not been recorded, "
+            "once: replay stored responses and record missing ones"
+        )
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "no_replay: the test manages the transport itself and never uses the fixture store")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def http_mode(request):
+    # enabled for the whole session, so that requests in setup_class are replayed as well
+    mode = request.config.getoption("--http-mode")
+    if mode == "live":
+        yield None
+        return
+    yield utils.enable_fixtures(FIXTURE_DIRECTORY, mode=mode)
+    utils.disable_fixtures()
+
+
+@pytest.fixture(autouse=True)
+def http_fixtures(request, http_mode):
+    if http_mode is None or request.node.get_closest_marker("no_replay") is None:
+        yield http_mode
+        return
+    utils.disable_fixtures()
+    yield None
+    utils.enable_fixtures(FIXTURE_DIRECTORY, mode=http_mode.mode)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    # tests whose responses have not been recorded yet are skipped in replay mode instead of failing
+    if call.excinfo is None or item.config.getoption("--http-mode") != "replay":
+        return
+    error = call.excinfo.value
+    while error is not None and not isinstance(error, utils.FixtureError):
+        error = error.__cause__ or error.__context__
+    if error is not None:
+        report.outcome = "skipped"
+        report.longrepr = (str(item.path), item.location[1], f"Skipped: {error}, record it with pytest --http-mode=record")
@@ -0,0 +1,47 @@
+import findata
+import json
+from pathlib import Path
+import pytest
+import subprocess
+import sys
+
+pytestmark = pytest.mark.no_replay
+
+HEAVY_MODULES = ("bs4", "lxml", "pandas", "requests", "selenium")
+
+
+def _run(code: str):
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parents[1],
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return json.loads(output)
+
+
+def test_import_is_lazy():
+    loaded = _run(f"import findata, json, sys; print(json.dumps([name for name in {HEAVY_MODULES} if name in sys.modules]))")
+    assert loaded == []
+
+
+def test_selenium_is_only_loaded_by_selenium_readers():
+    loaded = _run("import findata, json, sys; findata.FREDReader; findata.Filing13F; print(json.dumps('selenium' in sys.modules))")
+    assert loaded is False
+    loaded = _run("import findata, json, sys; findata.CMEReader; print(json.dumps('selenium' in sys.modules))")
+    assert loaded is True
+
+
+def test_import_time():
+    # generous bound, importing all submodules eagerly took close to a second
+    seconds = _run("import time; start = time.perf_counter(); import findata; print(time.perf_counter() - start)")
+    assert seconds < 0.1
+
+
+def test_exports():
+    for name in findata.__all__:
+        assert getattr(findata, name).__name__ == name
+    assert findata.utils.DatasetError is findata.DatasetError
+    with pytest.raises(AttributeError):
+        findata.NotAReader
@@ -1,18 +1,38 @@
+import asyncio
+from bs4 import BeautifulSoup
+import copy
+import json
+import pickle
 import re
+import time
+import zipfile
+from benchmarks import corpus
+from findata import sec
 from findata.sec import _SECFiling
+from findata.utils import DatasetError, FixtureError
 from findata import (
+    fetch_filings,
+    iter_sec_filings,
     latest_sec_filings,
+    sec_filings,
+    sec_filings_async,
     sec_companies,
     sec_mutualfunds,
+    CIKResolver,
     Filing13G,
     Filing13D,
+    Filing10K,
     Filing13F,
     FilingNPORT,
     Filing3,
     Filing4,
-    Filing5
+    Filing5,
+    SECFundamentals,
+    SECIndex,
+    SECSubmissions
 )
 import pandas as pd
+import pytest
 from pandas.tseries.offsets import DateOffset
 
 NoneType = type(None)
@@ -61,6 +81,747 @@ def test_latest_sec_filings():
         assert isinstance(filing["date_filed"], int)
 
 
+def test_iter_sec_filings():
+    # Berkshire Hathaway has filed far more Form 4 filings than fit on one page of the full-text search
+    filings = list(iter_sec_filings(cik=1067983, form_types="4", start="2005-01-01", end="2022-12-31"))
+    assert len(filings) > 100
+    assert len({filing["accession_number"] for filing in filings}) == len(filings)
+    for filing in filings:
+        assert filing["type"] == "4"
+        assert "2005-01-01" <= filing["date_filed"] <= "2022-12-31"
+
+
+def test_fetch_filings():
+    filings = [
+        {"type": "NPORT-P", "document_url": "https://www.sec.gov/Archives/edgar/data/930667/000175272422234894/0001752724-22-234894.txt"},
+        {"type": "NPORT-P", "document_url": "https://www.sec.gov/Archives/edgar/data/1444822/000175272422264732/0001752724-22-264732.txt"},
+        {"type": "S-1", "document_url": "https://www.sec.gov/Archives/edgar/data/320193/000119312519041014/0001193125-19-041014.txt"}
+    ]
+    results = list(fetch_filings(filings, processes=2))
+    assert len(results) == 3
+    # fetch_filings reports errors per filing, so missing recorded responses do not propagate in replay mode
+    for result in results:
+        if isinstance(result["error"], FixtureError):
+            pytest.skip(f"{result['error']}, record it with pytest --http-mode=record")
+    for result in results:
+        assert result["filing"] in filings
+        if result["filing"]["type"] == "NPORT-P":
+            assert isinstance(result["data"], FilingNPORT)
+            assert result["error"] is None
+        else:
+            assert result["data"] is None
+            assert isinstance(result["error"], ValueError)
+
+
+def test_sec_index(tmp_path):
+    index = SECIndex(path=tmp_path / "index.sqlite", start="2019-01-01")
+    assert index.update(start="2019-01-01", end="2019-03-31") > 0
+    assert index.update(start="2019-01-01", end="2019-03-31") == 0
+    filings = index.filings(cik=320193, form_types="SC 13G", start="2019-02-14", end="2019-02-14")
+    assert "0001193125-19-041014" in [filing["accession_number"] for filing in filings]
+    for filing in filings:
+        assert filing["type"] == "SC 13G"
+        assert filing["date_filed"] == "2019-02-14"
+        assert filing["document_url"] == f"https://www.sec.gov/Archives/edgar/data/320193/{filing['accession_number'].replace('-', '')}/{filing['accession_number']}.txt"
+
+
+def test_sec_index_before_start(tmp_path, monkeypatch):
+    searches = []
+    monkeypatch.setattr(sec, "_iter_search", lambda params, max_workers: iter(searches.append(params) or []))
+    index = sec.enable_index(path=tmp_path / "index.sqlite", start="2019-01-01")
+    monkeypatch.setattr(index, "update", lambda start, end: 0)
+    try:
+        sec_filings(cik=320193, start="2005-01-01", end="2020-12-31")
+        sec_filings(cik=320193, start="2019-06-01", end="2020-12-31")
+    finally:
+        sec.disable_index()
+    # only the timeframe before the start of the index is searched
+    assert [(params["startdt"], params["enddt"]) for params in searches] == [("2005-01-01", "2018-12-31")]
+
+
+def test_filing4_post_transaction_owned():
+    filing = Filing4(file=corpus.synthetic_form4(transactions=3))
+    for security in filing.non_derivative_securities:
+        assert security["post_transaction_owned"]["type"] == {"abbr": "SH", "name": "Shares"}
+        assert security["post_transaction_owned"]["value"] == 2 * security["transaction"]["shares"]
+    # the parsed filing holds no parse trees, so it can be returned from the worker processes of fetch_filings
+    assert pickle.loads(pickle.dumps(filing)).non_derivative_securities == filing.non_derivative_securities
+
+
+def test_split_timeframe():
+    params = {"startdt": "2020-01-01", "enddt": "2020-01-31"}
+    assert sec._split_timeframe(params, {"value": 10, "relation": "eq"}) is None
+    later, earlier = sec._split_timeframe(params, {"value": 10_000, "relation": "gte"})
+    assert (earlier["startdt"], earlier["enddt"], later["startdt"], later["enddt"]) == ("2020-01-01", "2020-01-16", "2020-01-17", "2020-01-31")
+    # a single day cannot be split any further, so its filings would be cut off
+    with pytest.raises(DatasetError):
+        sec._split_timeframe({"startdt": "2020-01-02", "enddt": "2020-01-02"}, {"value": 10_000, "relation": "gte"})
+
+
+def test_sec_filings_async_index(tmp_path, monkeypatch):
+    async def search(params):
+        raise AssertionError("the full-text search is not used for filings in the index")
+    monkeypatch.setattr(sec, "_search_async", search)
+    index = sec.enable_index(path=tmp_path / "index.sqlite", start="2019-01-01")
+    monkeypatch.setattr(index, "update", lambda start, end: 0)
+    try:
+        assert asyncio.run(sec_filings_async(cik=320193, start="2020-01-01")) == []
+    finally:
+        sec.disable_index()
+
+
+def test_sec_submissions(tmp_path):
+    submissions = SECSubmissions(path=tmp_path / "submissions.sqlite")
+    assert submissions.update(320193) > 1000
+    assert submissions.update(320193) == 0
+    filings = submissions.filings(cik=320193, form_types="10-K", start="2019-10-01", end="2019-12-31")
+    assert [filing["accession_number"] for filing in filings] == ["0000320193-19-000119"]
+    assert filings[0]["date_of_period"] == "2019-09-28"
+    assert filings[0]["file_number"] == "001-36743"
+
+
+def test_cik_resolver(tmp_path):
+    resolver = CIKResolver(path=tmp_path / "tickers.json")
+    assert resolver.cik("AAPL") == 320193
+    assert resolver.cik("aapl") == 320193
+    assert "AAPL" in resolver.tickers(320193)
+    series_cik = resolver.cik("VFIAX")
+    assert re.match(r"S[0-9]{9}", series_cik)
+    assert resolver.cik("VFIAX", mutualfunds=False) is None
+    assert "VFIAX" in resolver.tickers(series_cik)
+    assert resolver.entity(series_cik)["series_cik"] == series_cik
+    assert resolver.cik("NOT-A-TICKER") is None
+    # a second resolver reads the stored lists instead of downloading them again
+    stored = CIKResolver(path=tmp_path / "tickers.json")
+    stored._load()
+    assert stored.cik("AAPL") == 320193
+
+
+def test_cik_resolver_refresh(tmp_path, monkeypatch):
+    path = tmp_path / "tickers.json"
+    path.write_text(json.dumps({"created": time.time(), "companies": [{"ticker": "OLD", "cik": 1}], "mutualfunds": []}))
+    resolver = CIKResolver(path=path, ttl=60)
+    assert resolver.cik("OLD") == 1
+    monkeypatch.setattr(sec, "sec_companies", lambda: [{"ticker": "NEW", "cik": 2}])
+    monkeypatch.setattr(sec, "sec_mutualfunds", lambda: [])
+    assert resolver.cik("NEW") is None
+    # once the lists are older than the refresh interval, they are downloaded again without a new resolver
+    resolver._created -= 120
+    path.write_text(json.dumps({"created": resolver._created, "companies": [{"ticker": "OLD", "cik": 1}], "mutualfunds": []}))
+    assert resolver.cik("NEW") == 2
+    assert json.loads(path.read_text())["companies"] == [{"ticker": "NEW", "cik": 2}]
+
+
+def test_sec_fundamentals():
+    fundamentals = SECFundamentals(ticker="AAPL")
+    assert fundamentals.name == "Apple Inc."
+    assert list(fundamentals.facts.columns) == ["concept", "unit", "start", "end", "val", "fy", "fp", "form", "filed"]
+    assert set(fundamentals.facts["concept"]) == fundamentals.var_keys
+    revenue = fundamentals.get_variable("Revenue")
+    assert revenue["yearly"]["2019-09-28"] == 260_174_000_000
+    assert revenue["quarterly"]["2019-09-28"] == 64_040_000_000
+
+
+def test_sec_fundamentals_frame():
+    frame = SECFundamentals.frame("Revenue", "USD", "CY2019")
+    assert frame["cik"].is_unique
+    assert 320193 in frame["cik"].tolist()
+    assert set(frame["concept"]) <= set(SECFundamentals._popular_variables["Revenue"])
+    with pytest.raises(ValueError):
+        SECFundamentals.frame("Revenue", "USD", "2019")
+
+
+def test_sec_fundamentals_iter_bulk(tmp_path):
+    facts = {
+        "us-gaap": {
+            "Revenues": {
+                "label": "Revenues",
+                "description": None,
+                "units": {
+                    "USD": [
+                        {"start": "2020-01-01", "end": "2020-03-31", "val": 10, "fy": 2020, "fp": "Q1", "form": "10-Q", "filed": "2020-05-01"},
+                        {"start": "2020-01-01", "end": "2020-06-30", "val": 25, "fy": 2020, "fp": "Q2", "form": "10-Q", "filed": "2020-08-01"}
+                    ]
+                }
+            }
+        }
+    }
+    with zipfile.ZipFile(tmp_path / "companyfacts.zip", "w") as archive:
+        archive.writestr("CIK0000000001.json", json.dumps({"cik": 1, "entityName": "First Inc.", "facts": facts}))
+        archive.writestr("CIK0000000002.json", json.dumps({"cik": 2, "entityName": "Second Plc", "facts": {"ifrs-full": {}}}))
+    companies = list(SECFundamentals.iter_bulk(tmp_path / "companyfacts.zip"))
+    assert [company.cik for company in companies] == [1]
+    assert companies[0].name == "First Inc."
+    assert companies[0].data["Revenues"]["quarterly_data"] == {"2020-03-31": 10, "2020-06-30": 15}
+
+
+def _fact(start, end, val, fp, form="10-Q"):
+    fact = {"end": end, "val": val, "fy": int(end[:4]), "fp": fp, "form": form, "filed": end}
+    if start is not None:
+        fact["start"] = start
+    return fact
+
+
+def test_sec_fundamentals_data(tmp_path):
+    concepts = {
+        # year-to-date values of the second and third quarter and of the fiscal year
+        "Revenues": ("USD", [
+            _fact("2020-01-01", "2020-03-31", 10, "Q1"),
+            _fact("2020-01-01", "2020-06-30", 25, "Q2"),
+            _fact("2020-01-01", "2020-09-30", 45, "Q3"),
+            _fact("2020-01-01", "2020-12-31", 100, "FY", "10-K")
+        ]),
+        # without the first quarter, no year-to-date value can be differenced
+        "CostOfRevenue": ("USD", [
+            _fact("2020-01-01", "2020-06-30", 12, "Q2"),
+            _fact("2020-01-01", "2020-09-30", 20, "Q3"),
+            _fact("2020-01-01", "2020-12-31", 30, "FY", "10-K"),
+            _fact("2021-01-01", "2021-03-31", 8, "Q1")
+        ]),
+        "OperatingExpenses": ("USD", [
+            _fact("2020-01-01", "2020-03-31", 10, "Q1"),
+            _fact("2020-01-01", "2020-06-30", 25.5, "Q2"),
+            _fact("2020-01-01", "2020-09-30", 45, "Q3")
+        ]),
+        "EffectiveIncomeTaxRateContinuingOperations": ("pure", [
+            _fact("2019-01-01", "2019-12-31", 0, "FY", "10-K"),
+            _fact("2020-01-01", "2020-12-31", 0.21, "FY", "10-K")
+        ]),
+        "Assets": ("USD", [
+            _fact(None, "2020-03-31", 2**60 + 1, "Q1"),
+            _fact(None, "2020-12-31", 1.5, "FY", "10-K")
+        ])
+    }
+    facts = {
+        key: {"label": key, "description": None, "units": {unit: entries}}
+        for key, (unit, entries) in concepts.items()
+    }
+    with zipfile.ZipFile(tmp_path / "companyfacts.zip", "w") as archive:
+        archive.writestr("CIK0000000001.json", json.dumps({"cik": 1, "entityName": "First Inc.", "facts": {"us-gaap": facts}}))
+    data = next(SECFundamentals.iter_bulk(tmp_path / "companyfacts.zip")).data
+
+    def typed(values: dict) -> dict:
+        return {date: (type(value), value) for date, value in values.items()}
+
+    assert typed(data["Revenues"]["quarterly_data"]) == {
+        "2020-03-31": (int, 10), "2020-06-30": (int, 15), "2020-09-30": (int, 20), "2020-12-31": (int, 55)
+    }
+    assert typed(data["Revenues"]["yearly_data"]) == {"2020-12-31": (int, 100)}
+    assert typed(data["CostOfRevenue"]["quarterly_data"]) == {"2021-03-31": (int, 8)}
+    assert typed(data["CostOfRevenue"]["yearly_data"]) == {"2020-12-31": (int, 30)}
+    # values that are differenced against a float become floats, all others keep the type in which they are reported
+    assert typed(data["OperatingExpenses"]["quarterly_data"]) == {"2020-03-31": (int, 10), "2020-06-30": (float, 15.5), "2020-09-30": (float, 19.5)}
+    assert typed(data["EffectiveIncomeTaxRateContinuingOperations"]["yearly_data"]) == {"2019-12-31": (int, 0), "2020-12-31": (float, 0.21)}
+    assert data["EffectiveIncomeTaxRateContinuingOperations"]["unit"] == "pure"
+    assert typed(data["Assets"]["quarterly_data"]) == {"2020-03-31": (int, 2**60 + 1), "2020-12-31": (float, 1.5)}
+    assert typed(data["Assets"]["yearly_data"]) == {"2020-12-31": (float, 1.5)}
+
+
+def test_sec_fundamentals_bulk_load(tmp_path):
+    pytest.importorskip("pyarrow")
+    flows = {
+        "Revenues": {
+            "label": "Revenues",
+            "description": None,
+            "units": {
+                "USD": [
+                    {"start": "2020-01-01", "end": "2020-03-31", "val": 10, "fy": 2020, "fp": "Q1", "form": "10-Q", "filed": "2020-05-01"},
+                    {"start": "2020-01-01", "end": "2020-06-30", "val": 25, "fy": None, "fp": None, "form": "10-Q", "filed": "2020-08-01"}
+                ]
+            }
+        }
+    }
+    # the second company only reports stock variables with float values, so its start dates are all missing
+    stocks = {
+        "Assets": {
+            "label": "Assets",
+            "description": None,
+            "units": {
+                "USD": [
+                    {"end": "2020-03-31", "val": 1.5, "fy": 2020, "fp": "Q1", "form": "10-Q", "filed": "2020-05-01"}
+                ]
+            }
+        }
+    }
+    with zipfile.ZipFile(tmp_path / "companyfacts.zip", "w") as archive:
+        archive.writestr("CIK0000000001.json", json.dumps({"cik": 1, "entityName": "First Inc.", "facts": {"us-gaap": flows}}))
+        archive.writestr("CIK0000000002.json", json.dumps({"cik": 2, "entityName": "Second Inc.", "facts": {"us-gaap": stocks}}))
+    assert SECFundamentals.bulk_load(tmp_path / "companyfacts.zip", directory=tmp_path / "dataset") == 2
+    dataset = pd.read_parquet(tmp_path / "dataset").sort_values(["cik", "concept", "end"]).reset_index(drop=True)
+    assert dataset["cik"].astype(int).tolist() == [1, 1, 2]
+    assert dataset["val"].tolist() == [10.0, 25.0, 1.5]
+    assert dataset["fy"].tolist()[0::2] == [2020, 2020] and pd.isna(dataset["fy"][1])
+    assert dataset["start"].tolist()[:2] == ["2020-01-01", "2020-01-01"] and pd.isna(dataset["start"][2])
+
+
+def test_filing_10k_facts():
+    text = corpus.synthetic_10k(facts=50)
+    filing = Filing10K(file=text)
+    assert len(filing.facts) == 50
+    assert filing.facts["concept"].str.startswith("Concept").all()
+
+    # reference values read from the instance document with BeautifulSoup
+    instance = BeautifulSoup(filing._sections["value"], "lxml-xml").find("xbrl")
+    periods = {tag.get("id"): (tag.find("endDate") or tag.find("instant")).text for tag in instance.find_all("context")}
+    expected = {}
+    for tag in instance.find_all(contextRef=True):
+        expected.setdefault(tag.name, []).append((int(tag.text), periods[tag.get("contextRef")], "iso4217:USD"))
+    assert {
+        concept: [(value["value"], value["context"]["end"], value["unit"]) for value in values]
+        for concept, values in filing.data.items()
+    } == expected
+
+
+def test_filing_10k_sections():
+    filing = Filing10K(file=corpus.synthetic_10k(facts=10, reports=10))
+    # the XBRL sections are only parsed when a property first needs them
+    assert not hasattr(filing, "_statements") and not hasattr(filing, "_labels")
+    assert list(filing.reports) == [f"Report{index}" for index in range(10)]
+    assert len(filing.statements) == 8 and len(filing.disclosures) == 2
+    assert len(filing.labels) == 400
+    assert filing.labels["Concept7"] == {"label": "Concept 7", "terseLabel": "Concept 7 (terse)"}
+    assert set(filing.presentation) == set(filing.reports)
+    for concept in filing.presentation["Report0"].values():
+        assert concept["parent"] == "Concept0"
+        assert concept["preferred_label"] == "terseLabel"
+
+
+def test_filing_10k_path(tmp_path):
+    # a non-ASCII name makes the byte offsets of the file differ from the character offsets of the text
+    text = corpus.synthetic_10k(facts=50)
+    name = re.search(r"COMPANY CONFORMED NAME:\t+(.+)", text).group(1)
+    text = text.replace(name, "SOCIÉTÉ GÉNÉRALE")
+    path = tmp_path / "filing.txt"
+    path.write_text(text, encoding="utf-8")
+    filing, reference = Filing10K(path=path), Filing10K(file=text)
+    # the file is only mapped while it is read, so filings that are kept around hold no file descriptor
+    assert filing._file is None
+    assert filing.filer == reference.filer
+    assert filing.filer[0]["name"] == "SOCIÉTÉ GÉNÉRALE"
+    assert filing._sections == reference._sections
+    assert filing.data == reference.data
+    assert [document["filename"] for document in filing.documents] == [document["filename"] for document in reference.documents]
+    for document in filing.documents:
+        assert path.read_bytes()[document["start"]:document["end"]].startswith(b"<DOCUMENT>")
+        assert path.read_bytes()[document["start"]:document["end"]].endswith(b"</DOCUMENT>")
+    copy = pickle.loads(pickle.dumps(filing))
+    assert copy.statements == filing.statements
+    assert copy.document("EX-101.LAB") == reference.document("EX-101.LAB")
+
+
+def test_filing_10k_divide_unit():
+    text = corpus.synthetic_10k(facts=10).replace('unitRef="usd"', 'unitRef="usdPerShare"', 1)
+    filing = Filing10K(file=text)
+    units = [value["unit"] for values in filing.data.values() for value in values]
+    assert {"numerator": "iso4217:USD", "denominator": "xbrli:shares"} in units
+    assert "iso4217:USD/xbrli:shares" in filing.facts["unit"].tolist()
+
+
+def _filing_13f(entries: list, prefix: str = "") -> Filing13F:
+    # entries are (name, cusip, value, amount, option, voting authority) tuples, the option and voting authority may be None
+    table = "".join(
+        f"<{prefix}infoTable><{prefix}nameOfIssuer>{name}</{prefix}nameOfIssuer><{prefix}titleOfClass>COM</{prefix}titleOfClass>"
+        f"<{prefix}cusip>{cusip}</{prefix}cusip><{prefix}value>{value}</{prefix}value>"
+        f"<{prefix}shrsOrPrnAmt><{prefix}sshPrnamt>{amount}</{prefix}sshPrnamt><{prefix}sshPrnamtType>SH</{prefix}sshPrnamtType></{prefix}shrsOrPrnAmt>"
+        + (f"<{prefix}putCall>{option}</{prefix}putCall>" if option is not None else "")
+        + f"<{prefix}investmentDiscretion>SOLE</{prefix}investmentDiscretion>"
+        + (
+            f"<{prefix}votingAuthority><{prefix}Sole>{voting[0]}</{prefix}Sole><{prefix}Shared>{voting[1]}</{prefix}Shared>"
+            f"<{prefix}None>{voting[2]}</{prefix}None></{prefix}votingAuthority>"
+            if voting is not None else ""
+        )
+        + f"</{prefix}infoTable>"
+        for name, cusip, value, amount, option, voting in entries
+    )
+    namespace = f'xmlns{":" + prefix[:-1] if prefix else ""}="http://www.sec.gov/edgar/document/thirteenf/informationtable"'
+    information_table = f"<{prefix}informationTable {namespace}>{table}</{prefix}informationTable>"
+    text = re.sub(r"<informationTable .*</informationTable>", lambda match: information_table, corpus.synthetic_13f(holdings=1), flags=re.DOTALL)
+    return Filing13F(file=text)
+
+
+_HOLDINGS = [
+    ("ALPHA INC", "000000001", 300, 30, None, (30, 0, 0)),
+    ("BETA INC", "000000002", 100, 10, "Put", (0, 10, 0)),
+    ("ALPHA INC", "000000001", 100, 10, None, (5, 5, 0)),
+    ("GAMMA INC", "000000003", 400, 40, None, (0, 0, 40)),
+    ("BETA INC", "000000002", 100, 20, None, (20, 0, 0)),
+    ("DELTA INC", "000000004", 200, 20, "Call", (10, 10, 0))
+]
+
+
+@pytest.mark.parametrize("prefix", ["", "ns1:"])
+def test_filing13f_investments_frame(prefix):
+    filing = _filing_13f(_HOLDINGS, prefix)
+    frame = filing.investments_frame()
+    assert len(frame) == len(_HOLDINGS)
+    assert [
+        {
+            "name": name,
+            "title": title,
+            "cusip": cusip,
+            "market_value": market_value,
+            "quantity": {"amount": amount, "type": amount_type},
+            "option": None if pd.isna(option) else option,
+            "investment_discretion": investment_discretion,
+            "voting_authority": {"sole": sole, "shared": shared, "none": none}
+        }
+        for name, title, cusip, market_value, amount, amount_type, option, investment_discretion, sole, shared, none in frame.itertuples(index=False)
+    ] == [{key: value for key, value in security.items() if key != "included_managers"} for security in filing.investments]
+    assert frame.dtypes.astype(str).to_dict() == {
+        "name": "str",
+        "title": "str",
+        "cusip": "category",
+        "market_value": "int64",
+        "amount": "int64",
+        "amount_type": "category",
+        "option": "category",
+        "investment_discretion": "category",
+        "voting_sole": "Int64",
+        "voting_shared": "Int64",
+        "voting_none": "Int64"
+    }
+
+    # entries without a voting authority or option are missing in the frame
+    frame = _filing_13f([("ALPHA INC", "000000001", 300, 30, None, None), *_HOLDINGS[1:2]], prefix).investments_frame()
+    assert frame["voting_sole"].isna().tolist() == [True, False]
+    assert frame["option"].isna().tolist() == [True, False]
+    assert frame["amount"].tolist() == [30, 10]
+
+
+def _aggregate_portfolio(investments: list, sorted_by: str) -> list:
+    # the aggregation of Filing13F.aggregate_portfolio before it was built on the holdings frame, without mutating the investments
+    portfolio = {}
+    for security in investments:
+        key = (security["name"], security["title"], security["cusip"], security["option"])
+        if key not in portfolio:
+            portfolio[key] = {
+                "market_value": 0,
+                "quantity": {"amount": 0, "type": security["quantity"]["type"]},
+                "voting_authority": {"sole": 0, "shared": 0, "none": 0}
+            }
+        portfolio[key]["market_value"] += security["market_value"]
+        portfolio[key]["quantity"]["amount"] += security["quantity"]["amount"]
+        for authority in ("sole", "shared", "none"):
+            portfolio[key]["voting_authority"][authority] += security["voting_authority"][authority]
+    portfolio_value = sum(values["market_value"] for values in portfolio.values())
+    portfolio = [
+        {
+            "name": name,
+            "title": title,
+            "cusip": cusip,
+            "option": option,
+            "percentage": round(float(values["market_value"] / portfolio_value), 4) if len(portfolio) != 1 else 1,
+            **values
+        }
+        for (name, title, cusip, option), values in portfolio.items()
+    ]
+    if sorted_by == "amount":
+        return sorted(portfolio, key=lambda security: security["quantity"]["amount"], reverse=True)
+    if sorted_by is not None:
+        return sorted(portfolio, key=lambda security: security[sorted_by], reverse=sorted_by in ("market_value", "percentage"))
+    return portfolio
+
+
+def test_filing13f_aggregate_portfolio():
+    filing = _filing_13f(_HOLDINGS)
+    investments = copy.deepcopy(filing.investments)
+    # the holdings include equal market values, amounts and names, whose order has to be kept
+    for sorted_by in (None, "name", "title", "cusip", "market_value", "amount", "percentage"):
+        assert filing.aggregate_portfolio(sorted_by=sorted_by) == _aggregate_portfolio(investments, sorted_by)
+    # all holdings have the same investment discretion, so they are in the order in which they first appear
+    assert filing.aggregate_portfolio(sorted_by="investment_discretion") == _aggregate_portfolio(investments, None)
+    assert filing.investments == investments
+    with pytest.raises(ValueError):
+        filing.aggregate_portfolio(sorted_by="voting_authority")
+
+    frame = filing.aggregate_portfolio(as_frame=True)
+    assert frame.dtypes.astype(str).to_dict() == {
+        "name": "str",
+        "title": "str",
+        "cusip": "category",
+        "option": "object",
+        "percentage": "float64",
+        "market_value": "int64",
+        "amount": "int64",
+        "amount_type": "category",
+        "voting_sole": "Int64",
+        "voting_shared": "Int64",
+        "voting_none": "Int64"
+    }
+    expected = _aggregate_portfolio(investments, "percentage")
+    assert frame["name"].tolist() == [security["name"] for security in expected]
+    assert frame["option"].tolist() == [security["option"] for security in expected]
+    assert frame["voting_sole"].tolist() == [security["voting_authority"]["sole"] for security in expected]
+    assert filing.investments == investments
+
+    # a single holding makes up the whole portfolio
+    filing = _filing_13f(_HOLDINGS[:1])
+    assert filing.aggregate_portfolio() == _aggregate_portfolio(filing.investments, "percentage")
+    assert filing.aggregate_portfolio()[0]["percentage"] == 1
+
+
+# the expected entities of these headers are those of the regex-based parser that _tokenize_header replaced
+_HEADER_13D = (
+    "<SEC-DOCUMENT>0000000000-24-000001.txt : 20240214\n"
+    "<SEC-HEADER>0000000000-24-000001.hdr.sgml : 20240214\n"
+    "<ACCEPTANCE-DATETIME>20240214160000\n"
+    "ACCESSION NUMBER:\t\t0000000000-24-000001\n"
+    "CONFORMED SUBMISSION TYPE:\tSC 13D/A\n"
+    "PUBLIC DOCUMENT COUNT:\t\t1\n"
+    "FILED AS OF DATE:\t\t20240214\n"
+    "DATE AS OF CHANGE:\t\t20240215\n"
+    "GROUP MEMBERS:\t\tJANE DOE\n"
+    "GROUP MEMBERS:\t\tJOHN DOE\n"
+    "\n"
+    "SUBJECT COMPANY:\t\n"
+    "\n"
+    "\tCOMPANY DATA:\t\n"
+    "\t\tCOMPANY CONFORMED NAME:\t\t\tTARGET CORP\n"
+    "\t\tCENTRAL INDEX KEY:\t\t\t0000000100\n"
+    "\t\tSTANDARD INDUSTRIAL CLASSIFICATION:\tRETAIL-VARIETY STORES [5331]\n"
+    "\t\tIRS NUMBER:\t\t\t\t410215170\n"
+    "\t\tSTATE OF INCORPORATION:\t\t\tMN\n"
+    "\t\tFISCAL YEAR END:\t\t\t0201\n"
+    "\n"
+    "\tFILING VALUES:\n"
+    "\t\tFORM TYPE:\t\tSC 13D/A\n"
+    "\t\tSEC FILE NUMBER:\t005-00001\n"
+    "\t\tFILM NUMBER:\t\t24000001\n"
+    "\n"
+    "\tBUSINESS ADDRESS:\t\n"
+    "\t\tSTREET 1:\t\t1000 NICOLLET MALL\n"
+    "\t\tSTREET 2:\t\tSUITE 1\n"
+    "\t\tCITY:\t\t\tMINNEAPOLIS\n"
+    "\t\tSTATE:\t\t\tMN\n"
+    "\t\tZIP:\t\t\t55403\n"
+    "\t\tBUSINESS PHONE:\t\t612-304-6073\n"
+    "\n"
+    "\tMAIL ADDRESS:\t\n"
+    "\t\tSTREET 1:\t\tPO BOX 1\n"
+    "\t\tCITY:\t\t\tMINNEAPOLIS\n"
+    "\t\tSTATE:\t\t\tMN\n"
+    "\t\tZIP:\t\t\t55440-0001\n"
+    "\n"
+    "\tFORMER COMPANY:\t\n"
+    "\t\tFORMER CONFORMED NAME:\tDAYTON HUDSON CORP\n"
+    "\t\tDATE OF NAME CHANGE:\t19920703\n"
+    "\n"
+    "\tFORMER COMPANY:\t\n"
+    "\t\tFORMER CONFORMED NAME:\tDAYTON CORP\n"
+    "\t\tDATE OF NAME CHANGE:\t19690301\n"
+    "\n"
+    "FILED BY:\t\t\n"
+    "\n"
+    "\tCOMPANY DATA:\t\n"
+    "\t\tCOMPANY CONFORMED NAME:\t\t\tJANE DOE\n"
+    "\t\tCENTRAL INDEX KEY:\t\t\t0000000200\n"
+    "\n"
+    "\tFILING VALUES:\n"
+    "\t\tFORM TYPE:\t\tSC 13D/A\n"
+    "\n"
+    "\tMAIL ADDRESS:\t\n"
+    "\t\tSTREET 1:\t\t1 MAIN STREET\n"
+    "\t\tCITY:\t\t\tNEW YORK\n"
+    "\t\tCITY:\t\t\tBROOKLYN\n"
+    "\t\tSTATE:\t\t\tNY\n"
+    "\t\tZIP:\t\t\t10001\n"
+    "\n"
+    "FILED BY:\t\t\n"
+    "\n"
+    "\tCOMPANY DATA:\t\n"
+    "\t\tCOMPANY CONFORMED NAME:\t\t\tJOHN DOE\n"
+    "\t\tCENTRAL INDEX KEY:\t\t\t0000000300\n"
+    "\t\tSTANDARD INDUSTRIAL CLASSIFICATION:\t [0000]\n"
+    "\t\tSTATE OF INCORPORATION:\t\t\tX1\n"
+    "\n"
+    "\tBUSINESS ADDRESS:\t\n"
+    "\t\tSTREET 1:\t\t2 MAIN STREET\n"
+    "\t\tSTREET 2:\t\t\n"
+    "\t\tCITY:\t\t\tNEW YORK\n"
+    "\t\tZIP:\t\t\tN/A\n"
+    "\t\tBUSINESS PHONE:\t\tn/a\n"
+    "</SEC-HEADER>\n"
+    "<DOCUMENT>\n<TYPE>SC 13D/A\n<SEQUENCE>1\n<FILENAME>schedule.txt\n<TEXT>\n</TEXT>\n</DOCUMENT>\n</SEC-DOCUMENT>\n"
+)
+
+_HEADER_4 = (
+    "<SEC-DOCUMENT>0000000000-24-000002.txt : 20240102\n"
+    "<SEC-HEADER>0000000000-24-000002.hdr.sgml : 20240102\n"
+    "ACCESSION NUMBER:\t\t0000000000-24-000002\n"
+    "CONFORMED SUBMISSION TYPE:\t4\n"
+    "PUBLIC DOCUMENT COUNT:\t\t1\n"
+    "CONFORMED PERIOD OF REPORT:\t20231229\n"
+    "FILED AS OF DATE:\t\t20240102\n"
+    "DATE AS OF CHANGE:\t\t20240102\n"
+    "\n"
+    "REPORTING-OWNER:\t\n"
+    "\n"
+    "\tOWNER DATA:\t\n"
+    "\t\tCOMPANY CONFORMED NAME:\t\t\tDOE JANE\n"
+    "\t\tCENTRAL INDEX KEY:\t\t\t0000000400\n"
+    "\n"
+    "\tFILING VALUES:\n"
+    "\t\tFORM TYPE:\t\t4\n"
+    "\t\tSEC ACT:\t\t1934 Act\n"
+    "\t\tSEC FILE NUMBER:\t001-00001\n"
+    "\t\tFILM NUMBER:\t\t24000002\n"
+    "\n"
+    "\tMAIL ADDRESS:\t\n"
+    "\t\tSTREET 1:\t\tONE APPLE PARK WAY\n"
+    "\t\tCITY:\t\t\tCUPERTINO\n"
+    "\t\tSTATE:\t\t\tCA\n"
+    "\t\tZIP:\t\t\t95014\n"
+    "\n"
+    "REPORTING-OWNER:\t\n"
+    "\n"
+    "\tOWNER DATA:\t\n"
+    "\t\tCOMPANY CONFORMED NAME:\t\t\tDOE JOHN\n"
+    "\t\tCENTRAL INDEX KEY:\t\t\t0000000500\n"
+    "\n"
+    "\tFILING VALUES:\n"
+    "\t\tFORM TYPE:\t\t4\n"
+    "\n"
+    "ISSUER:\t\t\n"
+    "\n"
+    "\tCOMPANY DATA:\t\n"
+    "\t\tCOMPANY CONFORMED NAME:\t\t\tApple Inc.\n"
+    "\t\tCENTRAL INDEX KEY:\t\t\t0000320193\n"
+    "\t\tSTANDARD INDUSTRIAL CLASSIFICATION:\tELECTRONIC COMPUTERS [3571]\n"
+    "\t\tIRS NUMBER:\t\t\t\t942404110\n"
+    "\t\tSTATE OF INCORPORATION:\t\t\tCA\n"
+    "\t\tFISCAL YEAR END:\t\t\t0930\n"
+    "\n"
+    "\tBUSINESS ADDRESS:\t\n"
+    "\t\tSTREET 1:\t\tONE APPLE PARK WAY\n"
+    "\t\tCITY:\t\t\tCUPERTINO\n"
+    "\t\tSTATE:\t\t\tCA\n"
+    "\t\tZIP:\t\t\t95014\n"
+    "\t\tBUSINESS PHONE:\t\t(408) 996-1010\n"
+    "\n"
+    "\tMAIL ADDRESS:\t\n"
+    "\t\tSTREET 1:\t\tONE APPLE PARK WAY\n"
+    "\t\tCITY:\t\t\tCUPERTINO\n"
+    "\t\tSTATE:\t\t\tCA\n"
+    "\t\tZIP:\t\t\t95014\n"
+    "</SEC-HEADER>\n"
+    "<DOCUMENT>\n<TYPE>4\n<SEQUENCE>1\n<FILENAME>form4.xml\n<TEXT>\n</TEXT>\n</DOCUMENT>\n</SEC-DOCUMENT>\n"
+)
+
+
+def test_sec_header_entities():
+    filing = _SECFiling(file=_HEADER_13D)
+    assert (filing.accession_number, filing.submission_type, filing.document_count) == ("0000000000-24-000001", "SC 13D/A", 1)
+    assert (filing.date_filed, filing.date_of_change, filing.date_of_period, filing.effectiveness_date) == ("2024-02-14", "2024-02-15", None, None)
+    assert filing.is_amendment is True
+    assert filing._subject_company == {
+        "name": "TARGET CORP",
+        "cik": 100,
+        "sic": {"name": "RETAIL-VARIETY STORES", "code": 5331},
+        "irs_number": 410215170,
+        "state": "MN",
+        "fiscal_year_end": {"month": 2, "day": 1},
+        "business_address": {"street1": "1000 NICOLLET MALL", "street2": "SUITE 1", "city": "MINNEAPOLIS", "state": "MN", "zip": 55403, "phone": "612-304-6073"},
+        # ZIP+4 codes are not parsed as integers
+        "mail_address": {"street1": "PO BOX 1", "street2": None, "city": "MINNEAPOLIS", "state": "MN", "zip": None},
+        "former_names": [{"name": "DAYTON HUDSON CORP", "date_of_change": "1992-07-03"}, {"name": "DAYTON CORP", "date_of_change": "1969-03-01"}]
+    }
+    # entities without former names have an empty list as soon as any entity of the header has one
+    assert filing._filer == [
+        {
+            "name": "JANE DOE",
+            "cik": 200,
+            "sic": {"name": None, "code": None},
+            "irs_number": None,
+            "state": None,
+            "fiscal_year_end": None,
+            "business_address": None,
+            # the first of repeated keys is used
+            "mail_address": {"street1": "1 MAIN STREET", "street2": None, "city": "NEW YORK", "state": "NY", "zip": 10001},
+            "former_names": []
+        },
+        {
+            "name": "JOHN DOE",
+            "cik": 300,
+            "sic": {"name": None, "code": 0},
+            "irs_number": None,
+            "state": None,
+            "fiscal_year_end": None,
+            "business_address": {"street1": "2 MAIN STREET", "street2": "", "city": "NEW YORK", "state": None, "zip": None, "phone": "N/A"},
+            "mail_address": None,
+            "former_names": []
+        }
+    ]
+    assert filing._reporting_owner is None and filing._issuer is None
+    lines, _ = sec._tokenize_header(filing._header)
+    assert [value.strip() for key, value in lines if key == "GROUP MEMBERS"] == ["JANE DOE", "JOHN DOE"]
+
+
+def test_sec_header_reporting_owners():
+    filing = _SECFiling(file=_HEADER_4)
+    assert (filing.submission_type, filing.date_filed, filing.date_of_period, filing.is_amendment) == ("4", "2024-01-02", "2023-12-29", False)
+    assert filing._reporting_owner == [
+        {
+            "name": "DOE JANE",
+            "cik": 400,
+            "sic": {"name": None, "code": None},
+            "irs_number": None,
+            "state": None,
+            "fiscal_year_end": None,
+            "business_address": None,
+            "mail_address": {"street1": "ONE APPLE PARK WAY", "street2": None, "city": "CUPERTINO", "state": "CA", "zip": 95014},
+            "former_names": None
+        },
+        {
+            "name": "DOE JOHN",
+            "cik": 500,
+            "sic": {"name": None, "code": None},
+            "irs_number": None,
+            "state": None,
+            "fiscal_year_end": None,
+            "business_address": None,
+            "mail_address": None,
+            "former_names": None
+        }
+    ]
+    assert filing._issuer == {
+        "name": "Apple Inc.",
+        "cik": 320193,
+        "sic": {"name": "ELECTRONIC COMPUTERS", "code": 3571},
+        "irs_number": 942404110,
+        "state": "CA",
+        "fiscal_year_end": {"month": 9, "day": 30},
+        "business_address": {"street1": "ONE APPLE PARK WAY", "street2": None, "city": "CUPERTINO", "state": "CA", "zip": 95014, "phone": "(408) 996-1010"},
+        "mail_address": {"street1": "ONE APPLE PARK WAY", "street2": None, "city": "CUPERTINO", "state": "CA", "zip": 95014},
+        "former_names": None
+    }
+    assert filing._filer is None and filing._subject_company is None
+
+
+def test_sec_header_filers():
+    filing = _SECFiling(file=corpus.synthetic_header(filers=3))
+    assert [filer["cik"] for filer in filing._filer] == [1, 2, 3]
+    assert [filer["name"] for filer in filing._filer] == ["ENTITY 0 INC", "ENTITY 1 INC", "ENTITY 2 INC"]
+    assert filing._subject_company["cik"] == 4
+    for entity in filing._filer + [filing._subject_company]:
+        assert entity["business_address"] == {"street1": "1 MAIN STREET", "street2": None, "city": "NEW YORK", "state": "NY", "zip": 10001, "phone": "2125550100"}
+        assert entity["mail_address"] == {"street1": "1 MAIN STREET", "street2": None, "city": "NEW YORK", "state": "NY", "zip": 10001}
+        assert entity["sic"] == {"name": "SERVICES-PREPACKAGED SOFTWARE", "code": 7372}
+        assert entity["former_names"] is None
+
+
+def test_document_url(monkeypatch):
+    document = "<DOCUMENT>\n<TYPE>NPORT-P\n<SEQUENCE>1\n<FILENAME>primary_doc.xml\n<TEXT>\n</TEXT>\n</DOCUMENT>\n</SEC-DOCUMENT>\n"
+    filing = _SECFiling(file=corpus._header("SC 13G", ["FILER", "FILER", "SUBJECT COMPANY"], seed=5) + document)
+    assert filing.document_url("primary_doc.xml") == "https://www.sec.gov/Archives/edgar/data/5/000000000024000005/primary_doc.xml"
+    # FilingNPORT keeps its only filer instead of a list of filers
+    monkeypatch.setattr(FilingNPORT, "_parse_document", lambda self: None)
+    filing = FilingNPORT(file=corpus._header("NPORT-P", ["FILER"], seed=7) + corpus.synthetic_nport(holdings=5) + "</SEC-DOCUMENT>\n")
+    assert filing.document_url("NPORT-P") == "https://www.sec.gov/Archives/edgar/data/7/000000000024000007/primary_doc.xml"
+    filing = _SECFiling(file=corpus._header("SC 13G", [], seed=9) + document)
+    with pytest.raises(DatasetError):
+        filing.document_url("NPORT-P")
+
+
 class TestSECFiling:
     @classmethod
     def setup_class(cls):
@@ -80,6 +841,17 @@ class TestSECFiling:
         assert self.file.is_xml is False
         assert self.file.submission_type == "SC 13G"
     
+    def test_documents(self):
+        assert len(self.file.documents) == self.file.document_count
+        document = self.file.documents[0]
+        assert document["type"] == "SC 13G"
+        assert document["sequence"] == 1
+        assert self.file._file[document["start"]:document["end"]].startswith("<DOCUMENT>")
+        assert self.file.document("SC 13G") == self.file.document(document["filename"])
+        assert self.file.document_url("SC 13G").endswith(f"/000119312519041014/{document['filename']}")
+        with pytest.raises(ValueError):
+            self.file.document("EX-21")
+    
     def test_date_of_period(self):
         file = _SECFiling(url="https://www.sec.gov/Archives/edgar/data/320193/000032019322000063/0000320193-22-000063.txt")
         assert file.date_of_period == "2022-05-06"
@@ -300,6 +1072,14 @@ class TestFilingNPORT:
             assert isinstance(item["securities_lending"]["non_cash_collateral"], (float, NoneType))
             assert isinstance(item["securities_lending"]["loaned"], (float, NoneType))
 
+    def test_iter_investments(self):
+        # the streaming parser has to return the same holdings as the BeautifulSoup tree of the whole document
+        soup = BeautifulSoup(self.derivative_file._document, "lxml")
+        expected = [self.derivative_file._parse_investment(entry) for entry in soup.find_all("invstorsec")]
+        filing = FilingNPORT(file=self.derivative_file._file)
+        assert list(filing.iter_investments()) == expected
+        assert filing.portfolio() == expected
+
     def test_debt_security(self):
         portfolio = FilingNPORT(url="https://www.sec.gov/Archives/edgar/data/1100663/000175272422234846/0001752724-22-234846.txt").portfolio()
         portfolio = [security for security in portfolio if security["debt_information"] is not None]
@@ -0,0 +1,271 @@
+import asyncio
+from findata import utils
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+import threading
+import time
+
+pytestmark = pytest.mark.no_replay
+
+
+def test_shared_session():
+    assert utils.session() is utils.session()
+    adapter = utils.session().get_adapter("https://www.sec.gov")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter is utils.session().get_adapter("https://query1.finance.yahoo.com")
+    assert "gzip" in utils.session().headers["Accept-Encoding"]
+
+
+def test_configure_transport():
+    pool_connections, pool_maxsize = utils.POOL_CONNECTIONS, utils.POOL_MAXSIZE
+    old_session = utils.session()
+    try:
+        utils.configure_transport(pool_connections=4, pool_maxsize=2)
+        new_session = utils.session()
+        assert new_session is not old_session
+        adapter = new_session.get_adapter("https://www.sec.gov")
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 2
+    finally:
+        utils.configure_transport(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits = []
+
+    def do_GET(self):
+        self.hits.append(self.path)
+        if self.path.startswith("/status/"):
+            # /status/<code>/<number of failing requests>
+            _, _, code, failures = self.path.split("/")
+            if self.hits.count(self.path) <= int(failures):
+                self.send_response(int(code))
+                self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+        etag = f'"{self.path}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = f"body of {self.path}".encode() * 10
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    _Handler.hits.clear()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = utils.enable_cache(directory=tmp_path)
+    yield cache
+    utils.disable_cache()
+
+
+def test_cache(server, cache):
+    response = utils.get(f"{server}/a", params={"x": 1}, ttl=60)
+    assert response.from_cache is False
+    response = utils.get(f"{server}/a", params={"x": 1}, ttl=60)
+    assert response.from_cache is True
+    assert response.text == "body of /a?x=1" * 10
+    assert _Handler.hits == ["/a?x=1"]
+
+    # different query parameters and requests without ttl are not served from the cache
+    utils.get(f"{server}/a", params={"x": 2}, ttl=60)
+    utils.get(f"{server}/a", params={"x": 1})
+    assert len(_Handler.hits) == 3
+
+
+def test_cache_revalidation(server, cache):
+    utils.get(f"{server}/b", ttl=0)
+    response = utils.get(f"{server}/b", ttl=0)
+    assert response.from_cache is True
+    assert response.status_code == 200
+    assert response.text == "body of /b" * 10
+    assert _Handler.hits == ["/b", "/b"]
+
+
+def test_cache_eviction(server, tmp_path):
+    cache = utils.enable_cache(directory=tmp_path, max_size=250)
+    try:
+        for path in ("/c", "/d", "/e"):
+            utils.get(f"{server}{path}", ttl=60)
+            time.sleep(0.01)
+        assert len(list(tmp_path.glob("*/*.body"))) == 2
+        utils.get(f"{server}/c", ttl=60)
+        assert _Handler.hits == ["/c", "/d", "/e", "/c"]
+    finally:
+        utils.disable_cache()
+
+
+def test_rate_limiter():
+    limiter = utils.RateLimiter(rate=20, burst=2)
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    assert 0.04 < limiter.reserve() <= 0.05
+    assert 0.09 < limiter.reserve() <= 0.1
+
+    start = time.monotonic()
+    limiter = utils.RateLimiter(rate=50, burst=1)
+    for _ in range(6):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.09
+
+
+def test_rate_limiter_cross_process(tmp_path):
+    first = utils.RateLimiter(rate=10, cross_process=True, path=tmp_path / "host.lock")
+    second = utils.RateLimiter(rate=10, cross_process=True, path=tmp_path / "host.lock")
+    for _ in range(10):
+        assert first.reserve() == 0
+    assert second.reserve() > 0
+
+
+def test_rate_limit_hosts():
+    sec_limiter = utils.rate_limiter("https://www.sec.gov/cgi-bin/browse-edgar")
+    assert sec_limiter.rate == 10
+    assert utils.rate_limiter("https://efts.sec.gov/LATEST/search-index") is sec_limiter
+    assert utils.rate_limiter("https://data.sec.gov/submissions/CIK0000320193.json") is sec_limiter
+    assert utils.rate_limiter("https://finviz.com/quote.ashx?t=AAPL") is None
+
+    utils.set_rate_limit("finviz.com", 2)
+    try:
+        assert utils.rate_limiter("https://finviz.com/quote.ashx?t=AAPL").rate == 2
+    finally:
+        utils.set_rate_limit("finviz.com", None)
+    assert utils.rate_limiter("https://finviz.com/quote.ashx?t=AAPL") is None
+
+
+def test_retries(server, monkeypatch):
+    monkeypatch.setattr(utils, "RETRY_BACKOFF", 0.01)
+    response = utils.get(f"{server}/status/503/2")
+    assert response.status_code == 200
+    assert _Handler.hits == ["/status/503/2"] * 3
+
+    response = utils.get(f"{server}/status/429/10")
+    assert response.status_code == 429
+    assert len(_Handler.hits) == 3 + utils.RETRY_ATTEMPTS
+
+    response = utils.get(f"{server}/status/404/10")
+    assert response.status_code == 404
+    assert len(_Handler.hits) == 4 + utils.RETRY_ATTEMPTS
+
+
+def test_backoff(monkeypatch):
+    monkeypatch.setattr(utils, "RETRY_BACKOFF", 1)
+    monkeypatch.setattr(utils, "RETRY_MAX_BACKOFF", 8)
+    assert 0.5 <= utils.backoff(0) <= 1
+    assert 2 <= utils.backoff(2) <= 4
+    assert 4 <= utils.backoff(10) <= 8
+    assert utils.backoff(0, retry_after=3) == 3
+    assert utils.backoff(0, retry_after=30) == 8
+
+
+def test_is_rate_limited():
+    response = requests.Response()
+    response.status_code = 200
+    response.url = "https://finviz.com/quote.ashx?t=AAPL"
+    response._content = b"<html>This IP address has performed an unusual high number of requests and has been temporarily rate limited.</html>"
+    assert utils.is_rate_limited(response)
+    response.url = "https://www.sec.gov/cgi-bin/browse-edgar"
+    assert not utils.is_rate_limited(response)
+    response._content = b"<h1>Your Request Originates from an Undeclared Automated Tool</h1><p>Request Rate Threshold Exceeded</p>"
+    assert utils.is_rate_limited(response)
+
+
+def test_async_get(server, cache, monkeypatch):
+    pytest.importorskip("aiohttp")
+    monkeypatch.setattr(utils, "RETRY_BACKOFF", 0.01)
+
+    async def fetch():
+        try:
+            first = await utils.async_get(f"{server}/f", params={"x": 1}, ttl=60)
+            second = await utils.async_get(f"{server}/f", params={"x": 1}, ttl=60)
+            retried = await utils.async_get(f"{server}/status/503/1")
+        finally:
+            await utils.close_async_session()
+        return first, second, retried
+
+    first, second, retried = asyncio.run(fetch())
+    assert isinstance(first, requests.Response)
+    assert first.from_cache is False
+    assert second.from_cache is True
+    assert first.text == second.text == "body of /f?x=1" * 10
+    assert retried.status_code == 200
+    assert _Handler.hits == ["/f?x=1", "/status/503/1", "/status/503/1"]
+
+
+def test_fixture_store(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, "RETRY_BACKOFF", 0.01)
+    utils.enable_fixtures(tmp_path, mode="record")
+    try:
+        recorded = utils.get(f"{server}/g", params={"x": 1})
+        utils.get(f"{server}/status/503/10")
+        assert _Handler.hits[0] == "/g?x=1"
+
+        utils.enable_fixtures(tmp_path, mode="replay")
+        replayed = utils.get(f"{server}/g", params={"x": 1})
+        assert replayed.from_fixture is True
+        assert replayed.text == recorded.text
+        assert replayed.headers["ETag"] == recorded.headers["ETag"]
+        with pytest.raises(utils.FixtureError):
+            utils.get(f"{server}/status/503/10") # failed responses are not recorded
+        with pytest.raises(utils.FixtureError):
+            utils.get(f"{server}/g", params={"x": 2})
+
+        hits = len(_Handler.hits)
+        utils.enable_fixtures(tmp_path, mode="once")
+        utils.get(f"{server}/g", params={"x": 1})
+        utils.get(f"{server}/g", params={"x": 2})
+        utils.get(f"{server}/g", params={"x": 2})
+        assert _Handler.hits[hits:] == ["/g?x=2"]
+    finally:
+        utils.disable_fixtures()
+
+
+def test_hooks(server, cache):
+    events = []
+    metrics = utils.Metrics()
+    utils.add_hook(events.append)
+    utils.add_hook(metrics)
+    try:
+        utils.get(f"{server}/h/0000320193/0001193125-19-041014.txt", params={"x": 1}, ttl=60)
+        utils.get(f"{server}/h/0000320193/0001193125-19-041014.txt", params={"x": 1}, ttl=60)
+        utils.get(f"{server}/status/404/10")
+
+        @utils.instrumented
+        def parse(text):
+            return text.upper()
+        assert parse("a") == "A"
+    finally:
+        utils.remove_hook(events.append)
+        utils.remove_hook(metrics)
+
+    miss, hit, not_found, parsed = events
+    assert miss["type"] == "request"
+    assert miss["url_template"] == f"{server}/h/{{}}/{{}}.txt"
+    assert miss["cache"] == "miss" and hit["cache"] == "hit" and not_found["cache"] is None
+    assert miss["bytes"] == hit["bytes"] == len(f"body of /h/0000320193/0001193125-19-041014.txt?x=1") * 10
+    assert miss["attempts"] == 1 and miss["ttfb"] > 0 and miss["total_time"] >= miss["ttfb"]
+    assert parsed["type"] == "parse" and parsed["name"] == "test_hooks.<locals>.parse" and parsed["error"] is None
+
+    host = metrics.requests["127.0.0.1"]
+    assert host["count"] == 3 and host["hits"] == 1 and host["misses"] == 1 and host["errors"] == 1
+    assert metrics.parsing["test_hooks.<locals>.parse"]["count"] == 1
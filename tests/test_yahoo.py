@@ -2,7 +2,9 @@ import numpy as np
 import pandas as pd
 import datetime as dt
 import pytest
-from findata import YahooReader
+import time
+from types import SimpleNamespace
+from findata import utils, YahooReader
 
 NoneType = type(None)
 
@@ -24,6 +26,18 @@ class TestClassMethods:
     
     def test_get_ticker(self):
         assert self.reader.get_ticker("JP3633400001") == "7203.T"
+
+    def test_get_ticker_rate_limited(self, monkeypatch):
+        # the first lookup and the first probe are rate limited, the repeated lookup then finds the ticker
+        urls = iter([
+            "https://finance.yahoo.com/lookup",
+            "https://finance.yahoo.com/lookup",
+            "https://finance.yahoo.com/quote/AAPL?.tsrc=fin-srch",
+            "https://finance.yahoo.com/quote/7203.T?.tsrc=fin-srch"
+        ])
+        monkeypatch.setattr(utils, "get", lambda url, **kwargs: SimpleNamespace(url=next(urls)))
+        monkeypatch.setattr(time, "sleep", lambda seconds: None)
+        assert self.reader.get_ticker("JP3633400001") == "7203.T"
     
 
 class TestEquity: